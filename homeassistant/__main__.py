@@ -104,6 +104,31 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--compact-states",
+        action="store_true",
+        help="Store states compactly to reduce memory use on large installations",
+    )
+    parser.add_argument(
+        "--lazy-platforms",
+        action="store_true",
+        help="Import integration platforms only when they are first needed",
+    )
+    parser.add_argument(
+        "--parallel-imports",
+        action="store_true",
+        help="Import the integrations to set up in parallel at startup",
+    )
+    parser.add_argument(
+        "--timer-wheel",
+        action="store_true",
+        help="Schedule helper timers on a timer wheel to keep the event loop fast",
+    )
+    parser.add_argument(
+        "--trace-startup",
+        action="store_true",
+        help="Trace the startup to find the setups that delay it",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -201,6 +226,11 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        compact_states=args.compact_states,
+        lazy_platforms=args.lazy_platforms,
+        parallel_imports=args.parallel_imports,
+        timer_wheel=args.timer_wheel,
+        trace_startup=args.trace_startup,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
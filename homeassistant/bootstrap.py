@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict
 import contextlib
+from datetime import timedelta
 from functools import partial
 from itertools import chain
 import logging
@@ -16,11 +17,12 @@ import platform
 import sys
 import threading
 from time import monotonic
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 # Import cryptography early since import openssl is not thread-safe
 # _frozen_importlib._DeadlockError: deadlock detected by _ModuleLock('cryptography.hazmat.backends.openssl.backend')
 import cryptography.hazmat.backends.openssl.backend  # noqa: F401
+import psutil_home_assistant as ha_psutil
 import voluptuous as vol
 import yarl
 
@@ -75,6 +77,7 @@ from .core_config import async_process_ha_core_config
 from .exceptions import HomeAssistantError
 from .helpers import (
     area_registry,
+    boot_snapshot,
     category_registry,
     condition,
     config_validation as cv,
@@ -88,10 +91,14 @@ from .helpers import (
     recorder,
     restore_state,
     template,
+    template_bytecode_cache,
     translation,
     trigger,
 )
+from .helpers.boot_snapshot import DATA_BOOT_SNAPSHOT
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.event import async_enable_timer_wheel, async_track_time_interval
+from .helpers.start import async_at_started
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
@@ -105,12 +112,15 @@ from .setup import (
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
+    async_set_startup_timing,
     async_setup_component,
+    async_start_startup_trace,
 )
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_docker_env, is_virtual_env
+from .util.startup_trace import CATEGORY_BOOTSTRAP, DATA_STARTUP_TRACER, trace_span
 from .util.system_info import is_official_image
 
 with contextlib.suppress(ImportError):
@@ -136,6 +146,13 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 # hass.data key for logging information.
 DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
 
+# Names of the bootstrap timings reported by async_get_setup_timings
+TIMING_RESOLVE_INTEGRATIONS = "bootstrap:resolve_integrations"
+TIMING_RESOLVE_INTEGRATIONS_WITHOUT_SNAPSHOT = (
+    "bootstrap:resolve_integrations_without_snapshot"
+)
+TIMING_IMPORT_PREFIX = "import:"
+
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 
@@ -145,6 +162,12 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+# How often the available memory is checked in compact mode
+COMPACT_STATES_MEMORY_CHECK_INTERVAL = timedelta(minutes=1)
+# The cached serializations of states are dropped in compact mode
+# when less memory than this is available
+COMPACT_STATES_MIN_AVAILABLE_MEMORY = 512 * 1024**2
+
 # Core integrations are unconditionally loaded
 CORE_INTEGRATIONS = {"homeassistant", "persistent_notification"}
 
@@ -295,6 +318,17 @@ async def async_setup_hass(
             hass.config.debug = True
 
         hass.config.safe_mode = runtime_config.safe_mode
+        if runtime_config.compact_states:
+            hass.states.async_enable_compact_mode()
+            async_drop_state_caches_on_low_memory(hass)
+        if runtime_config.lazy_platforms:
+            loader.async_enable_lazy_platforms(hass)
+        if runtime_config.parallel_imports:
+            loader.async_enable_parallel_imports(hass)
+        if runtime_config.timer_wheel:
+            async_enable_timer_wheel(hass)
+        if runtime_config.trace_startup:
+            async_start_startup_trace(hass)
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
 
@@ -393,6 +427,47 @@ async def async_setup_hass(
     return hass
 
 
+@core.callback
+def async_drop_state_caches_on_low_memory(hass: core.HomeAssistant) -> None:
+    """Drop the cached serializations of all states when memory is low.
+
+    Startup serializes every state, so the caches are dropped once
+    Home Assistant has started. After that the available memory is
+    checked every COMPACT_STATES_MEMORY_CHECK_INTERVAL and the caches
+    are dropped when less than COMPACT_STATES_MIN_AVAILABLE_MEMORY
+    is available.
+    """
+    psutil_wrapper: ha_psutil.PsutilWrapper | None = None
+
+    def _available_memory() -> int:
+        """Return the available memory in bytes."""
+        nonlocal psutil_wrapper
+        if psutil_wrapper is None:
+            psutil_wrapper = ha_psutil.PsutilWrapper()
+        return cast(int, psutil_wrapper.psutil.virtual_memory().available)
+
+    async def _async_check_memory(*_: Any) -> None:
+        if (
+            await hass.async_add_executor_job(_available_memory)
+            < COMPACT_STATES_MIN_AVAILABLE_MEMORY
+        ):
+            _LOGGER.debug("Dropping the cached serializations of states")
+            hass.states.async_drop_caches()
+
+    @core.callback
+    def _async_started(hass: core.HomeAssistant) -> None:
+        hass.states.async_drop_caches()
+        async_track_time_interval(
+            hass,
+            _async_check_memory,
+            COMPACT_STATES_MEMORY_CHECK_INTERVAL,
+            name="drop state caches on low memory",
+            cancel_on_shutdown=True,
+        )
+
+    async_at_started(hass, _async_started)
+
+
 def open_hass_ui(hass: core.HomeAssistant) -> None:
     """Open the UI."""
     import webbrowser  # noqa: PLC0415
@@ -450,6 +525,8 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template_bytecode_cache.async_setup(hass)),
+        create_eager_task(boot_snapshot.async_setup(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -795,10 +872,8 @@ async def _async_resolve_domains_and_preload(
     # their dependencies and after dependencies.
     # To gather all the requirements we must ignore exceptions here.
     # The exceptions will be detected and handled later in the bootstrap process.
-    integrations_after_dependencies = (
-        await loader.resolve_integrations_after_dependencies(
-            hass, integrations_to_process.values(), ignore_exceptions=True
-        )
+    integrations_after_dependencies = await _async_resolve_after_dependencies(
+        hass, "preload", integrations_to_process, None, ignore_exceptions=True
     )
     integrations_requirements = {
         domain: itg.requirements for domain, itg in integrations_to_process.items()
@@ -850,6 +925,74 @@ async def _async_resolve_domains_and_preload(
     return integrations_to_setup, all_integrations_to_setup
 
 
+async def _async_resolve_after_dependencies(
+    hass: core.HomeAssistant,
+    name: str,
+    integrations: dict[str, Integration],
+    possible_after_dependencies: set[str] | None,
+    *,
+    ignore_exceptions: bool = False,
+) -> dict[str, set[str]]:
+    """Resolve the after dependencies, using the boot snapshot if unchanged."""
+    snapshot = hass.data.get(DATA_BOOT_SNAPSHOT)
+    if (
+        snapshot is not None
+        and (cached := snapshot.async_get_after_dependencies(name, integrations))
+        is not None
+    ):
+        return cached
+    integrations_after_dependencies = (
+        await loader.resolve_integrations_after_dependencies(
+            hass,
+            integrations.values(),
+            possible_after_dependencies,
+            ignore_exceptions=ignore_exceptions,
+        )
+    )
+    if snapshot is not None:
+        snapshot.async_set_after_dependencies(
+            name, integrations, integrations_after_dependencies
+        )
+    return integrations_after_dependencies
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    integrations: dict[str, Integration],
+    integrations_after_dependencies: dict[str, set[str]],
+) -> None:
+    """Import the integrations to set up with the import scheduler.
+
+    Stage 1 integrations are not preimported. The other integrations are
+    only preimported when the requirements of all integrations to set up
+    are installed, so no module is imported before its requirements are
+    updated.
+    """
+    if not hass.config.skip_pip:
+        all_requirements = {
+            req for itg in integrations.values() for req in itg.requirements
+        }
+        await requirements.async_load_installed_versions(hass, all_requirements)
+        if missing := all_requirements - requirements.async_get_installed_requirements(
+            hass
+        ):
+            _LOGGER.debug("Not preimporting integrations, missing %s", missing)
+            return
+    import_times = await loader.async_import_integrations(
+        hass,
+        {
+            domain: itg
+            for domain, itg in integrations.items()
+            if domain not in STAGE_1_INTEGRATIONS
+        },
+        integrations_after_dependencies,
+    )
+    # The imports overlap the setups waiting for them, so they are
+    # reported apart from the setup times
+    for domain, import_time in import_times.items():
+        async_set_startup_timing(hass, f"{TIMING_IMPORT_PREFIX}{domain}", import_time)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -857,15 +1000,26 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
-    integrations, all_integrations = await _async_resolve_domains_and_preload(
-        hass, config
-    )
-    # Detect all cycles
-    integrations_after_dependencies = (
-        await loader.resolve_integrations_after_dependencies(
-            hass, all_integrations.values(), set(all_integrations)
+    tracer = hass.data.get(DATA_STARTUP_TRACER)
+    started = monotonic()
+    with trace_span(tracer, "resolve integrations", CATEGORY_BOOTSTRAP):
+        integrations, all_integrations = await _async_resolve_domains_and_preload(
+            hass, config
+        )
+        # Detect all cycles
+        integrations_after_dependencies = await _async_resolve_after_dependencies(
+            hass, "setup", all_integrations, set(all_integrations)
+        )
+    # The resolve time is not the setup time of an integration, so it is
+    # kept apart from the setup times of the integrations
+    resolve_time = monotonic() - started
+    async_set_startup_timing(hass, TIMING_RESOLVE_INTEGRATIONS, resolve_time)
+    if (snapshot := hass.data.get(DATA_BOOT_SNAPSHOT)) is not None and (
+        cold_resolve_time := snapshot.async_set_resolve_time(resolve_time)
+    ) is not None:
+        async_set_startup_timing(
+            hass, TIMING_RESOLVE_INTEGRATIONS_WITHOUT_SNAPSHOT, cold_resolve_time
         )
-    )
     all_domains = set(integrations_after_dependencies)
     domains = set(integrations) & all_domains
 
@@ -877,6 +1031,18 @@ async def _async_set_up_integrations(
 
     async_set_domains_to_be_loaded(hass, all_domains)
 
+    # Import the integrations in parallel ahead of their setup
+    if hass.data.get(loader.DATA_PARALLEL_IMPORTS):
+        hass.async_create_background_task(
+            _async_preimport_integrations(
+                hass,
+                {domain: all_integrations[domain] for domain in all_domains},
+                integrations_after_dependencies,
+            ),
+            "preimport integrations",
+            eager_start=True,
+        )
+
     # Initialize recorder
     if "recorder" in all_domains:
         recorder.async_initialize_recorder(hass)
@@ -921,22 +1087,23 @@ async def _async_set_up_integrations(
             stage_dep_domains_unfiltered - stage_dep_domains,
         )
 
-        if timeout is None:
-            await _async_setup_multi_components(hass, stage_all_domains, config)
-            continue
-        try:
-            async with hass.timeout.async_timeout(
-                timeout,
-                cool_down=COOLDOWN_TIME,
-                cancel_message=f"Bootstrap stage {name} timeout",
-            ):
+        with trace_span(tracer, f"stage {name}", CATEGORY_BOOTSTRAP):
+            if timeout is None:
                 await _async_setup_multi_components(hass, stage_all_domains, config)
-        except TimeoutError:
-            _LOGGER.warning(
-                "Setup timed out for stage %s waiting on %s - moving forward",
-                name,
-                hass._active_tasks,  # noqa: SLF001
-            )
+                continue
+            try:
+                async with hass.timeout.async_timeout(
+                    timeout,
+                    cool_down=COOLDOWN_TIME,
+                    cancel_message=f"Bootstrap stage {name} timeout",
+                ):
+                    await _async_setup_multi_components(hass, stage_all_domains, config)
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Setup timed out for stage %s waiting on %s - moving forward",
+                    name,
+                    hass._active_tasks,  # noqa: SLF001
+                )
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -21,13 +21,38 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
 from . import websocket_api
-from .const import DOMAIN
+from .const import (
+    CONF_HOT_CACHE,
+    CONF_MAX_STATES,
+    CONF_MAX_STATES_PER_ENTITY,
+    CONF_WINDOW,
+    DATA_HOT_CACHE,
+    DEFAULT_HOT_CACHE_MAX_STATES,
+    DEFAULT_HOT_CACHE_MAX_STATES_PER_ENTITY,
+    DEFAULT_HOT_CACHE_WINDOW,
+    DOMAIN,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
+from .hot_cache import HistoryHotCache
 
 CONF_ORDER = "use_include_order"
 
 _ONE_DAY = timedelta(days=1)
 
+HOT_CACHE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_WINDOW, default=DEFAULT_HOT_CACHE_WINDOW
+        ): cv.positive_time_period,
+        vol.Optional(
+            CONF_MAX_STATES, default=DEFAULT_HOT_CACHE_MAX_STATES
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_MAX_STATES_PER_ENTITY, default=DEFAULT_HOT_CACHE_MAX_STATES_PER_ENTITY
+        ): cv.positive_int,
+    }
+)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -35,7 +60,10 @@ CONFIG_SCHEMA = vol.Schema(
             cv.deprecated(CONF_EXCLUDE),
             cv.deprecated(CONF_ORDER),
             INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
-                {vol.Optional(CONF_ORDER, default=False): cv.boolean}
+                {
+                    vol.Optional(CONF_ORDER, default=False): cv.boolean,
+                    vol.Optional(CONF_HOT_CACHE): HOT_CACHE_SCHEMA,
+                }
             ),
         )
     },
@@ -45,6 +73,14 @@ CONFIG_SCHEMA = vol.Schema(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the history hooks."""
+    if (hot_cache_conf := (config.get(DOMAIN) or {}).get(CONF_HOT_CACHE)) is not None:
+        hot_cache = hass.data[DATA_HOT_CACHE] = HistoryHotCache(
+            hass,
+            hot_cache_conf[CONF_WINDOW],
+            hot_cache_conf[CONF_MAX_STATES],
+            hot_cache_conf[CONF_MAX_STATES_PER_ENTITY],
+        )
+        hot_cache.async_setup()
     hass.http.register_view(HistoryPeriodView())
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_setup(hass)
@@ -123,7 +159,7 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await get_instance(hass).async_add_executor_job(
+            await get_instance(hass).async_add_read_executor_job(
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
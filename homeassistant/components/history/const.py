@@ -1,7 +1,33 @@
 """History integration constants."""
 
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.util.hass_dict import HassKey
+
+if TYPE_CHECKING:
+    from .hot_cache import HistoryHotCache
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+# The number of messages that may wait to be sent to the client
+# before the next history chunk is fetched
+MAX_PENDING_HISTORY_MESSAGES = 2
+# How long to wait for the client to receive the pending messages
+HISTORY_CHUNK_SEND_TIMEOUT = 60
+
+CONF_HOT_CACHE = "hot_cache"
+CONF_MAX_STATES = "max_states"
+CONF_MAX_STATES_PER_ENTITY = "max_states_per_entity"
+CONF_WINDOW = "window"
+
+DEFAULT_HOT_CACHE_WINDOW = timedelta(hours=1)
+DEFAULT_HOT_CACHE_MAX_STATES = 20000
+DEFAULT_HOT_CACHE_MAX_STATES_PER_ENTITY = 1024
+
+DATA_HOT_CACHE: HassKey[HistoryHotCache] = HassKey(f"{DOMAIN}_hot_cache")
@@ -0,0 +1,290 @@
+"""In-memory cache of recent states for the history integration.
+
+The cache keeps a bounded ring buffer of the states of each recorded
+entity, populated from state_changed events, so history queries over a
+recent period can be answered without querying the database.
+
+An entity can only be answered from the cache when the cache has seen
+every state of it since the start of the query, which is the case when
+the oldest state in its buffer was last updated before the start time.
+Entities that are not covered are queried from the database and the
+results are merged. Only the states the recorder has committed to the
+database are served so the results match the database.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from datetime import datetime as dt, timedelta
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.history import (
+    NEED_ATTRIBUTE_DOMAINS,
+    SIGNIFICANT_DOMAINS,
+)
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util import dt as dt_util
+
+
+class HistoryHotCache:
+    """Cache the recent states of recorded entities."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: timedelta,
+        max_states: int,
+        max_states_per_entity: int,
+    ) -> None:
+        """Initialize the cache.
+
+        States older than window are dropped, except for the newest of
+        them which is needed for the state at the start of a query. When
+        more than max_states states are cached, the least recently used
+        entities are evicted.
+        """
+        self.hass = hass
+        self._instance = get_instance(hass)
+        self._window_seconds = window.total_seconds()
+        self._max_states = max_states
+        self._max_states_per_entity = max_states_per_entity
+        self._entities: OrderedDict[str, deque[State]] = OrderedDict()
+        self._size = 0
+        self._tracking_since = dt_util.utcnow().timestamp()
+        self._unsub: CALLBACK_TYPE | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+    @property
+    def size(self) -> int:
+        """Return the number of cached states."""
+        return self._size
+
+    @callback
+    def async_setup(self) -> None:
+        """Start populating the cache from state_changed events."""
+        self._unsub = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed
+        )
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_stop
+        )
+
+    @callback
+    def _async_stop(self, event: Event) -> None:
+        """Shut down the cache when Home Assistant stops."""
+        self._unsub_stop = None
+        self.async_shutdown()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop populating the cache and drop all states."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        if self._unsub_stop:
+            self._unsub_stop()
+            self._unsub_stop = None
+        self.async_clear()
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all cached states."""
+        self._entities.clear()
+        self._size = 0
+        self._tracking_since = dt_util.utcnow().timestamp()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add the new state of an entity to the cache."""
+        instance = self._instance
+        if not instance.enabled or EVENT_STATE_CHANGED in instance.exclude_event_types:
+            # The recorder is not writing states so the database
+            # will not contain the states we would cache.
+            if self._entities:
+                self.async_clear()
+            return
+        entity_id = event.data["entity_id"]
+        entities = self._entities
+        if (new_state := event.data["new_state"]) is None:
+            # Removed entities are recorded as a state of None
+            # which the compressed format cannot represent.
+            if (states := entities.pop(entity_id, None)) is not None:
+                self._size -= len(states)
+            return
+        if (entity_filter := instance.entity_filter) is not None and not entity_filter(
+            entity_id
+        ):
+            return
+        if (states := entities.get(entity_id)) is None:
+            states = entities[entity_id] = deque(maxlen=self._max_states_per_entity)
+            # The old state can only be trusted to be recorded if it was
+            # set while we were tracking.
+            if (
+                old_state := event.data["old_state"]
+            ) is not None and old_state.last_updated_timestamp >= self._tracking_since:
+                states.append(old_state)
+                self._size += 1
+        else:
+            entities.move_to_end(entity_id)
+        if len(states) == self._max_states_per_entity:
+            self._size -= 1
+        states.append(new_state)
+        self._size += 1
+        self._trim(states, new_state.last_updated_timestamp - self._window_seconds)
+        while self._size > self._max_states and len(entities) > 1:
+            self._size -= len(entities.popitem(last=False)[1])
+
+    def _trim(self, states: deque[State], cutoff_ts: float) -> None:
+        """Drop the states that are no longer needed for the window."""
+        while len(states) > 1 and states[1].last_updated_timestamp <= cutoff_ts:
+            states.popleft()
+            self._size -= 1
+
+    @callback
+    def async_get_significant_states(
+        self,
+        start_time: dt,
+        end_time: dt | None,
+        entity_ids: Iterable[str],
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> tuple[dict[str, list[dict[str, Any]]], list[str]]:
+        """Return the compressed states of the covered entities.
+
+        The result matches what get_significant_states returns with the
+        compressed state format. The entity_ids that are not covered by
+        the cache are returned so they can be queried from the database.
+        """
+        start_time_ts = start_time.timestamp()
+        end_time_ts = end_time.timestamp() if end_time else None
+        if include_start_time_state:
+            # Match the database query, which only looks for a start
+            # time state when there are states older than start_time.
+            oldest_ts = self._instance.states_manager.oldest_ts
+            include_start_time_state = (
+                oldest_ts is not None and oldest_ts < start_time_ts
+            )
+        include_last_changed = not significant_changes_only
+        committed_ts = self._instance.committed_state_changed_ts
+        result: dict[str, list[dict[str, Any]]] = {}
+        not_covered: list[str] = []
+        entities = self._entities
+        for entity_id in entity_ids:
+            if (
+                (states := entities.get(entity_id)) is None
+                or (oldest_ts := states[0].last_updated_timestamp) >= start_time_ts
+                or oldest_ts > committed_ts
+            ):
+                not_covered.append(entity_id)
+                continue
+            entities.move_to_end(entity_id)
+            domain = states[0].domain
+            significant_domain = domain in SIGNIFICANT_DOMAINS
+            start_state: State | None = None
+            rows: list[State] = []
+            for state in states:
+                if (last_updated_ts := state.last_updated_timestamp) > committed_ts:
+                    # Not yet in the database
+                    break
+                if last_updated_ts < start_time_ts:
+                    start_state = state
+                    continue
+                if end_time_ts and last_updated_ts >= end_time_ts:
+                    break
+                if last_updated_ts == start_time_ts or (
+                    significant_changes_only
+                    and not significant_domain
+                    and state.last_changed != state.last_updated
+                ):
+                    continue
+                rows.append(state)
+            if include_start_time_state and start_state is not None:
+                rows.insert(0, start_state)
+            else:
+                start_state = None
+            if not rows:
+                continue
+            if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+                result[entity_id] = [
+                    _compressed_state(
+                        state,
+                        start_time_ts if state is start_state else None,
+                        include_last_changed,
+                        False,
+                        no_attributes,
+                    )
+                    for state in rows
+                ]
+                continue
+            first_state = rows[0]
+            prev_state = first_state.state
+            ent_results = result[entity_id] = [
+                _compressed_state(
+                    first_state,
+                    start_time_ts if first_state is start_state else None,
+                    include_last_changed,
+                    no_attributes,
+                    no_attributes,
+                )
+            ]
+            # With minimal response we do not care about attribute
+            # changes so we can filter out duplicate states
+            ent_results.extend(
+                [
+                    {
+                        COMPRESSED_STATE_STATE: (prev_state := state.state),
+                        COMPRESSED_STATE_LAST_UPDATED: state.last_updated_timestamp,
+                    }
+                    for state in rows[1:]
+                    if state.state != prev_state
+                ]
+            )
+        return result, not_covered
+
+
+def _compressed_state(
+    state: State,
+    start_time_ts: float | None,
+    include_last_changed: bool,
+    omit_attributes: bool,
+    no_attributes: bool,
+) -> dict[str, Any]:
+    """Convert a state to the compressed format used by the database query.
+
+    When start_time_ts is set the state is the state at the start time,
+    which is reported as updated at the start time.
+    """
+    comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state.state}
+    if not omit_attributes:
+        comp_state[COMPRESSED_STATE_ATTRIBUTES] = (
+            {}
+            if no_attributes
+            else StateAttributes.recorded_attributes_from_state(state)
+        )
+    if start_time_ts is not None:
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = start_time_ts
+        return comp_state
+    comp_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated_timestamp
+    if include_last_changed and state.last_changed != state.last_updated:
+        comp_state[COMPRESSED_STATE_LAST_CHANGED] = state.last_changed_timestamp
+    return comp_state
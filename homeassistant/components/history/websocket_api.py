@@ -7,6 +7,7 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
+import threading
 from typing import Any, cast
 
 import voluptuous as vol
@@ -30,6 +31,7 @@ from homeassistant.core import (
     is_callback,
     valid_entity_id,
 )
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
     async_track_state_change_event,
@@ -38,7 +40,13 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    DATA_HOT_CACHE,
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_SEND_TIMEOUT,
+    MAX_PENDING_HISTORY_MESSAGES,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,25 +80,139 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    cached_states: dict[str, list[dict[str, Any]]] | None = None,
+    all_entity_ids: list[str] | None = None,
 ) -> bytes:
-    """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
+    """Fetch history significant_states and convert them to json in the executor.
+
+    When cached_states is passed, entity_ids are the entities that
+    were not covered by the hot cache and the result is merged with
+    cached_states in the order of all_entity_ids.
+    """
+    states: dict[str, list[Any]] = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    if cached_states and all_entity_ids:
+        states = {
+            entity_id: entity_states
+            for entity_id in all_entity_ids
+            if (entity_states := cached_states.get(entity_id) or states.get(entity_id))
+        }
+    return json_bytes(messages.result_message(msg_id, states))
+
+
+def _ws_send_significant_states_in_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    cancel: threading.Event,
+) -> None:
+    """Fetch history significant_states and send them in chunks from the executor.
+
+    The next chunk is only fetched once at most MAX_PENDING_HISTORY_MESSAGES
+    messages wait to be sent to the client, so a large history is not
+    queued faster than the client receives it.
+    """
+    loop = hass.loop
+    for states in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+    ):
+        if cancel.is_set():
+            return
+        loop.call_soon_threadsafe(
+            connection.send_message, _generate_chunk_message(msg_id, states)
+        )
+        # The message is queued before the wait starts since the
+        # callbacks run in the order they were scheduled
+        future = asyncio.run_coroutine_threadsafe(
+            connection.async_wait_for_pending_messages(MAX_PENDING_HISTORY_MESSAGES),
+            loop,
+        )
+        try:
+            future.result(HISTORY_CHUNK_SEND_TIMEOUT)
+        except TimeoutError:
+            future.cancel()
+            raise HomeAssistantError(
+                "Timed out waiting for the client to receive the history"
+            ) from None
+
+
+def _generate_chunk_message(
+    msg_id: int, states: dict[str, list[dict[str, Any]]]
+) -> bytes:
+    """Generate a history chunk message."""
+    return json_bytes(messages.event_message(msg_id, {"states": states}))
+
+
+async def _async_send_significant_states_in_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    cached_states: dict[str, list[dict[str, Any]]],
+) -> None:
+    """Send history significant_states as chunk events followed by the result.
+
+    The states of an entity can be split over multiple chunks.
+    """
+    if cached_states:
+        connection.send_message(_generate_chunk_message(msg_id, cached_states))
+    if entity_ids:
+        cancel = threading.Event()
+        connection.subscriptions[msg_id] = cancel.set
+        try:
+            await get_instance(hass).async_add_read_executor_job(
+                _ws_send_significant_states_in_chunks,
                 hass,
+                connection,
+                msg_id,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
-            ),
-        )
-    )
+                chunk_size,
+                cancel,
+            )
+        finally:
+            connection.subscriptions.pop(msg_id, None)
+        if cancel.is_set():
+            return
+    connection.send_result(msg_id, {})
 
 
 @websocket_api.websocket_command(
@@ -103,6 +225,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -160,18 +283,55 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    cached_states: dict[str, list[dict[str, Any]]] = {}
+    not_cached_entity_ids = entity_ids
+    if (hot_cache := hass.data.get(DATA_HOT_CACHE)) is not None:
+        cached_states, not_cached_entity_ids = hot_cache.async_get_significant_states(
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    if chunk_size := msg.get("chunk_size"):
+        await _async_send_significant_states_in_chunks(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time,
+            not_cached_entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+            cached_states,
+        )
+        return
+
+    if not not_cached_entity_ids:
+        connection.send_message(
+            json_bytes(messages.result_message(msg["id"], cached_states))
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
             start_time,
             end_time,
-            entity_ids,
+            not_cached_entity_ids,
             include_start_time_state,
             significant_changes_only,
             minimal_response,
             no_attributes,
+            cached_states,
+            entity_ids,
         )
     )
 
@@ -284,7 +444,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
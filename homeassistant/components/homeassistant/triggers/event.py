@@ -7,7 +7,12 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM, EVENT_STATE_REPORTED
+from homeassistant.const import (
+    CONF_EVENT_DATA,
+    CONF_PLATFORM,
+    EVENT_STATE_REPORTED,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, template
@@ -48,6 +53,17 @@ def _schema_value(value: Any) -> Any:
     return value
 
 
+def _is_match_data_value(value: Any) -> bool:
+    """Return if the event bus can match the value of the event data."""
+    if value == MATCH_ALL:
+        return False
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -169,9 +185,18 @@ async def async_attach_trigger(
             event.context,
         )
 
+    # Simple event data is matched by the index of the event bus,
+    # so events that do not match do not need to be filtered
+    match_data: dict[str, Any] | None = None
+    if event_data_items and all(map(_is_match_data_value, event_data.values())):
+        match_data = dict(event_data_items)
+        event_data_items = None
+
     event_filter = filter_event if event_data_items or event_data_schema else None
     removes = [
-        hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
+        hass.bus.async_listen(
+            event_type, handle_event, event_filter=event_filter, match_data=match_data
+        )
         for event_type in event_types
     ]
 
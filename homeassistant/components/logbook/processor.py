@@ -156,9 +156,11 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
-        with session_scope(hass=self.hass, read_only=True) as session:
+        instance = get_instance(self.hass)
+        with session_scope(
+            session=instance.get_read_only_session(), read_only=True
+        ) as session:
             metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
             if self.entity_ids:
                 metadata_ids = extract_metadata_ids(
                     instance.states_meta_manager.get_many(
@@ -179,6 +181,7 @@ class EventProcessor:
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                instance.context_index_manager.active,
             )
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
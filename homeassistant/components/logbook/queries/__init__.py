@@ -26,8 +26,13 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    use_context_index: bool = False,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    When use_context_index is set the rows that started the contexts of
+    the entities and devices are looked up in the context index.
+    """
     start_day = start_day_dt.timestamp()
     end_day = end_day_dt.timestamp()
     # No entities: logbook sends everything for the timeframe
@@ -56,6 +61,7 @@ def statement_for_request(
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
             [json_dumps(device_id) for device_id in device_ids],
+            use_context_index,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -66,6 +72,7 @@ def statement_for_request(
             event_type_ids,
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
+            use_context_index,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
@@ -75,4 +82,5 @@ def statement_for_request(
         end_day,
         event_type_ids,
         [json_dumps(device_id) for device_id in device_ids],
+        use_context_index,
     )
@@ -8,7 +8,7 @@ import sqlalchemy
 from sqlalchemy import select
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import CTE, Select
 
 from homeassistant.components.recorder.db_schema import (
     EVENTS_CONTEXT_ID_BIN_INDEX,
@@ -17,6 +17,7 @@ from homeassistant.components.recorder.db_schema import (
     SHARED_ATTRS_JSON,
     SHARED_DATA_OR_LEGACY_EVENT_DATA,
     STATES_CONTEXT_ID_BIN_INDEX,
+    ContextIndex,
     EventData,
     Events,
     EventTypes,
@@ -142,6 +143,58 @@ def select_states_context_only() -> Select:
     )
 
 
+def select_events_context_rows(context_ids: CTE, use_context_index: bool) -> Select:
+    """Generate a context_only events query for the rows of the context ids.
+
+    With the context index only the event that started each context
+    is selected instead of every event of the contexts.
+    """
+    if use_context_index:
+        return (
+            select_events_context_only()
+            .select_from(context_ids)
+            .join(
+                ContextIndex,
+                context_ids.c.context_id_bin == ContextIndex.context_id_bin,
+            )
+            .join(Events, ContextIndex.event_id == Events.event_id)
+            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        )
+    return apply_events_context_hints(
+        select_events_context_only()
+        .select_from(context_ids)
+        .outerjoin(Events, context_ids.c.context_id_bin == Events.context_id_bin)
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+        .outerjoin(EventData, (Events.data_id == EventData.data_id))
+    )
+
+
+def select_states_context_rows(context_ids: CTE, use_context_index: bool) -> Select:
+    """Generate a context_only states query for the rows of the context ids.
+
+    With the context index only the state that started each context
+    is selected instead of every state of the contexts.
+    """
+    if use_context_index:
+        return (
+            select_states_context_only()
+            .select_from(context_ids)
+            .join(
+                ContextIndex,
+                context_ids.c.context_id_bin == ContextIndex.context_id_bin,
+            )
+            .join(States, ContextIndex.state_id == States.state_id)
+            .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+        )
+    return apply_states_context_hints(
+        select_states_context_only()
+        .select_from(context_ids)
+        .outerjoin(States, context_ids.c.context_id_bin == States.context_id_bin)
+        .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+    )
+
+
 def select_events_without_states(
     start_day: float, end_day: float, event_type_ids: tuple[int, ...]
 ) -> Select:
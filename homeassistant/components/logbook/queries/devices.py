@@ -10,22 +10,13 @@ from sqlalchemy.sql.elements import BooleanClauseList
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import CTE, CompoundSelect, Select
 
-from homeassistant.components.recorder.db_schema import (
-    DEVICE_ID_IN_EVENT,
-    EventData,
-    Events,
-    EventTypes,
-    States,
-    StatesMeta,
-)
+from homeassistant.components.recorder.db_schema import DEVICE_ID_IN_EVENT, Events
 
 from .common import (
-    apply_events_context_hints,
-    apply_states_context_hints,
     select_events_context_id_subquery,
-    select_events_context_only,
+    select_events_context_rows,
     select_events_without_states,
-    select_states_context_only,
+    select_states_context_rows,
 )
 
 
@@ -50,6 +41,7 @@ def _apply_devices_context_union(
     end_day: float,
     event_type_ids: tuple[int, ...],
     json_quotable_device_ids: list[str],
+    use_context_index: bool,
 ) -> CompoundSelect:
     """Generate a CTE to find the device context ids and a query to find linked row."""
     devices_cte: CTE = _select_device_id_context_ids_sub_query(
@@ -59,19 +51,8 @@ def _apply_devices_context_union(
         json_quotable_device_ids,
     ).cte()
     return sel.union_all(
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(devices_cte)
-            .outerjoin(Events, devices_cte.c.context_id_bin == Events.context_id_bin)
-            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
-            .outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        ),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(devices_cte)
-            .outerjoin(States, devices_cte.c.context_id_bin == States.context_id_bin)
-            .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
-        ),
+        select_events_context_rows(devices_cte, use_context_index),
+        select_states_context_rows(devices_cte, use_context_index),
     )
 
 
@@ -80,6 +61,7 @@ def devices_stmt(
     end_day: float,
     event_type_ids: tuple[int, ...],
     json_quotable_device_ids: list[str],
+    use_context_index: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple devices."""
     return lambda_stmt(
@@ -91,7 +73,9 @@ def devices_stmt(
             end_day,
             event_type_ids,
             json_quotable_device_ids,
-        ).order_by(Events.time_fired_ts)
+            use_context_index,
+        ).order_by(Events.time_fired_ts),
+        track_on=[use_context_index],
     )
 
 
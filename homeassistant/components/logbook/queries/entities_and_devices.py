@@ -9,21 +9,13 @@ from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import CTE, CompoundSelect, Select
 
-from homeassistant.components.recorder.db_schema import (
-    EventData,
-    Events,
-    EventTypes,
-    States,
-    StatesMeta,
-)
+from homeassistant.components.recorder.db_schema import Events, States
 
 from .common import (
-    apply_events_context_hints,
-    apply_states_context_hints,
     select_events_context_id_subquery,
-    select_events_context_only,
+    select_events_context_rows,
     select_events_without_states,
-    select_states_context_only,
+    select_states_context_rows,
 )
 from .devices import apply_event_device_id_matchers
 from .entities import (
@@ -65,6 +57,7 @@ def _apply_entities_devices_context_union(
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    use_context_index: bool,
 ) -> CompoundSelect:
     devices_entities_cte: CTE = _select_entities_device_id_context_ids_sub_query(
         start_day,
@@ -81,23 +74,8 @@ def _apply_entities_devices_context_union(
     # set on them the impact is minimal.
     return sel.union_all(
         states_select_for_entity_ids(start_day, end_day, states_metadata_ids),
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(devices_entities_cte)
-            .outerjoin(
-                Events, devices_entities_cte.c.context_id_bin == Events.context_id_bin
-            )
-            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
-            .outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        ),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(devices_entities_cte)
-            .outerjoin(
-                States, devices_entities_cte.c.context_id_bin == States.context_id_bin
-            )
-            .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
-        ),
+        select_events_context_rows(devices_entities_cte, use_context_index),
+        select_states_context_rows(devices_entities_cte, use_context_index),
     )
 
 
@@ -108,6 +86,7 @@ def entities_devices_stmt(
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    use_context_index: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
     return lambda_stmt(
@@ -123,7 +102,9 @@ def entities_devices_stmt(
             states_metadata_ids,
             json_quoted_entity_ids,
             json_quoted_device_ids,
-        ).order_by(Events.time_fired_ts)
+            use_context_index,
+        ).order_by(Events.time_fired_ts),
+        track_on=[use_context_index],
     )
 
 
@@ -14,6 +14,7 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.websocket_api import ActiveConnection, messages
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import json_bytes
@@ -43,13 +44,76 @@ _LOGGER = logging.getLogger(__name__)
 class LogbookLiveStream:
     """Track a logbook live stream."""
 
-    stream_queue: asyncio.Queue[Event]
+    stream_buffer: LogbookStreamBuffer
     subscriptions: list[CALLBACK_TYPE]
     end_time_unsub: CALLBACK_TYPE | None = None
     task: asyncio.Task | None = None
     wait_sync_future: asyncio.Future[None] | None = None
 
 
+class LogbookStreamBuffer:
+    """Buffer the events of a logbook live stream until they are sent.
+
+    The buffer holds at most max_pending events. Once it is full, a state
+    change replaces the pending state change of the same entity so an
+    entity that flaps rapidly during an event storm, or while the
+    historical events are still being sent, only takes one slot.
+    """
+
+    __slots__ = ("_has_events", "_max_pending", "_next_key", "_pending", "_state_keys")
+
+    def __init__(self, max_pending: int) -> None:
+        """Initialize the buffer."""
+        self._max_pending = max_pending
+        self._pending: dict[int, Event] = {}
+        # The key of the newest pending state change of each entity
+        self._state_keys: dict[str, int] = {}
+        self._next_key = 0
+        self._has_events = asyncio.Event()
+
+    def __len__(self) -> int:
+        """Return the number of pending events."""
+        return len(self._pending)
+
+    @callback
+    def async_put(self, event: Event) -> bool:
+        """Add an event to the buffer.
+
+        Returns False if the buffer is full and the event
+        could not be merged with a pending one.
+        """
+        pending = self._pending
+        entity_id: str | None = None
+        if event.event_type == EVENT_STATE_CHANGED:
+            entity_id = event.data["entity_id"]
+        if len(pending) >= self._max_pending:
+            if entity_id is None or (key := self._state_keys.get(entity_id)) is None:
+                return False
+            # The merged state change moves to the end
+            # so the pending events stay in order
+            del pending[key]
+        key = self._next_key
+        self._next_key += 1
+        pending[key] = event
+        if entity_id is not None:
+            self._state_keys[entity_id] = key
+        self._has_events.set()
+        return True
+
+    async def async_wait(self) -> None:
+        """Wait until there are pending events."""
+        await self._has_events.wait()
+
+    @callback
+    def async_drain(self) -> list[Event]:
+        """Remove and return the pending events."""
+        events = list(self._pending.values())
+        self._pending.clear()
+        self._state_keys.clear()
+        self._has_events.clear()
+        return events
+
+
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the logbook websocket API."""
@@ -163,7 +227,7 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -210,29 +274,26 @@ async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
     msg_id: int,
-    stream_queue: asyncio.Queue[Event],
+    stream_buffer: LogbookStreamBuffer,
     event_processor: EventProcessor,
 ) -> None:
-    """Stream events from the queue."""
+    """Stream events from the buffer."""
     subscriptions_setup_complete_timestamp = (
         subscriptions_setup_complete_time.timestamp()
     )
     while True:
-        events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired_timestamp <= subscriptions_setup_complete_timestamp:
-            continue
+        await stream_buffer.async_wait()
         # We sleep for the EVENT_COALESCE_TIME so
         # we can group events together to minimize
         # the number of websocket messages when the
         # system is overloaded with an event storm
         await asyncio.sleep(EVENT_COALESCE_TIME)
-        while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
-
+        # If an event is older than the last db
+        # event we already sent it so we skip it.
         if logbook_events := event_processor.humanify(
-            async_event_to_row(e) for e in events
+            async_event_to_row(e)
+            for e in stream_buffer.async_drain()
+            if e.time_fired_timestamp > subscriptions_setup_complete_timestamp
         ):
             connection.send_message(
                 json_bytes(
@@ -316,9 +377,9 @@ async def ws_event_stream(
         return
 
     subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_LOGBOOK_EVENTS)
+    stream_buffer = LogbookStreamBuffer(MAX_PENDING_LOGBOOK_EVENTS)
     live_stream = LogbookLiveStream(
-        subscriptions=subscriptions, stream_queue=stream_queue
+        subscriptions=subscriptions, stream_buffer=stream_buffer
     )
 
     @callback
@@ -343,9 +404,7 @@ async def ws_event_stream(
     @callback
     def _queue_or_cancel(event: Event) -> None:
         """Queue an event to be processed or cancel."""
-        try:
-            stream_queue.put_nowait(event)
-        except asyncio.QueueFull:
+        if not stream_buffer.async_put(event):
             _LOGGER.debug(
                 "Client exceeded max pending messages of %s",
                 MAX_PENDING_LOGBOOK_EVENTS,
@@ -394,7 +453,7 @@ async def ws_event_stream(
             subscriptions_setup_complete_time,
             connection,
             msg_id,
-            stream_queue,
+            stream_buffer,
             event_processor,
         )
     )
@@ -503,7 +562,7 @@ async def ws_get_events(
     )
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
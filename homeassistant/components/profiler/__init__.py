@@ -22,9 +22,13 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, template_profiler
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import save_json
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template_profiler import TemplateProfiler
+from homeassistant.setup import async_get_startup_trace
+from homeassistant.util.async_ import get_scheduled_timer_handles
 
 from .const import DOMAIN
 
@@ -40,6 +44,9 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_LOG_TEMPLATE_RENDERS = "start_log_template_renders"
+SERVICE_STOP_LOG_TEMPLATE_RENDERS = "stop_log_template_renders"
+SERVICE_DUMP_STARTUP_TRACE = "dump_startup_trace"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +70,9 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_LOG_TEMPLATE_RENDERS,
+    SERVICE_STOP_LOG_TEMPLATE_RENDERS,
+    SERVICE_DUMP_STARTUP_TRACE,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -74,6 +84,7 @@ CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+LOG_TEMPLATE_RENDERS_SUB = "log_template_renders_subscription"
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -162,6 +173,67 @@ async def async_setup_entry(  # noqa: C901
         persistent_notification.async_dismiss(hass, "profile_object_source_logging")
         domain_data.pop(LOG_INTERVAL_SUB)()
 
+    async def _async_start_log_template_renders(call: ServiceCall) -> None:
+        if LOG_TEMPLATE_RENDERS_SUB in domain_data:
+            raise HomeAssistantError("Template render logging already started")
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Template render logging has started. See [the logs](/config/logs)"
+                " to find the templates that take the most time to render."
+            ),
+            title="Template render logging started",
+            notification_id="profile_template_renders",
+        )
+        profiler = template_profiler.async_start(hass)
+
+        @callback
+        def _async_log_template_renders(*_: Any) -> None:
+            _log_template_renders(profiler)
+
+        cancel_track = async_track_time_interval(
+            hass, _async_log_template_renders, call.data[CONF_SCAN_INTERVAL]
+        )
+
+        @callback
+        def _cancel() -> None:
+            cancel_track()
+            template_profiler.async_stop(hass)
+
+        domain_data[LOG_TEMPLATE_RENDERS_SUB] = _cancel
+
+    @callback
+    def _async_stop_log_template_renders(call: ServiceCall) -> None:
+        if LOG_TEMPLATE_RENDERS_SUB not in domain_data:
+            raise HomeAssistantError("Template render logging not running")
+
+        persistent_notification.async_dismiss(hass, "profile_template_renders")
+        if (
+            profiler := hass.data.get(template_profiler.DATA_TEMPLATE_PROFILER)
+        ) is not None:
+            _log_template_renders(profiler)
+        domain_data.pop(LOG_TEMPLATE_RENDERS_SUB)()
+
+    async def _async_dump_startup_trace(call: ServiceCall) -> None:
+        if (trace := async_get_startup_trace(hass)) is None:
+            raise HomeAssistantError(
+                "The startup was not traced, start with --trace-startup"
+            )
+
+        start_time = int(time.time() * 1000000)
+        trace_path = hass.config.path(f"startup_trace.{start_time}.json")
+        await hass.async_add_executor_job(save_json, trace_path, trace)
+        persistent_notification.async_create(
+            hass,
+            (
+                f"Wrote the startup trace to {trace_path}. Open it in"
+                " https://ui.perfetto.dev to see the critical path of the startup."
+            ),
+            title="Startup trace",
+            notification_id=f"startup_trace_{start_time}",
+        )
+
     def _dump_log_objects(call: ServiceCall) -> None:
         # Imports deferred to avoid loading modules
         # in memory since usually only one part of this
@@ -255,8 +327,7 @@ async def async_setup_entry(  # noqa: C901
     async def _async_dump_scheduled(call: ServiceCall) -> None:
         """Log all scheduled in the event loop."""
         with _increase_repr_limit():
-            handle: asyncio.Handle
-            for handle in getattr(hass.loop, "_scheduled"):  # noqa: B009
+            for handle in get_scheduled_timer_handles(hass.loop):
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
@@ -382,6 +453,34 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_LOG_TEMPLATE_RENDERS,
+        _async_start_log_template_renders,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
+                ): cv.time_period
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_LOG_TEMPLATE_RENDERS,
+        _async_stop_log_template_renders,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_STARTUP_TRACE,
+        _async_dump_startup_trace,
+    )
+
     return True
 
 
@@ -391,6 +490,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    if LOG_TEMPLATE_RENDERS_SUB in hass.data[DOMAIN]:
+        hass.data[DOMAIN][LOG_TEMPLATE_RENDERS_SUB]()
     hass.data.pop(DOMAIN)
     return True
 
@@ -487,6 +588,19 @@ def _log_objects(*_):
     _LOGGER.critical("Memory Growth: %s", objgraph.growth(limit=1000))
 
 
+def _log_template_renders(profiler: TemplateProfiler) -> None:
+    """Log the templates that took the most time to render."""
+    for stats in profiler.async_top():
+        _LOGGER.critical(
+            "Template rendered %s times in %.3fs (p99 %.2fms) for %s: %s",
+            stats["count"],
+            stats["total"],
+            stats["p99"] * 1000,
+            ", ".join(stats["owners"]) or "unknown",
+            stats["template"],
+        )
+
+
 def _get_function_absfile(func: Any) -> str | None:
     """Get the absolute file path of a function."""
     import inspect  # noqa: PLC0415
@@ -0,0 +1,403 @@
+"""Columnar write buffers used by the recorder bulk insert mode.
+
+Instead of creating a States or Events ORM object for every event and
+letting the unit of work flush them one by one, the bulk insert mode
+appends the column values to plain lists and writes them with a single
+executemany per commit interval.
+
+The StatesMeta, StateAttributes, EventTypes and EventData rows are
+deduplicated by their table managers, so only a handful of them are
+created per commit. They stay in the session as ORM objects and are
+flushed before the buffers are written so their ids can be resolved.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, EventStateChangedData
+
+from .db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from .models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+from .table_managers.states import StatesManager
+
+# We need to cast __table__ to Table, explanation in
+# https://github.com/sqlalchemy/sqlalchemy/issues/9130
+STATES_TABLE = cast(Table, States.__table__)
+EVENTS_TABLE = cast(Table, Events.__table__)
+
+_INSERT_STATES_RETURNING = insert(STATES_TABLE).returning(
+    STATES_TABLE.c.state_id, sort_by_parameter_order=True
+)
+_INSERT_EVENTS_RETURNING = insert(EVENTS_TABLE).returning(
+    EVENTS_TABLE.c.event_id, sort_by_parameter_order=True
+)
+
+
+def supports_bulk_insert(engine: Engine) -> bool:
+    """Return if the engine can return the ids of bulk inserted rows in order.
+
+    The state_id of each inserted row is needed to link the
+    old_state_id of the next state of the same entity.
+    """
+    return bool(engine.dialect.insert_executemany_returning_sort_by_parameter_order)
+
+
+class StatesBuffer:
+    """Columnar buffer of pending States rows.
+
+    Each pending row is identified by its index in the column lists.
+    When the previous state of an entity is still in the buffer, the
+    index of that row is stored in old_index and the old_state_id is
+    filled in once the earlier row has been inserted.
+    """
+
+    def __init__(self, states_manager: StatesManager) -> None:
+        """Initialize the states buffer."""
+        self._states_manager = states_manager
+        self._pending_index: dict[str, int] = {}
+        self.state: list[str | None] = []
+        self.entity_id: list[str | None] = []
+        self.origin_idx: list[int] = []
+        self.last_updated_ts: list[float] = []
+        self.last_changed_ts: list[float | None] = []
+        self.last_reported_ts: list[float | None] = []
+        self.context_id_bin: list[bytes | None] = []
+        self.context_user_id_bin: list[bytes | None] = []
+        self.context_parent_id_bin: list[bytes | None] = []
+        self.metadata_id: list[int | None] = []
+        self.states_meta_rel: list[StatesMeta | None] = []
+        self.attributes_id: list[int | None] = []
+        self.state_attributes: list[StateAttributes | None] = []
+        self.old_state_id: list[int | None] = []
+        self.old_index: list[int] = []
+        self._state_ids: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of pending rows."""
+        return len(self.last_updated_ts)
+
+    def pop_pending(self, entity_id: str) -> int | None:
+        """Pop the index of the pending row for an entity.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_index.pop(entity_id, None)
+
+    def state_id(self, index: int) -> int:
+        """Return the state_id of a row after the buffer was written."""
+        return self._state_ids[index]
+
+    def update_last_reported(self, index: int, last_reported_ts: float) -> None:
+        """Update the last reported timestamp of a pending row."""
+        self.last_reported_ts[index] = last_reported_ts
+
+    def append(
+        self,
+        event: Event[EventStateChangedData],
+        entity_id: str | None,
+        old_state_id: int | None,
+        old_index: int | None,
+        metadata_id: int | None,
+        states_meta: StatesMeta | None,
+        attributes_id: int | None,
+        state_attributes: StateAttributes | None,
+    ) -> int:
+        """Append a row built from a state_changed event and return its index.
+
+        The column values are derived the same way as States.from_event.
+        """
+        state = event.data["new_state"]
+        # None state means the state was removed from the state machine
+        if state is None:
+            state_value = None
+            last_updated_ts = event.time_fired_timestamp
+            last_changed_ts = None
+            last_reported_ts = None
+        else:
+            state_value = state.state
+            last_updated_ts = state.last_updated_timestamp
+            if state.last_updated == state.last_changed:
+                last_changed_ts = None
+            else:
+                last_changed_ts = state.last_changed_timestamp
+            if state.last_updated == state.last_reported:
+                last_reported_ts = None
+            else:
+                last_reported_ts = state.last_reported_timestamp
+        context = event.context
+        index = len(self.last_updated_ts)
+        self.state.append(state_value)
+        self.entity_id.append(entity_id)
+        self.origin_idx.append(event.origin.idx)
+        self.last_updated_ts.append(last_updated_ts)
+        self.last_changed_ts.append(last_changed_ts)
+        self.last_reported_ts.append(last_reported_ts)
+        self.context_id_bin.append(ulid_to_bytes_or_none(context.id))
+        self.context_user_id_bin.append(uuid_hex_to_bytes_or_none(context.user_id))
+        self.context_parent_id_bin.append(ulid_to_bytes_or_none(context.parent_id))
+        self.metadata_id.append(metadata_id)
+        self.states_meta_rel.append(states_meta)
+        self.attributes_id.append(attributes_id)
+        self.state_attributes.append(state_attributes)
+        self.old_state_id.append(old_state_id)
+        self.old_index.append(-1 if old_index is None else old_index)
+        if state is not None:
+            self._pending_index[event.data["entity_id"]] = index
+            self._states_manager.add_pending_timestamp(last_updated_ts)
+        return index
+
+    def write(self, session: Session) -> None:
+        """Insert the pending rows.
+
+        The pending StatesMeta and StateAttributes objects must have
+        been flushed before calling this so their ids are available.
+
+        Rows are inserted in generations: the first pending row of every
+        entity is in generation 0, the row that follows it in generation 1
+        and so on, so the state_id of the old state is always known when
+        a row is inserted.
+        """
+        if not (count := len(self)):
+            return
+        old_index = self.old_index
+        generation = [0] * count
+        generations: list[list[int]] = [[]]
+        for index in range(count):
+            if (old := old_index[index]) != -1:
+                gen = generation[index] = generation[old] + 1
+                if gen == len(generations):
+                    generations.append([])
+                generations[gen].append(index)
+            else:
+                generations[0].append(index)
+
+        state_ids = self._state_ids = [0] * count
+        old_state_id = self.old_state_id
+        metadata_id = _resolve_ids(
+            self.metadata_id, self.states_meta_rel, _get_metadata_id
+        )
+        attributes_id = _resolve_ids(
+            self.attributes_id, self.state_attributes, _get_attributes_id
+        )
+        for indices in generations:
+            result = session.execute(
+                _INSERT_STATES_RETURNING,
+                [
+                    {
+                        "state": self.state[index],
+                        "entity_id": self.entity_id[index],
+                        "origin_idx": self.origin_idx[index],
+                        "last_updated_ts": self.last_updated_ts[index],
+                        "last_changed_ts": self.last_changed_ts[index],
+                        "last_reported_ts": self.last_reported_ts[index],
+                        "context_id_bin": self.context_id_bin[index],
+                        "context_user_id_bin": self.context_user_id_bin[index],
+                        "context_parent_id_bin": self.context_parent_id_bin[index],
+                        "metadata_id": metadata_id[index],
+                        "attributes_id": attributes_id[index],
+                        "old_state_id": old_state_id[index]
+                        if (old := old_index[index]) == -1
+                        else state_ids[old],
+                    }
+                    for index in indices
+                ],
+            )
+            for index, state_id in zip(indices, result.scalars(), strict=True):
+                state_ids[index] = state_id
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to load the state_id of the new rows into committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        state_ids = self._state_ids
+        add_committed = self._states_manager.add_committed
+        for entity_id, index in self._pending_index.items():
+            add_committed(entity_id, state_ids[index])
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all pending rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_index.clear()
+        self._state_ids = []
+        for column in (
+            self.state,
+            self.entity_id,
+            self.origin_idx,
+            self.last_updated_ts,
+            self.last_changed_ts,
+            self.last_reported_ts,
+            self.context_id_bin,
+            self.context_user_id_bin,
+            self.context_parent_id_bin,
+            self.metadata_id,
+            self.states_meta_rel,
+            self.attributes_id,
+            self.state_attributes,
+            self.old_state_id,
+            self.old_index,
+        ):
+            column.clear()
+
+
+class EventsBuffer:
+    """Columnar buffer of pending Events rows."""
+
+    def __init__(self) -> None:
+        """Initialize the events buffer."""
+        self.origin_idx: list[int] = []
+        self.time_fired_ts: list[float] = []
+        self.context_id_bin: list[bytes | None] = []
+        self.context_user_id_bin: list[bytes | None] = []
+        self.context_parent_id_bin: list[bytes | None] = []
+        self.event_type_id: list[int | None] = []
+        self.event_type_rel: list[EventTypes | None] = []
+        self.data_id: list[int | None] = []
+        self.event_data_rel: list[EventData | None] = []
+        self._event_ids: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of pending rows."""
+        return len(self.time_fired_ts)
+
+    def event_id(self, index: int) -> int:
+        """Return the event_id of a row after the buffer was written."""
+        return self._event_ids[index]
+
+    def append(
+        self,
+        event: Event,
+        event_type_id: int | None,
+        event_types: EventTypes | None,
+        data_id: int | None,
+        event_data: EventData | None,
+    ) -> int:
+        """Append a row built from an event and return its index.
+
+        The column values are derived the same way as Events.from_event.
+        """
+        context = event.context
+        index = len(self.time_fired_ts)
+        self.origin_idx.append(event.origin.idx)
+        self.time_fired_ts.append(event.time_fired_timestamp)
+        self.context_id_bin.append(ulid_to_bytes_or_none(context.id))
+        self.context_user_id_bin.append(uuid_hex_to_bytes_or_none(context.user_id))
+        self.context_parent_id_bin.append(ulid_to_bytes_or_none(context.parent_id))
+        self.event_type_id.append(event_type_id)
+        self.event_type_rel.append(event_types)
+        self.data_id.append(data_id)
+        self.event_data_rel.append(event_data)
+        return index
+
+    def write(self, session: Session) -> None:
+        """Insert the pending rows.
+
+        The pending EventTypes and EventData objects must have
+        been flushed before calling this so their ids are available.
+        """
+        if not len(self):
+            return
+        event_type_id = _resolve_ids(
+            self.event_type_id, self.event_type_rel, _get_event_type_id
+        )
+        data_id = _resolve_ids(self.data_id, self.event_data_rel, _get_data_id)
+        result = session.execute(
+            _INSERT_EVENTS_RETURNING,
+            [
+                {
+                    "origin_idx": origin_idx,
+                    "time_fired_ts": time_fired_ts,
+                    "context_id_bin": context_id_bin,
+                    "context_user_id_bin": context_user_id_bin,
+                    "context_parent_id_bin": context_parent_id_bin,
+                    "event_type_id": event_type_id_,
+                    "data_id": data_id_,
+                }
+                for (
+                    origin_idx,
+                    time_fired_ts,
+                    context_id_bin,
+                    context_user_id_bin,
+                    context_parent_id_bin,
+                    event_type_id_,
+                    data_id_,
+                ) in zip(
+                    self.origin_idx,
+                    self.time_fired_ts,
+                    self.context_id_bin,
+                    self.context_user_id_bin,
+                    self.context_parent_id_bin,
+                    event_type_id,
+                    data_id,
+                    strict=True,
+                )
+            ],
+        )
+        self._event_ids = list(result.scalars())
+
+    def reset(self) -> None:
+        """Drop all pending rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._event_ids = []
+        for column in (
+            self.origin_idx,
+            self.time_fired_ts,
+            self.context_id_bin,
+            self.context_user_id_bin,
+            self.context_parent_id_bin,
+            self.event_type_id,
+            self.event_type_rel,
+            self.data_id,
+            self.event_data_rel,
+        ):
+            column.clear()
+
+
+def _get_metadata_id(states_meta: StatesMeta) -> int:
+    return states_meta.metadata_id
+
+
+def _get_attributes_id(state_attributes: StateAttributes) -> int:
+    return state_attributes.attributes_id
+
+
+def _get_event_type_id(event_types: EventTypes) -> int:
+    return event_types.event_type_id
+
+
+def _get_data_id(event_data: EventData) -> int:
+    return event_data.data_id
+
+
+def _resolve_ids[_DataT](
+    ids: list[int | None],
+    pending: list[_DataT | None],
+    get_id: Callable[[_DataT], int],
+) -> list[int | None]:
+    """Resolve ids of rows that were pending when the row was appended."""
+    return [
+        get_id(obj) if (obj := pending[index]) is not None else id_
+        for index, id_ in enumerate(ids)
+    ]
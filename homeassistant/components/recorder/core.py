@@ -22,6 +22,7 @@ from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import QueuePool
 
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
@@ -49,9 +50,13 @@ from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
+from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
 from . import migration, statistics
+from .bulk_insert import EventsBuffer, StatesBuffer, supports_bulk_insert
 from .const import (
+    CONTEXT_INDEX_SCHEMA_VERSION,
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
@@ -87,6 +92,7 @@ from .models import (
     UnsupportedDialect,
 )
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .table_managers.context_index import ContextIndexManager
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -123,6 +129,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection_for_sqlite,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -169,6 +176,10 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert: bool,
+        db_read_pool_size: int,
+        vectorized_statistics: bool,
+        incremental_statistics: bool,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -182,6 +193,10 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.bulk_insert = bulk_insert
+        self.db_read_pool_size = db_read_pool_size
+        self.vectorized_statistics = vectorized_statistics
+        self.incremental_statistics = incremental_statistics
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -196,6 +211,7 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        self._read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -204,10 +220,21 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        # Recorder platforms which are called on the recorder thread
+        # with the state_changed events of their domain once recorded,
+        # only registered when incremental statistics are enabled
+        self.state_changed_platforms: dict[
+            str, Callable[[HomeAssistant, Event[EventStateChangedData]], None]
+        ] = {}
 
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # The time the newest state_changed event in the event session
+        # and in the database was fired, read by the history hot cache
+        # to only serve states that have been committed
+        self._pending_state_changed_ts = 0.0
+        self.committed_state_changed_ts = 0.0
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -216,15 +243,23 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.context_index_manager = ContextIndexManager(self)
 
         self.event_session: Session | None = None
+        # Incremented when the event session is closed, the events
+        # which were not committed yet are lost
+        self.event_session_resets = 0
+        self._states_buffer: StatesBuffer | None = None
+        self._events_buffer: EventsBuffer | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: InterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -256,6 +291,15 @@ class Recorder(threading.Thread):
             SQLITE_URL_PREFIX
         )
 
+    @property
+    def _using_read_pool(self) -> bool:
+        """Return if read-only queries use a dedicated connection pool.
+
+        Only file based SQLite databases benefit from a read pool since
+        WAL readers can run in parallel with the writer.
+        """
+        return self.db_read_pool_size > 0 and self._using_file_sqlite
+
     @property
     def recording(self) -> bool:
         """Return if the recorder is recording."""
@@ -267,6 +311,16 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_only_session(self) -> Session:
+        """Get a new sqlalchemy session for read-only queries.
+
+        The session comes from the read pool when it is in use,
+        otherwise it is a regular session.
+        """
+        if self._get_read_session is None:
+            return self.get_session()
+        return self._get_read_session()
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -284,6 +338,11 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self._using_read_pool:
+            self._db_read_executor = InterruptibleThreadPoolExecutor(
+                thread_name_prefix=DB_READ_WORKER_PREFIX,
+                max_workers=self.db_read_pool_size,
+            )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -358,6 +417,21 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read-only executor job from within the event loop.
+
+        The job must only read from the database using
+        get_read_only_session. When the read pool is in use the job
+        runs in the read executor so long running history queries
+        do not hold up the database executor.
+        """
+        if self._db_read_executor is None:
+            return self.async_add_executor_job(target, *args)
+        return self.hass.loop.run_in_executor(self._db_read_executor, target, *args)
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -1044,6 +1118,13 @@ class Recorder(threading.Thread):
             return
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
+            self._pending_state_changed_ts = event.time_fired_timestamp
+            if self.state_changed_platforms and (
+                record_state_changed := self.state_changed_platforms.get(
+                    event.data["entity_id"].partition(".")[0]
+                )
+            ):
+                record_state_changed(self.hass, event)
         else:
             self._process_non_state_changed_event_into_session(event)
         # Commit if the commit interval is zero
@@ -1054,54 +1135,80 @@ class Recorder(threading.Thread):
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
 
         # Map the event_type to the EventTypes table
         event_type_manager = self.event_type_manager
-        if pending_event_types := event_type_manager.get_pending(event.event_type):
-            dbevent.event_type_rel = pending_event_types
-        elif event_type_id := event_type_manager.get(event.event_type, session, True):
-            dbevent.event_type_id = event_type_id
-        else:
+        event_types = event_type_manager.get_pending(event.event_type)
+        event_type_id: int | None = None
+        if event_types is None and not (
+            event_type_id := event_type_manager.get(event.event_type, session, True)
+        ):
             event_types = EventTypes(event_type=event.event_type)
             event_type_manager.add_pending(event_types)
             self._add_to_session(session, event_types)
-            dbevent.event_type_rel = event_types
 
-        if not event.data:
-            self._add_to_session(session, dbevent)
-            return
+        data_id: int | None = None
+        dbevent_data: EventData | None = None
+        if event.data:
+            event_data_manager = self.event_data_manager
+            if not (
+                shared_data_bytes := event_data_manager.serialize_from_event(event)
+            ):
+                return
+
+            # Map the event data to the EventData table
+            shared_data = shared_data_bytes.decode("utf-8")
+            # Matching attributes found in the pending commit
+            if pending_event_data := event_data_manager.get_pending(shared_data):
+                dbevent_data = pending_event_data
+            # Matching attributes id found in the cache
+            elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
+                (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
+                and (data_id := event_data_manager.get(shared_data, hash_, session))
+            ):
+                pass
+            else:
+                # No matching attributes found, save them in the DB
+                dbevent_data = EventData(shared_data=shared_data, hash=hash_)
+                event_data_manager.add_pending(dbevent_data)
+                self._add_to_session(session, dbevent_data)
 
-        event_data_manager = self.event_data_manager
-        if not (shared_data_bytes := event_data_manager.serialize_from_event(event)):
+        if (events_buffer := self._events_buffer) is not None:
+            self._event_session_has_pending_writes = True
+            index = events_buffer.append(
+                event, event_type_id, event_types, data_id, dbevent_data
+            )
+            if self.schema_version >= CONTEXT_INDEX_SCHEMA_VERSION:
+                self.context_index_manager.add_pending_event(
+                    events_buffer.context_id_bin[index],
+                    events_buffer.time_fired_ts[index],
+                    index,
+                )
             return
 
-        # Map the event data to the EventData table
-        shared_data = shared_data_bytes.decode("utf-8")
-        # Matching attributes found in the pending commit
-        if pending_event_data := event_data_manager.get_pending(shared_data):
-            dbevent.event_data_rel = pending_event_data
-        # Matching attributes id found in the cache
-        elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
-            (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
-            and (data_id := event_data_manager.get(shared_data, hash_, session))
-        ):
-            dbevent.data_id = data_id
+        dbevent = Events.from_event(event)
+        if event_types is not None:
+            dbevent.event_type_rel = event_types
         else:
-            # No matching attributes found, save them in the DB
-            dbevent_data = EventData(shared_data=shared_data, hash=hash_)
-            event_data_manager.add_pending(dbevent_data)
-            self._add_to_session(session, dbevent_data)
+            dbevent.event_type_id = event_type_id
+        if dbevent_data is not None:
             dbevent.event_data_rel = dbevent_data
-
+        elif data_id is not None:
+            dbevent.data_id = data_id
         self._add_to_session(session, dbevent)
+        if self.schema_version >= CONTEXT_INDEX_SCHEMA_VERSION:
+            self.context_index_manager.add_pending_event(
+                dbevent.context_id_bin, event.time_fired_timestamp, dbevent
+            )
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
     ) -> None:
         """Process a state_changed event into the session."""
-        state_attributes_manager = self.state_attributes_manager
-        states_meta_manager = self.states_meta_manager
+        if self._states_buffer is not None:
+            self._process_state_changed_event_into_buffer(event, self._states_buffer)
+            return
+
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
@@ -1127,40 +1234,135 @@ class Recorder(threading.Thread):
         else:
             states_manager.add_pending(entity_id, dbstate)
 
-        if states_meta_manager.active:
+        if self.states_meta_manager.active:
             dbstate.entity_id = None
 
         if entity_id is None or not (
-            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
+            shared_attrs_bytes := self.state_attributes_manager.serialize_from_event(
+                event
+            )
         ):
             return
 
-        # Map the entity_id to the StatesMeta table
-        if pending_states_meta := states_meta_manager.get_pending(entity_id):
-            dbstate.states_meta_rel = pending_states_meta
-        elif metadata_id := states_meta_manager.get(entity_id, session, True):
+        if (
+            states_meta_ids := self._resolve_states_meta(
+                entity_id, entity_removed, session
+            )
+        ) is None:
+            return
+        metadata_id, states_meta = states_meta_ids
+        if states_meta is not None:
+            dbstate.states_meta_rel = states_meta
+        else:
             dbstate.metadata_id = metadata_id
-        elif states_meta_manager.active and entity_removed:
+
+        attributes_id, dbstate_attributes = self._resolve_state_attributes(
+            shared_attrs_bytes, session
+        )
+        if dbstate_attributes is not None:
+            dbstate.state_attributes = dbstate_attributes
+        else:
+            dbstate.attributes_id = attributes_id
+
+        self._add_to_session(session, dbstate)
+        if self.schema_version >= CONTEXT_INDEX_SCHEMA_VERSION:
+            self.context_index_manager.add_pending_state(
+                dbstate.context_id_bin, cast(float, dbstate.last_updated_ts), dbstate
+            )
+
+    def _process_state_changed_event_into_buffer(
+        self, event: Event[EventStateChangedData], states_buffer: StatesBuffer
+    ) -> None:
+        """Process a state_changed event into the bulk insert buffer."""
+        entity_removed = not event.data.get("new_state")
+        entity_id = event.data["entity_id"]
+        old_state = event.data["old_state"]
+
+        assert self.event_session is not None
+        session = self.event_session
+
+        states_manager = self.states_manager
+        old_state_id: int | None = None
+        if (old_index := states_buffer.pop_pending(entity_id)) is not None:
+            if old_state:
+                states_buffer.update_last_reported(
+                    old_index, old_state.last_reported_timestamp
+                )
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+
+        if entity_id is None or not (
+            shared_attrs_bytes := self.state_attributes_manager.serialize_from_event(
+                event
+            )
+        ):
+            return
+
+        if (
+            states_meta_ids := self._resolve_states_meta(
+                entity_id, entity_removed, session
+            )
+        ) is None:
+            return
+        metadata_id, states_meta = states_meta_ids
+        attributes_id, dbstate_attributes = self._resolve_state_attributes(
+            shared_attrs_bytes, session
+        )
+        self._event_session_has_pending_writes = True
+        index = states_buffer.append(
+            event,
+            None if self.states_meta_manager.active else entity_id,
+            old_state_id,
+            old_index,
+            metadata_id,
+            states_meta,
+            attributes_id,
+            dbstate_attributes,
+        )
+        if self.schema_version >= CONTEXT_INDEX_SCHEMA_VERSION:
+            self.context_index_manager.add_pending_state(
+                states_buffer.context_id_bin[index],
+                states_buffer.last_updated_ts[index],
+                index,
+            )
+
+    def _resolve_states_meta(
+        self, entity_id: str, entity_removed: bool, session: Session
+    ) -> tuple[int | None, StatesMeta | None] | None:
+        """Map the entity_id to the StatesMeta table.
+
+        Returns None if the state should not be recorded.
+        """
+        states_meta_manager = self.states_meta_manager
+        if pending_states_meta := states_meta_manager.get_pending(entity_id):
+            return None, pending_states_meta
+        if metadata_id := states_meta_manager.get(entity_id, session, True):
+            return metadata_id, None
+        if states_meta_manager.active and entity_removed:
             # If the entity was removed, we don't need to add it to the
             # StatesMeta table or record it in the pending commit
             # if it does not have a metadata_id allocated to it as
             # it either never existed or was just renamed.
-            return
-        else:
-            states_meta = StatesMeta(entity_id=entity_id)
-            states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
-
-        # Map the event data to the StateAttributes table
+            return None
+        states_meta = StatesMeta(entity_id=entity_id)
+        states_meta_manager.add_pending(states_meta)
+        self._add_to_session(session, states_meta)
+        return None, states_meta
+
+    def _resolve_state_attributes(
+        self, shared_attrs_bytes: bytes, session: Session
+    ) -> tuple[int | None, StateAttributes | None]:
+        """Map the shared attributes to the StateAttributes table."""
+        state_attributes_manager = self.state_attributes_manager
         shared_attrs = shared_attrs_bytes.decode("utf-8")
         # Matching attributes found in the pending commit
-        if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
+        if pending_attributes := state_attributes_manager.get_pending(shared_attrs):
+            return None, pending_attributes
         # Matching attributes id found in the cache
-        elif (
-            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
-        ) or (
+        if (attributes_id := state_attributes_manager.get_from_cache(shared_attrs)) or (
             (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
             and (
                 attributes_id := state_attributes_manager.get(
@@ -1168,15 +1370,12 @@ class Recorder(threading.Thread):
                 )
             )
         ):
-            dbstate.attributes_id = attributes_id
-        else:
-            # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
-            state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
-
-        self._add_to_session(session, dbstate)
+            return attributes_id, None
+        # No matching attributes found, save them in the DB
+        dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+        state_attributes_manager.add_pending(dbstate_attributes)
+        self._add_to_session(session, dbstate_attributes)
+        return None, dbstate_attributes
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1224,6 +1423,21 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._states_buffer is not None and self._events_buffer is not None:
+            # Flush the pending StatesMeta, StateAttributes, EventTypes
+            # and EventData rows first so the buffers can resolve their ids
+            session.flush()
+            self._events_buffer.write(session)
+            self._states_buffer.write(session)
+
+        if self.context_index_manager.has_pending:
+            # The ids of the new events and states are needed to index
+            # the contexts they started
+            session.flush()
+            self.context_index_manager.write_pending(
+                session, self._events_buffer, self._states_buffer
+            )
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1242,15 +1456,20 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self.committed_state_changed_ts = self._pending_state_changed_ts
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
+        if self._states_buffer is not None and self._events_buffer is not None:
+            self._states_buffer.post_commit_pending()
+            self._events_buffer.reset()
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        self.context_index_manager.post_commit_pending()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1273,12 +1492,17 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self.event_session_resets += 1
         self.states_manager.reset()
+        if self._states_buffer is not None and self._events_buffer is not None:
+            self._states_buffer.reset()
+            self._events_buffer.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.context_index_manager.reset()
 
         if not self.event_session:
             return
@@ -1397,8 +1621,29 @@ class Recorder(threading.Thread):
         ):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
+        if not self._completed_first_database_setup:
+            self._setup_bulk_insert_buffers()
         self._completed_first_database_setup = True
 
+    def _setup_bulk_insert_buffers(self) -> None:
+        """Set up the bulk insert buffers if enabled and supported.
+
+        Must be called after the dialect has been initialized by the
+        first connection since support depends on the database version.
+        """
+        assert self.engine is not None
+        self._states_buffer = self._events_buffer = None
+        if not self.bulk_insert:
+            return
+        if not supports_bulk_insert(self.engine):
+            _LOGGER.warning(
+                "The database does not support returning the ids of bulk "
+                "inserted rows, bulk insert mode is disabled"
+            )
+            return
+        self._states_buffer = StatesBuffer(self.states_manager)
+        self._events_buffer = EventsBuffer()
+
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
         kwargs: dict[str, Any] = {}
@@ -1448,10 +1693,34 @@ class Recorder(threading.Thread):
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        if self._using_read_pool:
+            self._setup_read_connection()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_connection(self) -> None:
+        """Set up the read-only connection pool."""
+        assert not self._read_engine
+        self._read_engine = create_engine(
+            self.db_url,
+            poolclass=QueuePool,
+            pool_size=self.db_read_pool_size,
+            max_overflow=0,
+            connect_args={"check_same_thread": False},
+            future=True,
+        )
+        sqlalchemy_event.listen(
+            self._read_engine, "connect", setup_read_only_connection_for_sqlite
+        )
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self._read_engine, future=True)
+        )
+
     def _close_connection(self) -> None:
         """Close the connection."""
+        self._get_read_session = None
+        if self._read_engine:
+            self._read_engine.dispose()
+            self._read_engine = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
@@ -1507,8 +1776,12 @@ class Recorder(threading.Thread):
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
                 self._db_executor.shutdown(join_threads_or_timeout=False)
+            if self._db_read_executor:
+                self._db_read_executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
             if self._db_executor:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
                 self._db_executor.join_threads_or_timeout()
+            if self._db_read_executor:
+                self._db_read_executor.join_threads_or_timeout()
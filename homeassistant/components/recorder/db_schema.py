@@ -78,7 +78,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 50
+SCHEMA_VERSION = 51
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -95,6 +95,7 @@ TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 TABLE_MIGRATION_CHANGES = "migration_changes"
+TABLE_CONTEXT_INDEX = "context_index"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -117,6 +118,7 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_CONTEXT_INDEX,
 ]
 
 TABLES_TO_CHECK = [
@@ -130,6 +132,7 @@ LAST_UPDATED_INDEX_TS = "ix_states_last_updated_ts"
 METADATA_ID_LAST_UPDATED_INDEX_TS = "ix_states_metadata_id_last_updated_ts"
 EVENTS_CONTEXT_ID_BIN_INDEX = "ix_events_context_id_bin"
 STATES_CONTEXT_ID_BIN_INDEX = "ix_states_context_id_bin"
+CONTEXT_INDEX_CONTEXT_ID_BIN_INDEX = "ix_context_index_context_id_bin"
 LEGACY_STATES_EVENT_ID_INDEX = "ix_states_event_id"
 LEGACY_STATES_ENTITY_ID_LAST_UPDATED_TS_INDEX = "ix_states_entity_id_last_updated_ts"
 LEGACY_MAX_LENGTH_EVENT_CONTEXT_ID: Final = 36
@@ -634,14 +637,8 @@ class StateAttributes(Base):
         )
 
     @staticmethod
-    def shared_attrs_bytes_from_event(
-        event: Event[EventStateChangedData],
-        dialect: SupportedDialect | None,
-    ) -> bytes:
-        """Create shared_attrs from a state_changed event."""
-        # None state means the state was removed from the state machine
-        if (state := event.data["new_state"]) is None:
-            return b"{}"
+    def recorded_attributes_from_state(state: State) -> dict[str, Any]:
+        """Return the attributes of a state that are recorded."""
         if state_info := state.state_info:
             unrecorded_attributes = state_info["unrecorded_attributes"]
             exclude_attrs = {
@@ -655,10 +652,19 @@ class StateAttributes(Base):
                 exclude_attrs -= _MATCH_ALL_KEEP
         else:
             exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
+        return {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+
+    @staticmethod
+    def shared_attrs_bytes_from_event(
+        event: Event[EventStateChangedData],
+        dialect: SupportedDialect | None,
+    ) -> bytes:
+        """Create shared_attrs from a state_changed event."""
+        # None state means the state was removed from the state machine
+        if (state := event.data["new_state"]) is None:
+            return b"{}"
         encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
-        bytes_result = encoder(
-            {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
-        )
+        bytes_result = encoder(StateAttributes.recorded_attributes_from_state(state))
         if len(bytes_result) > MAX_STATE_ATTRS_BYTES:
             _LOGGER.warning(
                 "State attributes for %s exceed maximum size of %s bytes. "
@@ -955,6 +961,43 @@ class StatisticsRuns(Base):
         )
 
 
+class ContextIndex(Base):
+    """Index of the row that started each context.
+
+    The logbook links rows to the event or state that caused them by
+    their context. Looking up the first row of a context in the events
+    and states tables means joining both on their context ids, so the
+    recorder writes the first row of every context here when it commits.
+    """
+
+    __table_args__ = (
+        Index(
+            CONTEXT_INDEX_CONTEXT_ID_BIN_INDEX,
+            "context_id_bin",
+            unique=True,
+            mysql_length=CONTEXT_ID_BIN_MAX_LENGTH,
+            mariadb_length=CONTEXT_ID_BIN_MAX_LENGTH,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_CONTEXT_INDEX
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    context_id_bin: Mapped[bytes] = mapped_column(CONTEXT_BINARY_TYPE)
+    time_fired_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    # The event or the state that started the context, the index rows
+    # are deleted by purge with them so these are not foreign keys
+    event_id: Mapped[int | None] = mapped_column(ID_TYPE, index=True)
+    state_id: Mapped[int | None] = mapped_column(ID_TYPE, index=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.ContextIndex(id={self.id}, "
+            f"context_id_bin={self.context_id_bin!r}, "
+            f"event_id={self.event_id}, state_id={self.state_id})>"
+        )
+
+
 EVENT_DATA_JSON = type_coerce(
     EventData.shared_data.cast(JSONB_VARIANT_CAST), JSONLiteral(none_as_null=True)
 )
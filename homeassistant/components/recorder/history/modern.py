@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -125,7 +125,9 @@ def get_significant_states(
     compressed_state_format: bool = False,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(
+        session=get_instance(hass).get_read_only_session(), read_only=True
+    ) as session:
         return get_significant_states_with_session(
             hass,
             session,
@@ -236,6 +238,108 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    entity_id_to_metadata_id, start_time_ts, stmts = query
+    rows: list[Row] = []
+    for stmt in stmts:
+        row_chunk = cast(
+            list[Row],
+            execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        )
+        if rows:
+            rows += row_chunk
+        else:
+            # If we have no rows yet, we can just assign the chunk
+            # as this is the common case since its rare that
+            # we exceed the MAX_IDS_FOR_INDEXED_GROUP_BY limit
+            rows = row_chunk
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Yield significant states in chunks of at most chunk_size compressed states.
+
+    The states of an entity can be split over multiple chunks, in which
+    case they are in order and must be concatenated by the consumer.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(
+        session=get_instance(hass).get_read_only_session(), read_only=True
+    ) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        entity_id_to_metadata_id, start_time_ts, stmts = query
+        for stmt in stmts:
+            yield from _sorted_states_to_compressed_chunks(
+                execute_stmt_lambda_element(
+                    session, stmt, start_time, end_time, chunk_size, orm_rows=False
+                ),
+                start_time_ts,
+                entity_id_to_metadata_id,
+                minimal_response,
+                no_attributes,
+                chunk_size,
+            )
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[dict[str, int | None], float | None, list[StatementLambdaElement]] | None:
+    """Return the statements to query the significant states.
+
+    Returns the entity_id to metadata_id map, the start time timestamp
+    if the start time state is included and the statements, or None if
+    none of the entities have any states.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -244,7 +348,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -261,7 +365,6 @@ def get_significant_states_with_session(
     start_time_ts = start_time.timestamp()
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    rows: list[Row] = []
     if TYPE_CHECKING:
         assert instance.database_engine is not None
     slow_dependent_subquery = instance.database_engine.optimizer.slow_dependent_subquery
@@ -275,38 +378,24 @@ def get_significant_states_with_session(
         iter_metadata_ids = chunked_or_all(metadata_ids, MAX_IDS_FOR_INDEXED_GROUP_BY)
     else:
         iter_metadata_ids = (metadata_ids,)
-    for metadata_ids_chunk in iter_metadata_ids:
-        stmt = _generate_significant_states_with_session_stmt(
-            start_time_ts,
-            end_time_ts,
-            single_metadata_id,
-            metadata_ids_chunk,
-            metadata_ids_in_significant_domains,
-            significant_changes_only,
-            no_attributes,
-            include_start_time_state,
-            oldest_ts,
-            slow_dependent_subquery,
-        )
-        row_chunk = cast(
-            list[Row],
-            execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        )
-        if rows:
-            rows += row_chunk
-        else:
-            # If we have no rows yet, we can just assign the chunk
-            # as this is the common case since its rare that
-            # we exceed the MAX_IDS_FOR_INDEXED_GROUP_BY limit
-            rows = row_chunk
-    return _sorted_states_to_dict(
-        rows,
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
+        [
+            _generate_significant_states_with_session_stmt(
+                start_time_ts,
+                end_time_ts,
+                single_metadata_id,
+                metadata_ids_chunk,
+                metadata_ids_in_significant_domains,
+                significant_changes_only,
+                no_attributes,
+                include_start_time_state,
+                oldest_ts,
+                slow_dependent_subquery,
+            )
+            for metadata_ids_chunk in iter_metadata_ids
+        ],
     )
 
 
@@ -461,8 +550,10 @@ def state_changes_during_period(
         raise ValueError("entity_id must be provided")
     entity_ids = [entity_id.lower()]
 
-    with session_scope(hass=hass, read_only=True) as session:
-        instance = get_instance(hass)
+    instance = get_instance(hass)
+    with session_scope(
+        session=instance.get_read_only_session(), read_only=True
+    ) as session:
         if not (
             possible_metadata_id := instance.states_meta_manager.get(
                 entity_id, session, False
@@ -578,8 +669,10 @@ def get_last_state_changes(
     # because it has to scan the table to find the last number_of_states states
     # because the metadata_id_last_updated_ts index is in ascending order.
 
-    with session_scope(hass=hass, read_only=True) as session:
-        instance = get_instance(hass)
+    instance = get_instance(hass)
+    with session_scope(
+        session=instance.get_read_only_session(), read_only=True
+    ) as session:
         if not (
             possible_metadata_id := instance.states_meta_manager.get(
                 entity_id, session, False
@@ -933,3 +1026,76 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_compressed_chunks(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Convert SQL results into chunks of compressed states.
+
+    This is the streaming variant of _sorted_states_to_dict with the
+    compressed state format. A chunk is yielded every time chunk_size
+    states have been converted so only one chunk is held in memory.
+
+    States must be sorted by entity_id and last_updated
+    """
+    field_map = _FIELD_MAP
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    chunk: dict[str, list[dict[str, Any]]] = {}
+    chunk_states = 0
+
+    for metadata_id, group in groupby(states, itemgetter(field_map["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        ent_results = chunk[entity_id] = []
+        full_states = (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        )
+        prev_state: str | None = None
+        first_state = True
+        for row in group:
+            state = row[state_idx]
+            if full_states or first_state:
+                # With minimal response only the first state is
+                # a full state, see _sorted_states_to_dict
+                ent_results.append(
+                    row_to_compressed_state(
+                        row,
+                        attr_cache,
+                        start_time_ts,
+                        entity_id,
+                        state,
+                        row[last_updated_ts_idx],
+                        False if full_states else no_attributes,
+                    )
+                )
+                first_state = False
+            elif state != prev_state:
+                ent_results.append(
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: row[last_updated_ts_idx],
+                    }
+                )
+            else:
+                continue
+            prev_state = state
+            chunk_states += 1
+            if chunk_states >= chunk_size:
+                yield {key: val for key, val in chunk.items() if val}
+                chunk = {}
+                chunk_states = 0
+                ent_results = chunk[entity_id] = []
+
+    if chunk_states:
+        yield {key: val for key, val in chunk.items() if val}
@@ -8,6 +8,7 @@ import contextlib
 from dataclasses import dataclass, replace as dataclass_replace
 from datetime import timedelta
 import logging
+from operator import itemgetter
 from time import time
 from typing import TYPE_CHECKING, Any, TypedDict, cast, final
 from uuid import UUID
@@ -51,6 +52,7 @@ from .auto_repairs.statistics.schema import (
 )
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
+    CONTEXT_INDEX_SCHEMA_VERSION,
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_FOREIGN_KEYS_FIXED_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
@@ -90,7 +92,11 @@ from .queries import (
     find_entity_ids_to_migrate,
     find_event_type_to_migrate,
     find_events_context_ids_to_migrate,
+    find_events_context_rows,
+    find_oldest_event,
+    find_oldest_state,
     find_states_context_ids_to_migrate,
+    find_states_context_rows,
     find_unmigrated_short_term_statistics_rows,
     find_unmigrated_statistics_rows,
     get_migration_changes,
@@ -136,6 +142,9 @@ MIGRATION_NOTE_WHILE = "This will take a while; please be patient!"
 _EMPTY_ENTITY_ID = "missing.entity_id"
 _EMPTY_EVENT_TYPE = "missing_event_type"
 
+# The seconds of rows indexed per task by ContextIndexMigration
+CONTEXT_INDEX_MIGRATION_WINDOW = 3600
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -2037,6 +2046,13 @@ class _SchemaVersion50Migrator(_SchemaVersionMigrator, target_version=50):
             connection.execute(text("UPDATE statistics_meta SET has_mean=NULL"))
 
 
+class _SchemaVersion51Migrator(_SchemaVersionMigrator, target_version=51):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The context_index table is created by Base.metadata.create_all,
+        # it is filled by ContextIndexMigration
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -3029,6 +3045,80 @@ class EntityIDPostMigration(BaseMigrationWithQuery, BaseOffLineMigration):
         return has_used_states_entity_ids()
 
 
+class ContextIndexMigration(BaseRunTimeMigration):
+    """Migration to index the contexts of rows recorded before the context index."""
+
+    migration_id = "context_index"
+    max_initial_schema_version = CONTEXT_INDEX_SCHEMA_VERSION - 1
+
+    def __init__(
+        self,
+        *,
+        initial_schema_version: int,
+        start_schema_version: int,
+        migration_changes: dict[str, int],
+    ) -> None:
+        """Initialize the migration."""
+        super().__init__(
+            initial_schema_version=initial_schema_version,
+            start_schema_version=start_schema_version,
+            migration_changes=migration_changes,
+        )
+        # Rows recorded after the migration is queued are indexed
+        # by the recorder when they are committed
+        self._end_ts = time()
+        self._next_ts: float | None = None
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Index the contexts of a window of rows, returns True if completed."""
+        with session_scope(session=instance.get_session()) as session:
+            if (start_ts := self._next_ts) is None:
+                start_ts = min(
+                    (
+                        oldest_ts
+                        for stmt in (find_oldest_event(), find_oldest_state())
+                        if (oldest_ts := session.execute(stmt).scalar()) is not None
+                    ),
+                    default=self._end_ts,
+                )
+            end_ts = min(start_ts + CONTEXT_INDEX_MIGRATION_WINDOW, self._end_ts)
+            rows: list[tuple[bytes, float, int | None, int | None]] = [
+                (context_id_bin, time_fired_ts, event_id, None)
+                for context_id_bin, time_fired_ts, event_id in session.execute(
+                    find_events_context_rows(start_ts, end_ts)
+                )
+            ]
+            rows.extend(
+                (context_id_bin, last_updated_ts, None, state_id)
+                for context_id_bin, last_updated_ts, state_id in session.execute(
+                    find_states_context_rows(start_ts, end_ts)
+                )
+            )
+            rows.sort(key=itemgetter(1))
+            origins: dict[bytes, tuple[float, int | None, int | None]] = {}
+            for context_id_bin, time_fired_ts, event_id, state_id in rows:
+                if context_id_bin not in origins:
+                    origins[context_id_bin] = (time_fired_ts, event_id, state_id)
+            if origins:
+                instance.context_index_manager.backfill(session, origins)
+        self._next_ts = end_ts
+        is_done = end_ts >= self._end_ts
+        _LOGGER.debug(
+            "Indexed %s contexts before %s, done: %s", len(origins), end_ts, is_done
+        )
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Will be called after migrate returns True or if migration is not needed."""
+        instance.context_index_manager.active = True
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        return DataMigrationStatus(needs_migrate=True, migration_done=False)
+
+
 NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
     StatesContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
     EventsContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
@@ -3039,6 +3129,7 @@ NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
 
 LIVE_DATA_MIGRATORS: tuple[type[BaseRunTimeMigration], ...] = (
     EventIDPostMigration,  # Introduced in HA Core 2023.4 by PR #89901
+    ContextIndexMigration,
 )
 
 
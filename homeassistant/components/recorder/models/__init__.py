@@ -19,6 +19,7 @@ from .statistics import (
     StatisticDataTimestamp,
     StatisticMeanType,
     StatisticMetaData,
+    StatisticMixIn,
     StatisticPeriod,
     StatisticResult,
 )
@@ -40,6 +41,7 @@ __all__ = [
     "StatisticDataTimestamp",
     "StatisticMeanType",
     "StatisticMetaData",
+    "StatisticMixIn",
     "StatisticPeriod",
     "StatisticResult",
     "UnsupportedDialect",
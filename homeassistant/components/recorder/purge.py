@@ -12,6 +12,7 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
+from .const import CONTEXT_INDEX_SCHEMA_VERSION
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -19,6 +20,8 @@ from .queries import (
     attributes_ids_exist_in_states_with_fast_in_distinct,
     data_ids_exist_in_events,
     data_ids_exist_in_events_with_fast_in_distinct,
+    delete_context_index_event_rows,
+    delete_context_index_state_rows,
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
@@ -148,7 +151,7 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, state_ids)
     _purge_unused_attributes_ids(instance, session, attributes_ids)
-    _purge_event_ids(session, event_ids)
+    _purge_event_ids(instance, session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
 
     # The database may still have some rows that have an event_id but are not
@@ -235,7 +238,7 @@ def _purge_events_and_data_ids(
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
-        _purge_event_ids(session, event_ids)
+        _purge_event_ids(instance, session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
@@ -469,6 +472,10 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     deleted_rows = session.execute(delete_states_rows(state_ids))
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
+    if instance.schema_version >= CONTEXT_INDEX_SCHEMA_VERSION:
+        deleted_rows = session.execute(delete_context_index_state_rows(state_ids))
+        _LOGGER.debug("Deleted %s context index rows of states", deleted_rows)
+
     # Evict eny entries in the old_states cache referring to a purged state
     instance.states_manager.evict_purged_state_ids(state_ids)
 
@@ -515,13 +522,17 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
-def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
+def _purge_event_ids(instance: Recorder, session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
         return
     deleted_rows = session.execute(delete_event_rows(event_ids))
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
+    if instance.schema_version >= CONTEXT_INDEX_SCHEMA_VERSION:
+        deleted_rows = session.execute(delete_context_index_event_rows(event_ids))
+        _LOGGER.debug("Deleted %s context index rows of events", deleted_rows)
+
 
 def _purge_old_recorder_runs(
     instance: Recorder, session: Session, purge_before: datetime
@@ -652,7 +663,7 @@ def _purge_filtered_states(
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
-    _purge_event_ids(session, filtered_event_ids)
+    _purge_event_ids(instance, session, filtered_event_ids)
     unused_attribute_ids_set = _select_unused_attributes_ids(
         instance,
         session,
@@ -702,7 +713,7 @@ def _purge_filtered_events(
         # created but since we did not remove them when we stopped adding new ones
         # we will need to purge them here.
         _purge_state_ids(instance, session, state_ids)
-    _purge_event_ids(session, event_ids_set)
+    _purge_event_ids(instance, session, event_ids_set)
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, set(data_ids), database_engine
     ):
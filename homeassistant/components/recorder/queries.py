@@ -10,6 +10,7 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
 from .db_schema import (
+    ContextIndex,
     EventData,
     Events,
     EventTypes,
@@ -278,6 +279,66 @@ def find_oldest_state() -> StatementLambdaElement:
     )
 
 
+def find_oldest_event() -> StatementLambdaElement:
+    """Find the time_fired_ts of the oldest event."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired_ts)
+        .order_by(Events.time_fired_ts.asc())
+        .limit(1)
+    )
+
+
+def delete_context_index_event_rows(
+    event_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete context_index rows of events."""
+    return lambda_stmt(
+        lambda: delete(ContextIndex)
+        .where(ContextIndex.event_id.in_(event_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_context_index_state_rows(
+    state_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete context_index rows of states."""
+    return lambda_stmt(
+        lambda: delete(ContextIndex)
+        .where(ContextIndex.state_id.in_(state_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_indexed_contexts(context_ids: Iterable[bytes]) -> StatementLambdaElement:
+    """Find the context_index rows of context ids."""
+    return lambda_stmt(
+        lambda: select(
+            ContextIndex.context_id_bin, ContextIndex.id, ContextIndex.time_fired_ts
+        ).where(ContextIndex.context_id_bin.in_(context_ids))
+    )
+
+
+def find_events_context_rows(start_ts: float, end_ts: float) -> StatementLambdaElement:
+    """Find the contexts of the events in a time window."""
+    return lambda_stmt(
+        lambda: select(Events.context_id_bin, Events.time_fired_ts, Events.event_id)
+        .filter(Events.time_fired_ts >= start_ts)
+        .filter(Events.time_fired_ts < end_ts)
+        .filter(Events.context_id_bin.is_not(None))
+    )
+
+
+def find_states_context_rows(start_ts: float, end_ts: float) -> StatementLambdaElement:
+    """Find the contexts of the states in a time window."""
+    return lambda_stmt(
+        lambda: select(States.context_id_bin, States.last_updated_ts, States.state_id)
+        .filter(States.last_updated_ts >= start_ts)
+        .filter(States.last_updated_ts < end_ts)
+        .filter(States.context_id_bin.is_not(None))
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -22,6 +22,7 @@ from sqlalchemy import (
     bindparam,
     case,
     func,
+    insert,
     lambda_stmt,
     select,
     text,
@@ -66,6 +67,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .bulk_insert import supports_bulk_insert
 from .const import (
     DOMAIN,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
@@ -106,6 +108,10 @@ from .util import (
 if TYPE_CHECKING:
     from . import Recorder
 
+_INSERT_SHORT_TERM_STATISTICS_RETURNING = insert(StatisticsShortTerm).returning(
+    StatisticsShortTerm.id, sort_by_parameter_order=True
+)
+
 QUERY_STATISTICS = (
     Statistics.metadata_id,
     Statistics.start_ts,
@@ -681,8 +687,10 @@ def _compile_statistics(
         current_metadata.update(compiled.current_metadata)
 
     new_short_term_stats: list[StatisticsBase] = []
+    new_short_term_rows: list[tuple[int, StatisticData]] = []
     updated_metadata_ids: set[int] = set()
     now_timestamp = time_time()
+    bulk_insert = instance.engine is not None and supports_bulk_insert(instance.engine)
     # Insert collected statistics in the database
     for stats in platform_stats:
         modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
@@ -691,11 +699,30 @@ def _compile_statistics(
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
         updated_metadata_ids.add(metadata_id)
-        if new_stat := _insert_statistics(
+        if bulk_insert:
+            new_short_term_rows.append((metadata_id, stats["stat"]))
+        elif new_stat := _insert_statistics(
             session, StatisticsShortTerm, metadata_id, stats["stat"], now_timestamp
         ):
             new_short_term_stats.append(new_stat)
 
+    latest_short_term_ids: dict[int, int] = {}
+    if new_short_term_rows:
+        if (
+            bulk_ids := _bulk_insert_short_term_statistics(
+                session, new_short_term_rows, now_timestamp
+            )
+        ) is not None:
+            latest_short_term_ids = bulk_ids
+        else:
+            # Insert the rows one at a time so only the rows
+            # which fail are lost
+            for metadata_id, statistic in new_short_term_rows:
+                if new_stat := _insert_statistics(
+                    session, StatisticsShortTerm, metadata_id, statistic, now_timestamp
+                ):
+                    new_short_term_stats.append(new_stat)
+
     if start.minute == 50:
         # Once every hour, update issues
         for platform in instance.hass.data[DATA_RECORDER].recorder_platforms.values():
@@ -733,6 +760,7 @@ def _compile_statistics(
                     for new_stat in new_short_term_stats
                 },
             )
+            | latest_short_term_ids
         )
 
     return modified_statistic_ids
@@ -784,6 +812,52 @@ def _insert_statistics(
     return stat
 
 
+def _bulk_insert_short_term_statistics(
+    session: Session,
+    rows: list[tuple[int, StatisticData]],
+    now_timestamp: float,
+) -> dict[int, int]:
+    """Insert 5-minute statistics in a single statement.
+
+    Returns a dict of metadata_id to the id of the inserted row, or None
+    if the statement failed and nothing was inserted.
+    """
+    try:
+        with session.begin_nested():
+            result = session.execute(
+                _INSERT_SHORT_TERM_STATISTICS_RETURNING,
+                [
+                    {
+                        "metadata_id": metadata_id,
+                        "created_ts": now_timestamp,
+                        "start_ts": statistic["start"].timestamp(),
+                        "mean": statistic.get("mean"),
+                        "mean_weight": statistic.get("mean_weight"),
+                        "min": statistic.get("min"),
+                        "max": statistic.get("max"),
+                        "last_reset_ts": datetime_to_timestamp_or_none(
+                            statistic.get("last_reset")
+                        ),
+                        "state": statistic.get("state"),
+                        "sum": statistic.get("sum"),
+                    }
+                    for metadata_id, statistic in rows
+                ],
+            )
+            return dict(
+                zip(
+                    (metadata_id for metadata_id, _ in rows),
+                    result.scalars(),
+                    strict=True,
+                )
+            )
+    except SQLAlchemyError:
+        _LOGGER.exception(
+            "Unexpected exception when inserting %s statistics in bulk", len(rows)
+        )
+    return None
+
+
 def _update_statistics(
     session: Session,
     table: type[StatisticsBase],
@@ -1981,7 +2055,9 @@ def statistics_during_period(
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
     """
-    with session_scope(hass=hass, read_only=True) as session:
+    with session_scope(
+        session=get_instance(hass).get_read_only_session(), read_only=True
+    ) as session:
         return _statistics_during_period_with_session(
             hass,
             session,
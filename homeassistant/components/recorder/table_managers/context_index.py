@@ -0,0 +1,225 @@
+"""Support managing the context index."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+from typing import TYPE_CHECKING, cast
+
+from lru import LRU
+from sqlalchemy import insert, update
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util.collection import chunked_or_all
+
+from ..db_schema import ContextIndex, Events, States
+from ..queries import find_indexed_contexts
+from ..util import execute_stmt_lambda_element
+
+if TYPE_CHECKING:
+    from ..bulk_insert import EventsBuffer, StatesBuffer
+    from ..core import Recorder
+
+CACHE_SIZE = 16384
+
+
+class _PendingOrigin:
+    """The first pending row of a context.
+
+    The row is either an ORM object in the session or the index
+    of the row in the bulk insert buffer.
+    """
+
+    __slots__ = ("event", "state", "time_fired_ts")
+
+    def __init__(
+        self,
+        time_fired_ts: float,
+        event: Events | int | None,
+        state: States | int | None,
+    ) -> None:
+        """Initialize the pending origin."""
+        self.time_fired_ts = time_fired_ts
+        self.event = event
+        self.state = state
+
+
+class ContextIndexManager:
+    """Manage the context_index table."""
+
+    # Set once every context in the database is indexed
+    active = False
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the context index manager."""
+        self.recorder = recorder
+        self._indexed: LRU[bytes, bool] = LRU(CACHE_SIZE)
+        self._pending: dict[bytes, _PendingOrigin] = {}
+
+    @property
+    def has_pending(self) -> bool:
+        """Return if there are contexts waiting to be indexed."""
+        return bool(self._pending)
+
+    def add_pending_event(
+        self,
+        context_id_bin: bytes | None,
+        time_fired_ts: float,
+        event: Events | int,
+    ) -> None:
+        """Add an event that will be committed at the next interval.
+
+        The event is only indexed if it is the first row of its context.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (
+            context_id_bin is not None
+            and context_id_bin not in self._pending
+            and context_id_bin not in self._indexed
+        ):
+            self._pending[context_id_bin] = _PendingOrigin(time_fired_ts, event, None)
+
+    def add_pending_state(
+        self,
+        context_id_bin: bytes | None,
+        last_updated_ts: float,
+        state: States | int,
+    ) -> None:
+        """Add a state that will be committed at the next interval.
+
+        The state is only indexed if it is the first row of its context.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (
+            context_id_bin is not None
+            and context_id_bin not in self._pending
+            and context_id_bin not in self._indexed
+        ):
+            self._pending[context_id_bin] = _PendingOrigin(last_updated_ts, None, state)
+
+    def write_pending(
+        self,
+        session: Session,
+        events_buffer: EventsBuffer | None,
+        states_buffer: StatesBuffer | None,
+    ) -> None:
+        """Insert the pending contexts that are not indexed yet.
+
+        The session must have been flushed and the buffers written
+        so the ids of the new rows are available.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (pending := self._pending):
+            return
+        indexed = self._find_indexed(session, pending)
+        rows: list[dict[str, bytes | float | int | None]] = []
+        for context_id_bin, origin in pending.items():
+            if context_id_bin in indexed:
+                continue
+            event_id: int | None
+            state_id: int | None
+            if (event := origin.event) is None:
+                event_id = None
+            elif isinstance(event, Events):
+                event_id = event.event_id
+            else:
+                assert events_buffer is not None
+                event_id = events_buffer.event_id(event)
+            if (state := origin.state) is None:
+                state_id = None
+            elif isinstance(state, States):
+                state_id = state.state_id
+            else:
+                assert states_buffer is not None
+                state_id = states_buffer.state_id(state)
+            rows.append(
+                {
+                    "context_id_bin": context_id_bin,
+                    "time_fired_ts": origin.time_fired_ts,
+                    "event_id": event_id,
+                    "state_id": state_id,
+                }
+            )
+        if rows:
+            session.execute(insert(ContextIndex), rows)
+
+    def backfill(
+        self,
+        session: Session,
+        origins: dict[bytes, tuple[float, int | None, int | None]],
+    ) -> None:
+        """Index the first rows of contexts that were recorded earlier.
+
+        The origins map the context ids to the time and the event_id or
+        state_id of their first row. Contexts that are already indexed
+        with a later row are updated to point to the earlier one.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        indexed = self._find_indexed(session, origins)
+        inserts: list[dict[str, bytes | float | int | None]] = []
+        updates: list[dict[str, float | int | None]] = []
+        for context_id_bin, (time_fired_ts, event_id, state_id) in origins.items():
+            if (row := indexed.get(context_id_bin)) is None:
+                inserts.append(
+                    {
+                        "context_id_bin": context_id_bin,
+                        "time_fired_ts": time_fired_ts,
+                        "event_id": event_id,
+                        "state_id": state_id,
+                    }
+                )
+            elif time_fired_ts < row[1]:
+                updates.append(
+                    {
+                        "id": row[0],
+                        "time_fired_ts": time_fired_ts,
+                        "event_id": event_id,
+                        "state_id": state_id,
+                    }
+                )
+        if inserts:
+            session.execute(insert(ContextIndex), inserts)
+        if updates:
+            session.execute(update(ContextIndex), updates)
+
+    def _find_indexed(
+        self, session: Session, context_ids: Collection[bytes]
+    ) -> dict[bytes, tuple[int, float]]:
+        """Return the id and time of the context_index rows of context ids."""
+        indexed: dict[bytes, tuple[int, float]] = {}
+        with session.no_autoflush:
+            for chunk in chunked_or_all(context_ids, self.recorder.max_bind_vars):
+                for context_id_bin, id_, time_fired_ts in cast(
+                    Iterable[tuple[bytes, int, float]],
+                    execute_stmt_lambda_element(
+                        session, find_indexed_contexts(chunk), orm_rows=False
+                    ),
+                ):
+                    indexed[context_id_bin] = (id_, time_fired_ts)
+        return indexed
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to remember the contexts that are indexed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for context_id_bin in self._pending:
+            self._indexed[context_id_bin] = True
+        self._pending.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._indexed.clear()
+        self._pending.clear()
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable
+from collections.abc import Collection, Iterable, Mapping
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -18,6 +19,8 @@ from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
     from ..core import Recorder
 
 # The number of attribute ids to cache in memory
@@ -28,6 +31,13 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The number of serialized attribute dicts to cache in memory
+#
+# The state machine shares equal attribute dicts between states
+# so a dict is usually serialized again for the next state of
+# the same entity or for other entities with the same attributes.
+SERIALIZED_CACHE_SIZE = 1024
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -37,11 +47,30 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # Maps the id of an attributes dict to the dict, the state_info
+        # it was serialized with and the shared_attrs. The dict and
+        # state_info are kept to make sure the id is not reused.
+        self._serialized: LRU[
+            int, tuple[Mapping[str, Any], StateInfo | None, bytes]
+        ] = LRU(SERIALIZED_CACHE_SIZE)
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
-        """Serialize event data."""
+        """Serialize event data.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (state := event.data["new_state"]) is not None:
+            attributes = state.attributes
+            state_info = state.state_info
+            if (
+                (serialized := self._serialized.get(id(attributes))) is not None
+                and serialized[0] is attributes
+                and serialized[1] is state_info
+            ):
+                return serialized[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +80,13 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if state is not None:
+            self._serialized[id(attributes)] = (
+                attributes,
+                state_info,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -136,6 +172,15 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._serialized.clear()
+
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
 
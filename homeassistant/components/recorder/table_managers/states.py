@@ -61,6 +61,23 @@ class StatesManager:
         if self._oldest_ts is None:
             self._oldest_ts = state.last_updated_ts
 
+    def add_pending_timestamp(self, last_updated_ts: float) -> None:
+        """Track the timestamp of a state pending in the bulk insert buffer.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._oldest_ts is None:
+            self._oldest_ts = last_updated_ts
+
+    def add_committed(self, entity_id: str, state_id: int) -> None:
+        """Add a state that was committed by the bulk insert buffer.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_committed_id[entity_id] = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -16,6 +16,7 @@ from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
+from .const import INTEGRATION_PLATFORM_RECORD_STATE_CHANGED
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -310,6 +311,13 @@ class AddRecorderPlatformTask(RecorderTask):
         platform = self.platform
         platforms: dict[str, Any] = hass.data[DATA_RECORDER].recorder_platforms
         platforms[domain] = platform
+        # The recorded state changes are only used for incremental statistics
+        if instance.incremental_statistics and (
+            record_state_changed := getattr(
+                platform, INTEGRATION_PLATFORM_RECORD_STATE_CHANGED, None
+            )
+        ):
+            instance.state_changed_platforms[domain] = record_state_changed
 
 
 @dataclass(slots=True)
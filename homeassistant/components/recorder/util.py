@@ -327,6 +327,18 @@ def execute_on_connection(dbapi_connection: DBAPIConnection, statement: str) ->
     cursor.close()
 
 
+def setup_read_only_connection_for_sqlite(
+    dbapi_connection: DBAPIConnection, connection_record: Any
+) -> None:
+    """Execute statements needed for a read-only sqlite connection.
+
+    The database is already in WAL mode since the recorder connection
+    sets it up, so readers do not block the writer and vice versa.
+    """
+    execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+    execute_on_connection(dbapi_connection, "PRAGMA cache_size = -16384")
+
+
 def query_on_connection(dbapi_connection: DBAPIConnection, statement: str) -> Any:
     """Execute a single statement with a dbapi connection and return the result."""
     cursor = dbapi_connection.cursor()
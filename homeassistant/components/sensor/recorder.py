@@ -24,6 +24,7 @@ from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMeanType,
     StatisticMetaData,
+    StatisticMixIn,
     StatisticResult,
 )
 from homeassistant.const import (
@@ -33,7 +34,14 @@ from homeassistant.const import (
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -94,9 +102,18 @@ WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 WARN_STATISTICS_MEAN_CHANGED: HassKey[set[str]] = HassKey(
     f"{DOMAIN}_warn_statistics_mean_change"
 )
+DATA_STATISTICS_ACCUMULATOR: HassKey[StatisticsAccumulator] = HassKey(
+    f"{DOMAIN}_statistics_accumulator"
+)
+# Set when a warning about numpy missing for vectorized statistics has been logged
+WARN_VECTORIZED_UNAVAILABLE: HassKey[bool] = HassKey(
+    f"{DOMAIN}_warn_vectorized_unavailable"
+)
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 STATE_CLASS_REMOVED_ISSUE = "state_class_removed"
+# The duration of a short term statistics period in seconds
+SHORT_TERM_PERIOD = 300
 UNITS_CHANGED_ISSUE = "units_changed"
 MEAN_TYPE_CHANGED_ISSUE = "mean_type_changed"
 
@@ -195,6 +212,381 @@ def _time_weighted_circular_mean(
     return statistics.weighted_circular_mean(values)
 
 
+def _vectorized_statistics(
+    hass: HomeAssistant,
+    wanted_statistics: dict[str, _StatisticsConfig],
+    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, StatisticMixIn]:
+    """Calculate the min, max and time weighted means of all entities at once.
+
+    The states of all entities are concatenated into flat arrays, and the
+    statistics of each entity are reduced from its segment of the arrays.
+    The results match _time_weighted_arithmetic_mean and
+    _time_weighted_circular_mean.
+    """
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError:
+        if WARN_VECTORIZED_UNAVAILABLE not in hass.data:
+            hass.data[WARN_VECTORIZED_UNAVAILABLE] = True
+            _LOGGER.warning(
+                "Vectorized statistics need numpy, which is not installed,"
+                " statistics are calculated without it"
+            )
+        return {}
+
+    entity_ids: list[str] = []
+    counts: list[int] = []
+    values: list[float] = []
+    timestamps: list[float] = []
+    for entity_id, _, _, valid_float_states in to_process:
+        if not wanted_statistics[entity_id].types & {"mean", "min", "max"}:
+            continue
+        entity_ids.append(entity_id)
+        counts.append(len(valid_float_states))
+        values += [fstate for fstate, _ in valid_float_states]
+        timestamps += [state.last_updated_timestamp for _, state in valid_float_states]
+    if not entity_ids:
+        return {}
+
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    fstates = np.array(values, dtype=np.float64)
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_times = np.maximum(np.array(timestamps, dtype=np.float64), start_ts)
+    offsets = np.zeros(len(counts), dtype=np.intp)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    # Each state is weighted by the duration until the next state change,
+    # the last state of each entity by the duration until the end of the period
+    end_times = np.empty_like(start_times)
+    end_times[:-1] = start_times[1:]
+    end_times[offsets[1:] - 1] = end_ts
+    end_times[-1] = end_ts
+    durations = end_times - start_times
+    # Adjust start time, if there was no last known state
+    periods = end_ts - start_times[offsets]
+
+    # Convert the results to lists, indexing numpy arrays per entity is slow
+    means: list[float] = (
+        np.add.reduceat(fstates * durations, offsets) / periods
+    ).tolist()
+    circular_means: list[float] = []
+    circular_weights: list[float] = []
+    if any(
+        wanted_statistics[entity_id].mean_type is StatisticMeanType.CIRCULAR
+        for entity_id in entity_ids
+    ):
+        rad_fstates = fstates * statistics.DEG_TO_RAD
+        sin_sums = np.add.reduceat(np.sin(rad_fstates) * durations, offsets)
+        cos_sums = np.add.reduceat(np.cos(rad_fstates) * durations, offsets)
+        circular_means = (
+            (statistics.RAD_TO_DEG * np.arctan2(sin_sums, cos_sums)) % 360
+        ).tolist()
+        circular_weights = np.hypot(sin_sums, cos_sums).tolist()
+    mins: list[float] = np.minimum.reduceat(fstates, offsets).tolist()
+    maxs: list[float] = np.maximum.reduceat(fstates, offsets).tolist()
+
+    result: dict[str, StatisticMixIn] = {}
+    for idx, entity_id in enumerate(entity_ids):
+        wanted = wanted_statistics[entity_id]
+        stat: StatisticMixIn = {}
+        if "max" in wanted.types:
+            stat["max"] = maxs[idx]
+        if "min" in wanted.types:
+            stat["min"] = mins[idx]
+        if "mean" in wanted.types:
+            match wanted.mean_type:
+                case StatisticMeanType.ARITHMETIC:
+                    stat["mean"] = means[idx]
+                case StatisticMeanType.CIRCULAR:
+                    stat["mean"] = circular_means[idx]
+                    stat["mean_weight"] = circular_weights[idx]
+        result[entity_id] = stat
+    return result
+
+
+def _float_state(state: State) -> float | None:
+    """Return the state as a finite float or None if it is not numeric."""
+    with suppress(ValueError, TypeError):
+        if math.isfinite(fstate := float(state.state)):
+            return fstate
+    return None
+
+
+class _RunningStatistics:
+    """Time weighted sums, min and max of a sensor in a period.
+
+    The sums are accumulated as the states are recorded, with the same
+    weighting as _time_weighted_arithmetic_mean and
+    _time_weighted_circular_mean.
+    """
+
+    __slots__ = (
+        "accumulated",
+        "carry",
+        "circular",
+        "cos_sum",
+        "last",
+        "last_ts",
+        "max",
+        "min",
+        "sin_sum",
+        "start_ts",
+        "units",
+    )
+
+    def __init__(
+        self, start_ts: float, carry: tuple[float, State] | None, circular: bool
+    ) -> None:
+        """Initialize the statistics with the last known state."""
+        self.carry = carry
+        self.circular = circular
+        self.accumulated = self.sin_sum = self.cos_sum = 0.0
+        self.last: tuple[float, State] | None = None
+        self.last_ts = self.start_ts = start_ts
+        self.min = self.max = math.nan
+        self.units: set[str | None] = set()
+        if carry is not None:
+            # The recorder has the last known state, which may be well
+            # before the start time of the period
+            self.add(*carry, start_ts)
+
+    def add(self, fstate: float, state: State, timestamp: float) -> None:
+        """Add a numeric state."""
+        if (last := self.last) is None:
+            # Adjust start time, if there was no last known state
+            self.start_ts = timestamp
+            self.min = self.max = fstate
+        else:
+            # Accumulate the value, weighted by duration until next state change
+            self._accumulate(last[0], timestamp - self.last_ts)
+            self.min = min(self.min, fstate)
+            self.max = max(self.max, fstate)
+        self.last = (fstate, state)
+        self.last_ts = timestamp
+        self.units.add(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+
+    def _accumulate(self, fstate: float, duration: float) -> None:
+        """Accumulate a value weighted by its duration."""
+        if self.circular:
+            rad_fstate = fstate * statistics.DEG_TO_RAD
+            self.sin_sum += math.sin(rad_fstate) * duration
+            self.cos_sum += math.cos(rad_fstate) * duration
+        else:
+            self.accumulated += fstate * duration
+
+    def result(self, end_ts: float, types: set[str]) -> StatisticMixIn:
+        """Return the statistics of the period ending at end_ts."""
+        assert self.last is not None
+        # The last state is weighted by the duration until the end of the period
+        self._accumulate(self.last[0], end_ts - self.last_ts)
+        self.last_ts = end_ts
+        stat: StatisticMixIn = {}
+        if "max" in types:
+            stat["max"] = self.max
+        if "min" in types:
+            stat["min"] = self.min
+        if "mean" in types:
+            if self.circular:
+                stat["mean"] = (
+                    statistics.RAD_TO_DEG * math.atan2(self.sin_sum, self.cos_sum)
+                ) % 360
+                stat["mean_weight"] = math.sqrt(self.sin_sum**2 + self.cos_sum**2)
+            else:
+                stat["mean"] = self.accumulated / (end_ts - self.start_ts)
+        return stat
+
+
+class _PeriodStates:
+    """The numeric states of a sensor with a sum in a period."""
+
+    __slots__ = ("carry", "float_states")
+
+    def __init__(self, carry: tuple[float, State] | None) -> None:
+        """Initialize the states with the last known state."""
+        self.carry = carry
+        self.float_states = [carry] if carry is not None else []
+
+    def add(self, fstate: float, state: State, timestamp: float) -> None:
+        """Add a numeric state."""
+        self.float_states.append((fstate, state))
+
+
+class _SensorAccumulator:
+    """The recorded states of a sensor by short term statistics period."""
+
+    __slots__ = ("config", "first_seen_ts", "last", "last_ts", "periods")
+
+    def __init__(self, config: _StatisticsConfig, first_seen_ts: float) -> None:
+        """Initialize the accumulator."""
+        self.config = config
+        self.first_seen_ts = self.last_ts = first_seen_ts
+        # The last recorded state, or None if it is not numeric
+        self.last: tuple[float, State] | None = None
+        self.periods: dict[float, _RunningStatistics | _PeriodStates] = {}
+
+    def new_period(
+        self, start_ts: float, carry: tuple[float, State] | None
+    ) -> _RunningStatistics | _PeriodStates:
+        """Return the statistics of a new period."""
+        if "sum" in self.config.types:
+            return _PeriodStates(carry)
+        return _RunningStatistics(
+            start_ts, carry, self.config.mean_type is StatisticMeanType.CIRCULAR
+        )
+
+    def pop_period(self, start_ts: float) -> _RunningStatistics | _PeriodStates:
+        """Remove and return the statistics of a period."""
+        if (period := self.periods.pop(start_ts, None)) is None:
+            # There were no state changes in the period, the last known
+            # state is the one before the next period with state changes
+            later = [ts for ts in self.periods if ts > start_ts]
+            carry = self.periods[min(later)].carry if later else self.last
+            period = self.new_period(start_ts, carry)
+        self.drop_periods_before(start_ts)
+        return period
+
+    def drop_periods_before(self, start_ts: float) -> None:
+        """Drop the statistics of the periods before start_ts."""
+        for ts in [ts for ts in self.periods if ts < start_ts]:
+            del self.periods[ts]
+
+
+class StatisticsAccumulator:
+    """Accumulate the statistics of sensors from the recorded state changes.
+
+    Compiling the short term statistics of a period then does not need
+    to read the states of the period from the database. Sensors which
+    were not seen before the period started, for example after a restart,
+    are compiled from the database.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread.
+    """
+
+    def __init__(self, event_session_resets: int) -> None:
+        """Initialize the accumulator."""
+        self.event_session_resets = event_session_resets
+        self._sensors: dict[str, _SensorAccumulator] = {}
+        self._last_start_ts = 0.0
+
+    def record(self, entity_id: str, new_state: State | None) -> None:
+        """Record a state change of a sensor."""
+        if (
+            new_state is None
+            or new_state.attributes.get(ATTR_STATE_CLASS) not in DEFAULT_STATISTICS
+        ):
+            self._sensors.pop(entity_id, None)
+            return
+        config = DEFAULT_STATISTICS[new_state.attributes[ATTR_STATE_CLASS]]
+        timestamp = new_state.last_updated_timestamp
+        fstate = _float_state(new_state)
+        sensor = self._sensors.get(entity_id)
+        if sensor is None or sensor.config is not config or timestamp < sensor.last_ts:
+            # Start over, the statistics are compiled from the
+            # database until the sensor has been seen for a full period
+            sensor = self._sensors[entity_id] = _SensorAccumulator(config, timestamp)
+        elif (
+            "sum" not in config.types and new_state.last_changed_timestamp != timestamp
+        ):
+            # Only significant changes are used for sensors without a sum,
+            # the state of an attribute change is the same as the last one
+            last = sensor.last
+            if (
+                fstate is not None
+                and last is not None
+                and (
+                    new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                    != last[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                )
+            ):
+                del self._sensors[entity_id]
+                return
+            sensor.last_ts = timestamp
+            return
+        period_start = timestamp - timestamp % SHORT_TERM_PERIOD
+        if (period := sensor.periods.get(period_start)) is None:
+            period = sensor.periods[period_start] = sensor.new_period(
+                period_start, sensor.last
+            )
+        sensor.last_ts = timestamp
+        if fstate is None:
+            sensor.last = None
+            return
+        sensor.last = (fstate, new_state)
+        period.add(fstate, new_state, timestamp)
+
+    def pop_period(
+        self,
+        sensor_states: list[State],
+        wanted_statistics: dict[str, _StatisticsConfig],
+        start: datetime.datetime,
+        end: datetime.datetime,
+    ) -> tuple[
+        set[str],
+        dict[str, list[tuple[float, State]]],
+        dict[str, _RunningStatistics],
+    ]:
+        """Remove and return the statistics of the sensors during start-end.
+
+        Returns the entity_ids of the sensors which were accumulated,
+        the numeric states of those with a sum and the running
+        statistics of the others.
+        """
+        seen: set[str] = set()
+        float_states: dict[str, list[tuple[float, State]]] = {}
+        running: dict[str, _RunningStatistics] = {}
+        start_ts = start.timestamp()
+        if (
+            start_ts % SHORT_TERM_PERIOD
+            or end.timestamp() - start_ts != SHORT_TERM_PERIOD
+            # The statistics of earlier periods have been dropped
+            or start_ts <= self._last_start_ts
+        ):
+            return seen, float_states, running
+        self._last_start_ts = start_ts
+        sensors = self._sensors
+        for state in sensor_states:
+            entity_id = state.entity_id
+            if (sensor := sensors.get(entity_id)) is None:
+                continue
+            if (
+                sensor.first_seen_ts >= start_ts
+                or sensor.config is not wanted_statistics[entity_id]
+            ):
+                sensor.drop_periods_before(start_ts)
+                continue
+            seen.add(entity_id)
+            period = sensor.pop_period(start_ts)
+            if isinstance(period, _PeriodStates):
+                if period.float_states:
+                    float_states[entity_id] = period.float_states
+            elif period.last is not None:
+                running[entity_id] = period
+        return seen, float_states, running
+
+
+def record_state_changed(
+    hass: HomeAssistant, event: Event[EventStateChangedData]
+) -> None:
+    """Accumulate a recorded state change of a sensor.
+
+    Called from the recorder thread when incremental statistics are enabled.
+    """
+    instance = get_instance(hass)
+    if (
+        accumulator := hass.data.get(DATA_STATISTICS_ACCUMULATOR)
+    ) is None or accumulator.event_session_resets != instance.event_session_resets:
+        # Events which were not committed were lost, start over
+        accumulator = hass.data[DATA_STATISTICS_ACCUMULATOR] = StatisticsAccumulator(
+            instance.event_session_resets
+        )
+    accumulator.record(event.data["entity_id"], event.data["new_state"])
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -451,17 +843,15 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(  # noqa: C901
+def _entities_with_float_states(
     hass: HomeAssistant,
     session: Session,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, _StatisticsConfig],
     start: datetime.datetime,
     end: datetime.datetime,
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
-
-    sensor_states = _get_sensor_states(hass)
-    wanted_statistics = _wanted_statistics(sensor_states)
+) -> dict[str, list[tuple[float, State]]]:
+    """Return the numeric states of the sensors during start-end."""
     # Get history between start and end
     entities_full_history = [
         i.entity_id
@@ -507,28 +897,95 @@ def compile_statistics(  # noqa: C901
         if not (float_states := _entity_history_to_float_and_state(entity_history)):
             continue
         entities_with_float_states[entity_id] = float_states
+    return entities_with_float_states
+
+
+def compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end."""
+    result: list[StatisticResult] = []
+
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+    instance = get_instance(hass)
+    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    accumulated_stats: dict[
+        str, tuple[str | None, tuple[float, State], StatisticMixIn]
+    ] = {}
+    read_sensor_states = sensor_states
+    if (
+        accumulator := hass.data.get(DATA_STATISTICS_ACCUMULATOR)
+    ) is not None and accumulator.event_session_resets == instance.event_session_resets:
+        seen, entities_with_float_states, running = accumulator.pop_period(
+            sensor_states, wanted_statistics, start, end
+        )
+        if running:
+            running_metadatas = statistics.get_metadata_with_session(
+                instance, session, statistic_ids=set(running)
+            )
+        for entity_id, running_stat in running.items():
+            # The running statistics are in the unit of the states, they
+            # can't be used if the states need to be converted
+            if len(running_stat.units) != 1 or (
+                entity_id in running_metadatas
+                and running_metadatas[entity_id][1]["unit_of_measurement"]
+                not in running_stat.units
+            ):
+                seen.discard(entity_id)
+                continue
+            assert running_stat.last is not None
+            accumulated_stats[entity_id] = (
+                next(iter(running_stat.units)),
+                running_stat.last,
+                running_stat.result(
+                    end.timestamp(), wanted_statistics[entity_id].types
+                ),
+            )
+        read_sensor_states = [
+            state for state in sensor_states if state.entity_id not in seen
+        ]
+
+    if read_sensor_states:
+        entities_with_float_states.update(
+            _entities_with_float_states(
+                hass, session, read_sensor_states, wanted_statistics, start, end
+            )
+        )
 
     # Only lookup metadata for entities that have valid float states
     # since it will result in cache misses for statistic_ids
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        instance,
+        session,
+        statistic_ids=set(entities_with_float_states) | set(accumulated_stats),
     )
     to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
     to_query: set[str] = set()
+    precomputed_stats: dict[str, StatisticMixIn] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
-        if not (maybe_float_states := entities_with_float_states.get(entity_id)):
-            continue
-        statistics_unit, valid_float_states = _normalize_states(
-            hass,
-            old_metadatas,
-            maybe_float_states,
-            entity_id,
-        )
-        if not valid_float_states:
-            continue
+        if (accumulated := accumulated_stats.get(entity_id)) is not None:
+            statistics_unit, last_float_state, precomputed_stats[entity_id] = (
+                accumulated
+            )
+            valid_float_states = [last_float_state]
+        else:
+            if not (maybe_float_states := entities_with_float_states.get(entity_id)):
+                continue
+            statistics_unit, valid_float_states = _normalize_states(
+                hass,
+                old_metadatas,
+                maybe_float_states,
+                entity_id,
+            )
+            if not valid_float_states:
+                continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
         to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
         if "sum" in wanted_statistics[entity_id].types:
@@ -537,6 +994,14 @@ def compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
+    if instance.vectorized_statistics:
+        precomputed_stats |= _vectorized_statistics(
+            hass,
+            wanted_statistics,
+            [item for item in to_process if item[0] not in precomputed_stats],
+            start,
+            end,
+        )
     for (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
@@ -608,25 +1073,28 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id].types:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id].types:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-
-        match mean_type:
-            case StatisticMeanType.ARITHMETIC:
-                stat["mean"] = _time_weighted_arithmetic_mean(
-                    valid_float_states, start, end
+        if (precomputed_stat := precomputed_stats.get(entity_id)) is not None:
+            stat.update(precomputed_stat)
+        else:
+            if "max" in wanted_statistics[entity_id].types:
+                stat["max"] = max(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
                 )
-            case StatisticMeanType.CIRCULAR:
-                stat["mean"], stat["mean_weight"] = _time_weighted_circular_mean(
-                    valid_float_states, start, end
+            if "min" in wanted_statistics[entity_id].types:
+                stat["min"] = min(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
                 )
 
+            match mean_type:
+                case StatisticMeanType.ARITHMETIC:
+                    stat["mean"] = _time_weighted_arithmetic_mean(
+                        valid_float_states, start, end
+                    )
+                case StatisticMeanType.CIRCULAR:
+                    stat["mean"], stat["mean_weight"] = _time_weighted_circular_mean(
+                        valid_float_states, start, end
+                    )
+
         if "sum" in wanted_statistics[entity_id].types:
             last_reset = old_last_reset = None
             new_state = old_state = None
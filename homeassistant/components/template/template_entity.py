@@ -533,6 +533,8 @@ class TemplateEntity(AbstractTemplateEntity):
             self._handle_results,
             log_fn=log_fn,
             has_super_template=has_availability_template,
+            # Render once for a burst of state changes
+            refresh_window=0,
         )
         self.async_on_remove(result_info.async_remove)
         self._template_result_info = result_info
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
@@ -10,7 +11,6 @@ from typing import Any, cast
 
 import voluptuous as vol
 
-from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
@@ -59,6 +59,10 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import (
     async_get_all_descriptions as async_get_all_service_descriptions,
 )
+from homeassistant.helpers.template_profiler import (
+    DATA_TEMPLATE_PROFILER,
+    DEFAULT_LIMIT as TEMPLATE_PROFILER_DEFAULT_LIMIT,
+)
 from homeassistant.helpers.trigger import (
     async_get_all_descriptions as async_get_all_trigger_descriptions,
     async_subscribe_platform_events as async_subscribe_trigger_platform_events,
@@ -72,6 +76,7 @@ from homeassistant.loader import (
 from homeassistant.setup import (
     async_get_loaded_integrations,
     async_get_setup_timings,
+    async_get_startup_trace,
     async_wait_component,
 )
 from homeassistant.util.json import format_unserializable_data
@@ -79,6 +84,7 @@ from homeassistant.util.json import format_unserializable_data
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_event_message, construct_result_message
+from .subscriptions import async_get_state_changed_hub
 
 ALL_CONDITION_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_condition_descriptions_json"
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -102,9 +108,11 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_template_render_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_condition_platforms)
     async_reg(hass, handle_subscribe_events)
@@ -124,26 +132,6 @@ def pong_message(iden: int) -> dict[str, Any]:
     return {"id": iden, "type": "pong"}
 
 
-@callback
-def _forward_events_check_permissions(
-    send_message: Callable[[bytes | str | dict[str, Any]], None],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event,
-) -> None:
-    """Forward state changed events to websocket."""
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_event_message(message_id_as_bytes, event))
-
-
 @callback
 def _forward_events_unconditional(
     send_message: Callable[[bytes | str | dict[str, Any]], None],
@@ -176,23 +164,20 @@ def handle_subscribe_events(
         raise Unauthorized(user_id=connection.user.id)
 
     message_id_as_bytes = str(msg["id"]).encode()
+    forward_events = partial(
+        _forward_events_unconditional, connection.send_message, message_id_as_bytes
+    )
 
     if event_type == EVENT_STATE_CHANGED:
-        forward_events = partial(
-            _forward_events_check_permissions,
-            connection.send_message,
-            connection.user,
-            message_id_as_bytes,
-        )
+        # The hub only forwards the changes of entities the user can read
+        connection.subscriptions[msg["id"]] = async_get_state_changed_hub(
+            hass
+        ).async_subscribe(forward_events, connection.user)
     else:
-        forward_events = partial(
-            _forward_events_unconditional, connection.send_message, message_id_as_bytes
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            event_type, forward_events
         )
 
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
-    )
-
     connection.send_result(msg["id"])
 
 
@@ -391,35 +376,72 @@ def _send_handle_get_states_response(
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
     message_id_as_bytes: bytes,
     event: Event[EventStateChangedData],
 ) -> None:
     """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
+class _CoalescedEntityChanges:
+    """Batch the entity changes of a subscription over a window.
+
+    Only the state of each entity before the first change and after
+    the last change in the window is kept, so repeated updates of the
+    same entity are merged into a single diff.
+    """
+
+    __slots__ = ("_connection", "_msg_id", "_pending", "_timer", "_window")
+
+    def __init__(
+        self, connection: ActiveConnection, msg_id: int, window: float
+    ) -> None:
+        """Initialize the batch."""
+        self._connection = connection
+        self._msg_id = msg_id
+        self._window = window
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData]) -> None:
+        """Add an entity change to the batch."""
+        data = event.data
+        entity_id = data["entity_id"]
+        if (pending := self._pending.get(entity_id)) is not None:
+            self._pending[entity_id] = (pending[0], data["new_state"])
+            return
+        self._pending[entity_id] = (data["old_state"], data["new_state"])
+        if self._timer is None:
+            self._timer = self._connection.hass.loop.call_later(
+                self._window, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the pending changes."""
+        self._timer = None
+        changes = self._pending.values()
+        if message := messages.coalesced_state_diff_message(self._msg_id, changes):
+            self._connection.send_message(message)
+        self._pending.clear()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        # Batch the changes sent to the subscriber over this many milliseconds
+        vol.Optional("coalesce_ms"): vol.All(int, vol.Range(min=1, max=1000)),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -436,17 +458,28 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
+    hub = async_get_state_changed_hub(hass)
+    if coalesce_ms := msg.get("coalesce_ms"):
+        batch = _CoalescedEntityChanges(connection, msg_id, coalesce_ms / 1000)
+        unsub = hub.async_subscribe(
+            batch.async_add, connection.user, entity_ids, entity_filter
+        )
+
+        @callback
+        def _async_unsub() -> None:
+            unsub()
+            batch.async_cancel()
+
+        connection.subscriptions[msg_id] = _async_unsub
+    else:
+        connection.subscriptions[msg_id] = hub.async_subscribe(
+            partial(
+                _forward_entity_changes, connection.send_message, message_id_as_bytes
+            ),
+            connection.user,
             entity_ids,
             entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+        )
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -685,6 +718,21 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/startup_trace"})
+@decorators.require_admin
+def handle_integration_startup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup trace command."""
+    if (trace := async_get_startup_trace(hass)) is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "The startup was not traced"
+        )
+        return
+    connection.send_result(msg["id"], trace)
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -952,6 +1000,28 @@ async def handle_execute_script(
     )
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "template/render_stats",
+        vol.Optional("limit", default=TEMPLATE_PROFILER_DEFAULT_LIMIT): vol.All(
+            int, vol.Range(min=1)
+        ),
+    }
+)
+@decorators.require_admin
+def handle_template_render_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template render stats command."""
+    if (profiler := hass.data.get(DATA_TEMPLATE_PROFILER)) is None:
+        connection.send_result(msg["id"], {"running": False, "templates": []})
+        return
+    connection.send_result(
+        msg["id"], {"running": True, "templates": profiler.async_top(msg["limit"])}
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -40,6 +40,7 @@ class ActiveConnection:
     """Handle an active websocket client connection."""
 
     __slots__ = (
+        "_wait_for_pending_messages",
         "binary_handlers",
         "can_coalesce",
         "handlers",
@@ -60,6 +61,9 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        *,
+        wait_for_pending_messages: Callable[[int], Coroutine[Any, Any, None]]
+        | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -75,6 +79,7 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._wait_for_pending_messages = wait_for_pending_messages
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -129,6 +134,14 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    async def async_wait_for_pending_messages(self, max_pending: int) -> None:
+        """Wait until at most max_pending messages are waiting to be sent.
+
+        Returns right away if the pending messages are not tracked.
+        """
+        if self._wait_for_pending_messages is not None:
+            await self._wait_for_pending_messages(max_pending)
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
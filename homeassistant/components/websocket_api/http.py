@@ -74,6 +74,7 @@ class WebSocketHandler:
         "_closing",
         "_connection",
         "_debug",
+        "_drain_waiters",
         "_handle_task",
         "_hass",
         "_logger",
@@ -108,6 +109,7 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._drain_waiters: list[asyncio.Future[None]] = []
         self._async_logging_changed()
 
     @callback
@@ -166,13 +168,17 @@ class WebSocketHandler:
                     if self._debug:
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
-                    continue
+                else:
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(message_queue), b"]")
+                    )
+                    message_queue.clear()
+                    if self._debug:
+                        debug("%s: Sending %s", self.description, coalesced_messages)
+                    await send_bytes_text(coalesced_messages)
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
-                if self._debug:
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if self._drain_waiters:
+                    self._release_drain_waiters()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -182,6 +188,30 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drain_waiters()
+
+    @callback
+    def _release_drain_waiters(self) -> None:
+        """Release the waiters for the pending messages to be sent."""
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._drain_waiters.clear()
+
+    async def _async_wait_for_pending_messages(self, max_pending: int) -> None:
+        """Wait until at most max_pending messages are waiting to be sent.
+
+        Returns when the writer is done since the messages will not be sent.
+        """
+        while (
+            not self._closing
+            and (writer_task := self._writer_task) is not None
+            and not writer_task.done()
+            and len(self._message_queue) > max_pending
+        ):
+            waiter = self._loop.create_future()
+            self._drain_waiters.append(waiter)
+            await waiter
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -341,7 +371,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            wait_for_pending_messages=self._async_wait_for_pending_messages,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
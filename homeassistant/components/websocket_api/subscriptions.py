@@ -0,0 +1,160 @@
+"""Shared state_changed subscriptions for websocket connections.
+
+Instead of every subscription registering its own state_changed
+listener, a single listener dispatches the events to the subscriptions
+that are interested in the entity. Subscriptions to specific entities
+are indexed by entity_id so they are only visited for those entities.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+DATA_STATE_CHANGED_HUB: HassKey[StateChangedSubscriptionHub] = HassKey(
+    f"{DOMAIN}.state_changed_hub"
+)
+
+type ForwardStateChangedType = Callable[[Event[EventStateChangedData]], None]
+
+
+@callback
+@singleton(DATA_STATE_CHANGED_HUB)
+def async_get_state_changed_hub(hass: HomeAssistant) -> StateChangedSubscriptionHub:
+    """Return the state_changed subscription hub."""
+    return StateChangedSubscriptionHub(hass)
+
+
+class _Subscription:
+    """A subscription to state changes of a user."""
+
+    __slots__ = ("_permissions", "_read_all", "entity_filter", "forward", "user")
+
+    def __init__(
+        self,
+        forward: ForwardStateChangedType,
+        user: User,
+        entity_filter: Callable[[str], bool] | None,
+    ) -> None:
+        """Initialize the subscription."""
+        self.forward = forward
+        self.user = user
+        self.entity_filter = entity_filter
+        self._permissions: AbstractPermissions | None = None
+        self._read_all = False
+
+    def can_read(self, entity_id: str) -> bool:
+        """Return if the user is allowed to read the entity.
+
+        Whether the user can read all entities is resolved once per
+        permissions object. A new permissions object is created when
+        the user changes, so changes are still picked up.
+        """
+        user = self.user
+        permissions = user.permissions
+        if permissions is not self._permissions:
+            self._permissions = permissions
+            self._read_all = user.is_admin or permissions.access_all_entities(
+                POLICY_READ
+            )
+        return self._read_all or permissions.check_entity(entity_id, POLICY_READ)
+
+
+class StateChangedSubscriptionHub:
+    """Dispatch state_changed events to websocket subscriptions."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        # The buckets are replaced instead of mutated so a subscription
+        # can be removed while an event is being dispatched.
+        self._all: tuple[_Subscription, ...] = ()
+        self._by_entity_id: dict[str, tuple[_Subscription, ...]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        forward: ForwardStateChangedType,
+        user: User,
+        entity_ids: set[str] | None = None,
+        entity_filter: Callable[[str], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Forward the state changes the user can read to forward.
+
+        When entity_ids is set, only changes of those entities are
+        forwarded. When entity_filter is set, only changes of entities
+        that pass the filter are forwarded.
+        """
+        subscription = _Subscription(forward, user, entity_filter)
+        if entity_ids:
+            by_entity_id = self._by_entity_id
+            for entity_id in entity_ids:
+                by_entity_id[entity_id] = (
+                    *by_entity_id.get(entity_id, ()),
+                    subscription,
+                )
+        else:
+            self._all = (*self._all, subscription)
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+        return partial(self._async_unsubscribe, subscription, entity_ids)
+
+    @callback
+    def _async_unsubscribe(
+        self, subscription: _Subscription, entity_ids: set[str] | None
+    ) -> None:
+        """Remove a subscription."""
+        if entity_ids:
+            by_entity_id = self._by_entity_id
+            for entity_id in entity_ids:
+                if subscriptions := tuple(
+                    sub for sub in by_entity_id[entity_id] if sub is not subscription
+                ):
+                    by_entity_id[entity_id] = subscriptions
+                else:
+                    del by_entity_id[entity_id]
+        else:
+            self._all = tuple(sub for sub in self._all if sub is not subscription)
+        if not self._all and not self._by_entity_id and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the interested subscriptions."""
+        entity_id = event.data["entity_id"]
+        for subscription in self._all:
+            if (
+                entity_filter := subscription.entity_filter
+            ) is not None and not entity_filter(entity_id):
+                continue
+            if subscription.can_read(entity_id):
+                subscription.forward(event)
+        if (subscriptions := self._by_entity_id.get(entity_id)) is None:
+            return
+        for subscription in subscriptions:
+            if (
+                entity_filter := subscription.entity_filter
+            ) is not None and not entity_filter(entity_id):
+                continue
+            if subscription.can_read(entity_id):
+                subscription.forward(event)
@@ -12,6 +12,7 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
@@ -25,6 +26,7 @@ import functools
 import inspect
 import logging
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -41,6 +43,7 @@ from typing import (
     final,
     overload,
 )
+import weakref
 
 from propcache.api import cached_property, under_cached_property
 import voluptuous as vol
@@ -1444,6 +1447,30 @@ class _OneTimeListener(Generic[_DataT]):
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
+# Key of the listeners indexed on the presence of an event data key
+_KEY_PRESENT = object()
+
+
+def _match_data_filter(
+    match_data: Iterable[tuple[str, Any]],
+    event_filter: Callable[[_DataT], bool] | None,
+) -> Callable[[_DataT], bool] | None:
+    """Compile the match_data items that are not indexed into an event filter."""
+    if not (items := tuple(match_data)):
+        return event_filter
+
+    @callback
+    def _filter(event_data: _DataT) -> bool:
+        """Check the event data matches."""
+        for key, value in items:
+            if key not in event_data or (
+                value != MATCH_ALL and event_data[key] != value
+            ):
+                return False
+        return event_filter is None or event_filter(event_data)
+
+    return _filter
+
 
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
@@ -1455,13 +1482,25 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_indexed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        # Listeners registered with match_data, indexed by
+        # event type, event data key and event data value
+        self._indexed_listeners: dict[
+            EventType[Any] | str,
+            dict[str, dict[Any, list[_FilterableJobType[Any]]]],
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1479,7 +1518,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, index in self._indexed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs) for by_value in index.values() for jobs in by_value.values()
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1545,6 +1589,22 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (
+            index := self._indexed_listeners.get(event_type)
+        ):
+            # Only copy the listeners when indexed listeners match
+            for key, by_value in index.items():
+                if key not in event_data:
+                    continue
+                if jobs := by_value.get(_KEY_PRESENT):
+                    listeners = listeners + jobs
+                try:
+                    jobs = by_value.get(event_data[key])
+                except TypeError:
+                    # Unhashable values never match an indexed value
+                    continue
+                if jobs:
+                    listeners = listeners + jobs
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1601,6 +1661,8 @@ class EventBus:
         listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[_DataT], bool] | None = None,
         run_immediately: bool | object = _SENTINEL,
+        *,
+        match_data: Mapping[str, Any] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1611,6 +1673,14 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        An optional match_data restricts the listener to events where
+        the event data has the same value for every key of match_data,
+        or has the key at all if the value is ``MATCH_ALL``. Unlike an
+        event_filter, match_data is indexed so firing an event does not
+        need to check the listeners that do not match. The values of
+        match_data must be hashable. Indexed listeners are called after
+        the other listeners of the event type.
+
         If run_immediately is passed:
           - callbacks will be run right away instead of using call_soon.
           - coroutine functions will be scheduled eagerly.
@@ -1629,13 +1699,55 @@ class EventBus:
 
         if event_filter is not None and not is_callback_check_partial(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
-        filterable_job = (HassJob(listener, f"listen {event_type}"), event_filter)
         if event_type == EVENT_STATE_REPORTED:
-            if not event_filter:
+            if not event_filter and not match_data:
                 raise HomeAssistantError(
                     f"Event filter is required for event {event_type}"
                 )
-        return self._async_listen_filterable_job(event_type, filterable_job)
+        if match_data:
+            for key, value in match_data.items():
+                try:
+                    hash(value)
+                except TypeError:
+                    raise HomeAssistantError(
+                        f"Value {value!r} of key {key} in match_data is not hashable"
+                    ) from None
+        job = HassJob(listener, f"listen {event_type}")
+        if match_data and event_type != MATCH_ALL:
+            return self._async_listen_indexed_job(
+                event_type, job, event_filter, match_data
+            )
+        if match_data:
+            event_filter = _match_data_filter(match_data.items(), event_filter)
+        return self._async_listen_filterable_job(event_type, (job, event_filter))
+
+    @callback
+    def _async_listen_indexed_job(
+        self,
+        event_type: EventType[_DataT] | str,
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None,
+        match_data: Mapping[str, Any],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type indexed on their data.
+
+        The listener is indexed on one key of match_data, preferring
+        an equality match, and the rest of match_data is compiled into
+        the event filter.
+        """
+        items = sorted(match_data.items(), key=lambda item: item[1] == MATCH_ALL)
+        key, value = items[0]
+        if value == MATCH_ALL:
+            value = _KEY_PRESENT
+        filterable_job: _FilterableJobType[_DataT] = (
+            job,
+            _match_data_filter(items[1:], event_filter),
+        )
+        index = self._indexed_listeners.setdefault(event_type, {})
+        index.setdefault(key, {}).setdefault(value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_indexed_listener, event_type, key, value, filterable_job
+        )
 
     @callback
     def _async_listen_filterable_job(
@@ -1737,6 +1849,36 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        value: Any,
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a listener indexed on its event data.
+
+        This method must be run in the event loop.
+        """
+        try:
+            index = self._indexed_listeners[event_type]
+            by_value = index[key]
+            jobs = by_value[value]
+            jobs.remove(filterable_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+        # delete the empty parts of the index
+        if not jobs:
+            del by_value[value]
+            if not by_value:
+                del index[key]
+                if not index:
+                    del self._indexed_listeners[event_type]
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -1748,6 +1890,17 @@ class CompressedState(TypedDict):
     lu: NotRequired[float]  # COMPRESSED_STATE_LAST_UPDATED
 
 
+# Keys of the State cache holding serializations which can be rebuilt
+_STATE_SERIALIZATION_CACHE_KEYS = (
+    "_as_dict",
+    "_as_read_only_dict",
+    "as_dict_json",
+    "json_fragment",
+    "as_compressed_state",
+    "as_compressed_state_json",
+)
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -1985,6 +2138,15 @@ class State:
             context=context,
         )
 
+    def drop_caches(self) -> None:
+        """Drop the cached serializations of the state.
+
+        They are built again the next time they are needed.
+        """
+        cache = self._cache
+        for key in _STATE_SERIALIZATION_CACHE_KEYS:
+            cache.pop(key, None)
+
     def expire(self) -> None:
         """Mark the state as old.
 
@@ -2013,6 +2175,30 @@ class State:
         )
 
 
+def _attribute_key(value: Any) -> Hashable:
+    """Return a key that is only equal for values of the same types.
+
+    Raises TypeError for values that are not interned. Only immutable
+    values are interned, since the interned attributes are shared
+    between entities and a mutable value could be changed through any
+    of them.
+    """
+    value_type = type(value)
+    if value_type is str or value_type is int or value_type is bool or value is None:
+        return (value_type, value)
+    if value_type is float:
+        # Tells apart 0.0 and -0.0
+        return (value_type, value.hex())
+    if value_type is tuple:
+        return (value_type, tuple(_attribute_key(item) for item in value))
+    if value_type is ReadOnlyDict:
+        return (
+            value_type,
+            tuple((name, _attribute_key(item)) for name, item in value.items()),
+        )
+    raise TypeError(f"Attributes of type {value_type} are not interned")
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
@@ -2058,7 +2244,15 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_bus",
+        "_compact",
+        "_interned_attributes",
+        "_loop",
+        "_reservations",
+        "_states",
+        "_states_data",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2069,6 +2263,60 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Equal attribute dicts are shared between states so consumers
+        # such as the recorder only serialize them once
+        self._interned_attributes: weakref.WeakValueDictionary[
+            Hashable, ReadOnlyDict[str, Any]
+        ] = weakref.WeakValueDictionary()
+        self._compact = False
+
+    @callback
+    def async_enable_compact_mode(self) -> None:
+        """Store states compactly for large installations.
+
+        State strings are interned and the cached serializations of
+        a state are dropped once it has been replaced.
+
+        This method must be run in the event loop.
+        """
+        self._compact = True
+
+    @callback
+    def async_drop_caches(self) -> None:
+        """Drop the cached serializations of all states.
+
+        Called in compact mode once Home Assistant has started and
+        whenever the system is low on memory.
+
+        This method must be run in the event loop.
+        """
+        for state in self._states_data.values():
+            state.drop_caches()
+
+    def _intern_attributes(
+        self, attributes: Mapping[str, Any] | None
+    ) -> ReadOnlyDict[str, Any]:
+        """Return a shared ReadOnlyDict equal to attributes.
+
+        Attributes holding mutable values or values other than JSON
+        types are not shared.
+        """
+        if attributes is None:
+            attributes = {}
+        try:
+            key: Hashable | None = tuple(
+                (name, _attribute_key(value)) for name, value in attributes.items()
+            )
+        except TypeError:
+            key = None
+        interned_attributes = self._interned_attributes
+        if key is not None and (interned := interned_attributes.get(key)) is not None:
+            return interned
+        if type(attributes) is not ReadOnlyDict:
+            attributes = ReadOnlyDict(attributes)
+        if key is not None:
+            interned_attributes[key] = attributes
+        return attributes
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2352,6 +2600,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._intern_attributes(attributes)
 
         if not same_state and len(new_state) > MAX_LENGTH_STATE_STATE:
             _LOGGER.error(
@@ -2362,6 +2612,8 @@ class StateMachine:
                 STATE_UNKNOWN,
             )
             new_state = STATE_UNKNOWN
+        elif self._compact and type(new_state) is str:
+            new_state = sys.intern(new_state)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2391,6 +2643,8 @@ class StateMachine:
             context=context,
             time_fired=timestamp,
         )
+        if old_state is not None and self._compact:
+            old_state.drop_caches()
 
 
 class SupportsResponse(enum.StrEnum):
@@ -0,0 +1,406 @@
+"""Persistent snapshot of the integrations resolved at startup.
+
+Every start reads the manifest.json and lists the files of each
+integration that is set up and resolves their dependency graph. The
+snapshot keeps the manifests, the top level files, the resolved
+dependencies and after dependencies and the installed requirements in a
+store so the next start can use them instead.
+
+Integrations are only used from the snapshot while the modification
+times of their directory and manifest are unchanged. The whole snapshot
+is discarded when Home Assistant, the integration roots or the custom
+integrations change. The requirements are discarded when a directory on
+sys.path is modified.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping
+import logging
+import os
+from pathlib import Path
+import sys
+from typing import Any, cast
+
+from homeassistant import loader, requirements
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, __version__
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+
+from .storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_BOOT_SNAPSHOT: HassKey[BootSnapshot] = HassKey("boot_snapshot")
+
+STORAGE_KEY = "core.boot_snapshot"
+STORAGE_VERSION = 1
+SNAPSHOT_VERSION = 2
+
+# The keys the loader adds to the manifest of an integration
+_MANIFEST_LOADER_KEYS = ("is_built_in", "overwrites_built_in")
+
+# The file path, the modification times of the directory and the manifest,
+# the manifest and the top level files of a built-in integration
+type _IntegrationEntry = tuple[str, tuple[int, int], dict[str, Any], set[str] | None]
+
+
+def _file_key(file_path: Path) -> tuple[int, int] | None:
+    """Return the modification times of an integration and its manifest."""
+    try:
+        return (
+            file_path.stat().st_mtime_ns,
+            (file_path / "manifest.json").stat().st_mtime_ns,
+        )
+    except OSError:
+        return None
+
+
+def _read_integration(file_path: Path) -> _IntegrationEntry | None:
+    """Read the manifest and list the files of a built-in integration."""
+    # Get the modification times first so a change while reading
+    # is detected at the next start
+    if (file_key := _file_key(file_path)) is None:
+        return None
+    try:
+        manifest = json_loads((file_path / "manifest.json").read_text())
+        top_level_files = (
+            None
+            if cast(dict[str, Any], manifest).get("integration_type") == "virtual"
+            else set(os.listdir(file_path))
+        )
+    except (OSError, *JSON_DECODE_EXCEPTIONS):
+        return None
+    return (str(file_path), file_key, cast(dict[str, Any], manifest), top_level_files)
+
+
+def _site_key() -> tuple[tuple[str, int], ...]:
+    """Return the modification times of the directories on sys.path."""
+    key: list[tuple[str, int]] = []
+    for path in sys.path:
+        try:
+            key.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(key)
+
+
+def _from_json(stored: dict[str, Any]) -> dict[str, Any]:
+    """Convert the stored snapshot to the sets and tuples it is made of."""
+    site_key, installed = stored["requirements"]
+    return {
+        "integrations": {
+            domain: (
+                file_path,
+                tuple(file_key),
+                manifest,
+                None if top_level_files is None else set(top_level_files),
+            )
+            for domain, (
+                file_path,
+                file_key,
+                manifest,
+                top_level_files,
+            ) in stored["integrations"].items()
+        },
+        "dependencies": {
+            domain: set(deps) for domain, deps in stored["dependencies"].items()
+        },
+        "after_dependencies": {
+            name: (set(inputs), {domain: set(deps) for domain, deps in result.items()})
+            for name, (inputs, result) in stored["after_dependencies"].items()
+        },
+        "requirements": (tuple(tuple(entry) for entry in site_key), set(installed)),
+        "resolve_time": stored["resolve_time"],
+    }
+
+
+def _to_json(data: dict[str, Any]) -> dict[str, Any]:
+    """Convert the snapshot to JSON types."""
+    site_key, installed = data["requirements"]
+    return {
+        "integrations": {
+            domain: [
+                file_path,
+                list(file_key),
+                manifest,
+                None if top_level_files is None else sorted(top_level_files),
+            ]
+            for domain, (
+                file_path,
+                file_key,
+                manifest,
+                top_level_files,
+            ) in data["integrations"].items()
+        },
+        "dependencies": {
+            domain: sorted(deps) for domain, deps in data["dependencies"].items()
+        },
+        "after_dependencies": {
+            name: [
+                sorted(inputs),
+                {domain: sorted(deps) for domain, deps in result.items()},
+            ]
+            for name, (inputs, result) in data["after_dependencies"].items()
+        },
+        "requirements": [[list(entry) for entry in site_key], sorted(installed)],
+        "resolve_time": data["resolve_time"],
+    }
+
+
+def _without_loader_keys(manifest: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the manifest as read from disk."""
+    return {
+        key: value
+        for key, value in manifest.items()
+        if key not in _MANIFEST_LOADER_KEYS
+    }
+
+
+class BootSnapshot:
+    """Cache the integrations resolved at startup across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY, private=True
+        )
+        # Home Assistant, the integration roots and the custom
+        # integrations the snapshot was taken with
+        self._key: dict[str, Any] = {}
+        # The data loaded from disk
+        self._data: dict[str, Any] = {}
+        # The domains that did not change since the snapshot was saved
+        self._fresh: set[str] = set()
+        self._integrations: dict[str, _IntegrationEntry] = {}
+        self._dependencies: dict[str, set[str]] = {}
+        self._installed: set[str] = set()
+        # The after dependency resolutions of this start
+        self._after_dependencies: dict[str, tuple[set[str], dict[str, set[str]]]] = {}
+        # If resolutions of this start were used from the snapshot
+        self._warm = False
+        # Seconds it took to resolve the integrations without the snapshot
+        self.resolve_time: float | None = None
+
+    async def async_load(
+        self, custom: dict[str, loader.Integration]
+    ) -> dict[str, loader.Integration]:
+        """Load the snapshot and return the unchanged built-in integrations."""
+        try:
+            stored = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.debug("Discarding boot snapshot: %s", err)
+            stored = None
+        return await self.hass.async_add_executor_job(self.load, custom, stored)
+
+    def load(
+        self, custom: dict[str, loader.Integration], stored: dict[str, Any] | None
+    ) -> dict[str, loader.Integration]:
+        """Use the stored snapshot and return the unchanged built-in integrations.
+
+        This method does blocking I/O and should run in the executor.
+        """
+        from homeassistant import components  # noqa: PLC0415
+
+        roots: list[list[str | int]] = []
+        for base in components.__path__:
+            try:
+                roots.append([base, os.stat(base).st_mtime_ns])
+            except OSError:
+                continue
+        self._key = {
+            "snapshot_version": SNAPSHOT_VERSION,
+            "ha_version": __version__,
+            "roots": roots,
+            "custom": {
+                domain: dict(itg.manifest) for domain, itg in sorted(custom.items())
+            },
+        }
+        if stored is None:
+            return {}
+        if not isinstance(stored, dict) or stored.get("key") != self._key:
+            _LOGGER.debug("Discarding boot snapshot of another version")
+            return {}
+        try:
+            self._data = _from_json(stored)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Discarding boot snapshot: %s", err)
+            return {}
+        self.resolve_time = self._data["resolve_time"]
+        if self._data["requirements"][0] == _site_key():
+            self._installed = self._data["requirements"][1]
+
+        # The custom integrations are part of the key and are read
+        # on every start so their manifests are always up to date
+        self._fresh.update(custom)
+        integrations: dict[str, loader.Integration] = {}
+        for domain, entry in self._data["integrations"].items():
+            file_path = Path(entry[0])
+            if domain in custom or _file_key(file_path) != entry[1]:
+                continue
+            self._fresh.add(domain)
+            self._integrations[domain] = entry
+            integrations[domain] = loader.Integration(
+                self.hass,
+                f"{loader.PACKAGE_BUILTIN}.{domain}",
+                file_path,
+                cast(loader.Manifest, dict(entry[2])),
+                entry[3],
+            )
+        self._dependencies = {
+            domain: deps
+            for domain, deps in self._data["dependencies"].items()
+            if domain in self._fresh and deps <= self._fresh
+        }
+        _LOGGER.debug(
+            "Loaded %s of %s integrations from the boot snapshot",
+            len(integrations),
+            len(self._data["integrations"]),
+        )
+        return integrations
+
+    @callback
+    def async_prime(
+        self,
+        integrations: dict[str, loader.Integration],
+        custom: dict[str, loader.Integration],
+    ) -> None:
+        """Add the unchanged integrations to the loader caches."""
+        cache = self.hass.data[loader.DATA_INTEGRATIONS]
+        # Custom integrations are only added to the cache when they are
+        # requested, add those the cached resolutions refer to
+        referenced: set[str] = set()
+        for deps in self._dependencies.values():
+            referenced |= deps
+        for inputs, result in self._data.get("after_dependencies", {}).values():
+            referenced |= inputs
+            for deps in result.values():
+                referenced |= deps
+        integrations = {
+            **{domain: custom[domain] for domain in referenced & custom.keys()},
+            **integrations,
+        }
+        for domain, integration in integrations.items():
+            if domain in cache:
+                continue
+            cache[domain] = integration
+            if (all_dependencies := self._dependencies.get(domain)) is not None:
+                integration._all_dependencies = set(all_dependencies)  # noqa: SLF001
+        requirements.async_get_installed_requirements(self.hass).update(self._installed)
+
+    @callback
+    def async_get_after_dependencies(
+        self, name: str, domains: Collection[str]
+    ) -> dict[str, set[str]] | None:
+        """Return the cached after dependencies of domains if unchanged."""
+        if (cached := self._data.get("after_dependencies", {}).get(name)) is None:
+            return None
+        inputs, result = cached
+        if inputs != set(domains) or not inputs <= self._fresh:
+            return None
+        if not all(deps <= self._fresh for deps in result.values()):
+            return None
+        self._warm = True
+        self._after_dependencies[name] = cached
+        return {domain: set(deps) for domain, deps in result.items()}
+
+    @callback
+    def async_set_after_dependencies(
+        self, name: str, domains: Collection[str], result: dict[str, set[str]]
+    ) -> None:
+        """Remember the after dependencies of domains for the next start."""
+        self._after_dependencies[name] = (set(domains), result)
+
+    @callback
+    def async_set_resolve_time(self, seconds: float) -> float | None:
+        """Set the time it took to resolve the integrations to set up.
+
+        Returns the time it took without the snapshot when the snapshot
+        was used to resolve them.
+        """
+        if not self._warm:
+            self.resolve_time = seconds
+            return None
+        return self.resolve_time
+
+    async def async_save(self) -> None:
+        """Save the integrations resolved during this start."""
+        entries: dict[str, tuple[Path, dict[str, Any], set[str] | None]] = {}
+        for domain, integration in self.hass.data[loader.DATA_INTEGRATIONS].items():
+            if (
+                type(integration) is not loader.Integration
+                or not integration.is_built_in
+            ):
+                continue
+            deps = integration._all_dependencies  # noqa: SLF001
+            entries[domain] = (
+                integration.file_path,
+                _without_loader_keys(integration.manifest),
+                deps if isinstance(deps, set) else None,
+            )
+        installed = set(requirements.async_get_installed_requirements(self.hass))
+        data = await self.hass.async_add_executor_job(self.build, entries, installed)
+        if data == self._data:
+            return
+        await self._store.async_save({"key": self._key, **_to_json(data)})
+        self._data = data
+
+    def build(
+        self,
+        entries: dict[str, tuple[Path, dict[str, Any], set[str] | None]],
+        installed: set[str],
+    ) -> dict[str, Any]:
+        """Build the snapshot of this start.
+
+        Results are only kept when the manifests they were resolved
+        from match the files on disk. This method does blocking I/O and
+        should run in the executor.
+        """
+        custom = self._key["custom"]
+        integrations: dict[str, _IntegrationEntry] = {}
+        # The domains whose manifest in memory matches the one on disk
+        matching = set(custom)
+        for domain, (file_path, manifest, _) in entries.items():
+            if domain in custom:
+                continue
+            if (entry := self._integrations.get(domain)) is None and (
+                entry := _read_integration(file_path)
+            ) is None:
+                continue
+            integrations[domain] = entry
+            if manifest == entry[2]:
+                matching.add(domain)
+        return {
+            "integrations": integrations,
+            "dependencies": {
+                domain: deps
+                for domain, (_, _, deps) in entries.items()
+                if deps is not None and domain in matching and deps <= matching
+            },
+            "after_dependencies": {
+                name: (inputs, result)
+                for name, (inputs, result) in self._after_dependencies.items()
+                if inputs <= matching
+                and all(deps <= matching for deps in result.values())
+            },
+            "requirements": (_site_key(), installed),
+            "resolve_time": self.resolve_time,
+        }
+
+
+async def async_setup(hass: HomeAssistant) -> None:
+    """Load the boot snapshot and save it after startup."""
+    custom = await loader.async_get_custom_components(hass)
+    snapshot = BootSnapshot(hass)
+    integrations = await snapshot.async_load(custom)
+    snapshot.async_prime(integrations, custom)
+    hass.data[DATA_BOOT_SNAPSHOT] = snapshot
+
+    async def _async_save(event: Event[Any]) -> None:
+        """Save the snapshot."""
+        await snapshot.async_save()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
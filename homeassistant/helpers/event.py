@@ -42,6 +42,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.timer_wheel import TimerWheel, get_timer_wheel
 
 from . import frame
 from .device_registry import (
@@ -53,6 +54,7 @@ from .entity_registry import (
     EventEntityRegistryUpdatedData,
 )
 from .ratelimit import KeyedRateLimit
+from .singleton import singleton
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
@@ -75,6 +77,10 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TEMPLATE_REFRESH_SCHEDULER: HassKey[_TemplateRefreshScheduler] = HassKey(
+    "template_refresh_scheduler"
+)
+_TIMER_WHEEL: HassKey[TimerWheel] = HassKey("timer_wheel")
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -981,6 +987,7 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        refresh_window: float | None = None,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
@@ -988,6 +995,7 @@ class TrackTemplateResultInfo:
 
         self._track_templates = track_templates
         self._has_super_template = has_super_template
+        self._refresh_window = refresh_window
 
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
@@ -1006,6 +1014,11 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        # The templates state changes triggered to render when the
+        # refresh window ends, with the event that triggered them.
+        self._pending_events: dict[Template, Event[EventStateChangedData]] = {}
+        self._pending_event: Event[EventStateChangedData] | None = None
+        self._cancel_pending_refresh: CALLBACK_TYPE | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -1060,7 +1073,11 @@ class TrackTemplateResultInfo:
                     log_fn(logging.ERROR, str(info.exception))
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._refresh
+            if self._refresh_window is None
+            else self._async_queue_refresh,
         )
         self._update_time_listeners()
         _LOGGER.debug(
@@ -1120,12 +1137,80 @@ class TrackTemplateResultInfo:
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
+        self._pending_events.clear()
+        self._pending_event = None
+        if self._cancel_pending_refresh is not None:
+            self._cancel_pending_refresh()
+            self._cancel_pending_refresh = None
 
     @callback
     def async_refresh(self) -> None:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def _async_queue_refresh(self, event: Event[EventStateChangedData]) -> None:
+        """Queue the templates a state change triggers for rendering.
+
+        The templates are rendered when the refresh window ends, so a
+        burst of state changes renders each template once.
+        """
+        pending_events = self._pending_events
+        for track_template_ in self._track_templates:
+            template = track_template_.template
+            if (info := self._info.get(template)) is None or not (
+                _event_triggers_rerender(event, info)
+            ):
+                continue
+            # Keep an event that is not rate limited so the
+            # template is rendered without waiting for the limit
+            if (
+                template not in pending_events
+                or _rate_limit_for_event(event, info, track_template_) is None
+            ):
+                pending_events[template] = event
+            self._pending_event = event
+        if not pending_events:
+            return
+        if not self._refresh_window:
+            _async_get_template_refresh_scheduler(self.hass).async_schedule(self)
+        elif self._cancel_pending_refresh is None:
+            self._cancel_pending_refresh = async_call_later(
+                self.hass, self._refresh_window, self._async_refresh_window_ended
+            )
+
+    @callback
+    def _async_refresh_window_ended(self, _now: datetime) -> None:
+        """Render the templates when the refresh window ended."""
+        self._cancel_pending_refresh = None
+        self.async_refresh_pending()
+
+    @callback
+    def async_refresh_pending(self) -> None:
+        """Render the templates state changes triggered."""
+        if (
+            not (pending_events := self._pending_events)
+            or (event := self._pending_event) is None
+        ):
+            return
+        self._pending_events = {}
+        self._pending_event = None
+        # Render in the order the state changes arrived, as the
+        # updates would have been without batching
+        order = {template: idx for idx, template in enumerate(pending_events)}
+        self._refresh(
+            event,
+            sorted(
+                (
+                    track_template_
+                    for track_template_ in self._track_templates
+                    if track_template_.template in order
+                ),
+                key=lambda track_template_: order[track_template_.template],
+            ),
+            template_events=pending_events,
+        )
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1222,6 +1307,7 @@ class TrackTemplateResultInfo:
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        template_events: Mapping[Template, Event[EventStateChangedData]] | None = None,
     ) -> None:
         """Refresh the template.
 
@@ -1234,6 +1320,9 @@ class TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        template_events optionally maps templates to the event that
+        triggered them when a batch of events is refreshed.
         """
         updates: list[TrackTemplateResult] = []
         info_changed = False
@@ -1246,7 +1335,13 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template,
+                now,
+                template_events.get(super_template.template, event)
+                if template_events and event
+                else event,
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1269,6 +1364,7 @@ class TrackTemplateResultInfo:
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
                 event = None
+                template_events = None
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
@@ -1277,7 +1373,13 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_,
+                    now,
+                    template_events.get(track_template_.template, event)
+                    if template_events and event
+                    else event,
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1313,6 +1415,48 @@ class TrackTemplateResultInfo:
         self.hass.async_run_hass_job(self._job, event, updates)
 
 
+@callback
+@singleton(_TEMPLATE_REFRESH_SCHEDULER)
+def _async_get_template_refresh_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRefreshScheduler:
+    """Return the scheduler of template refreshes."""
+    return _TemplateRefreshScheduler(hass)
+
+
+class _TemplateRefreshScheduler:
+    """Refresh templates once per iteration of the event loop.
+
+    Used by trackers with a refresh window of 0. State changes are
+    dispatched to the trackers in separate loop callbacks, so trackers
+    queue the templates to render and they are rendered by a single
+    task after all state changes of the iteration have been dispatched.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._pending: dict[TrackTemplateResultInfo, None] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_schedule(self, info: TrackTemplateResultInfo) -> None:
+        """Schedule the pending templates of a tracker to be rendered."""
+        self._pending[info] = None
+        if self._task is None:
+            self._task = self.hass.async_create_task_internal(
+                self._async_refresh(), "template refresh", eager_start=False
+            )
+
+    async def _async_refresh(self) -> None:
+        """Render the pending templates of the trackers."""
+        self._task = None
+        pending = self._pending
+        self._pending = {}
+        for info in pending:
+            info.async_refresh_pending()
+
+
 type TrackTemplateResultListener = Callable[
     [
         Event[EventStateChangedData] | None,
@@ -1341,6 +1485,7 @@ def async_track_template_result(
     strict: bool = False,
     log_fn: Callable[[int, str], None] | None = None,
     has_super_template: bool = False,
+    refresh_window: float | None = None,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1371,12 +1516,20 @@ def async_track_template_result(
         has_super_template:
             When set to True, the first template will block rendering of other
             templates if it doesn't render as True.
+        refresh_window:
+            If not None, state changes are not rendered as they happen but
+            collected for this many seconds, and each template they trigger
+            is rendered once. With 0 the templates are rendered once per
+            iteration of the event loop. The action is called with the
+            last event of the window.
 
     Returns:
         Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, refresh_window
+    )
     tracker.async_setup(strict=strict, log_fn=log_fn)
     return tracker
 
@@ -1494,9 +1647,9 @@ class _TrackPointUTCTime:
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        hass = self.hass
+        self._cancel_callback = _async_loop_call_at(
+            hass, hass.loop.time() + self.expected_fire_timestamp - time.time(), self
         )
 
     @callback
@@ -1515,8 +1668,10 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            hass = self.hass
+            self._cancel_callback = _async_loop_call_at(
+                hass, hass.loop.time() + delta, self
+            )
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
@@ -1564,6 +1719,27 @@ def _run_async_call_action(
     hass.async_run_hass_job(job, time_tracker_utcnow())
 
 
+@callback
+def async_enable_timer_wheel(hass: HomeAssistant) -> None:
+    """Schedule the timers of the helpers on a timer wheel.
+
+    The timer wheel keeps the heap of the event loop small when many
+    timers are scheduled. The timers are scheduled with loop.call_at
+    unless this is called.
+    """
+    hass.data[_TIMER_WHEEL] = get_timer_wheel(hass.loop)
+
+
+@callback
+def _async_loop_call_at(
+    hass: HomeAssistant, when: float, target: Callable[..., Any], *args: Any
+) -> asyncio.TimerHandle:
+    """Schedule target at loop time when on the loop or the timer wheel."""
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is not None:
+        return wheel.call_at(when, target, *args)
+    return hass.loop.call_at(when, target, *args)
+
+
 @callback
 @bind_hass
 def async_call_at(
@@ -1581,7 +1757,9 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
-    return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
+    return _async_loop_call_at(
+        hass, loop_time, _run_async_call_action, hass, job
+    ).cancel
 
 
 @callback
@@ -1603,8 +1781,9 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    loop = hass.loop
-    return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
+    return _async_loop_call_at(
+        hass, hass.loop.time() + delay, _run_async_call_action, hass, job
+    ).cancel
 
 
 call_later = threaded_listener_factory(async_call_later)
@@ -1643,9 +1822,11 @@ class _TrackTimeInterval:
         if TYPE_CHECKING:
             assert self._track_job is not None
         hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+        self._timer_handle = _async_loop_call_at(
+            hass,
+            hass.loop.time() + self.seconds,
+            self._interval_listener,
+            self._track_job,
         )
 
     @callback
@@ -1967,11 +2148,19 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
 
     if info.filter(entity_id):
-        return True
+        # Only the attributes changed and the template did not read them
+        return (
+            old_state is None
+            or new_state is None
+            or old_state.state != new_state.state
+            or not info.reads_only_state(entity_id)
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
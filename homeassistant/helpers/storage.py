@@ -7,11 +7,12 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from propcache.api import cached_property
 
@@ -33,8 +34,10 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
+from .json import json_bytes, json_fragment
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -48,6 +51,12 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The key of the records of a list that are journaled one by one
+JOURNAL_RECORD_ID = "id"
+# The key of the snapshot the changes in the journal were written for
+JOURNAL_GENERATION = "journal_generation"
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -139,9 +148,13 @@ class _StoreManager:
 
     @callback
     def async_fetch(
-        self, key: str
+        self, key: str, journal: bool = False
     ) -> tuple[bool, json_util.JsonValueType | None] | None:
-        """Fetch data from cache."""
+        """Fetch data from cache.
+
+        The data of a store in journal mode is only complete with its
+        journal, so it is a cache miss if the journal exists.
+        """
         #
         # If the key is invalidated, we don't need to check the cache
         # If async_initialize has not been called yet, we don't know
@@ -159,6 +172,10 @@ class _StoreManager:
             _LOGGER.debug("%s: Cache miss", key)
             return None
 
+        if journal and f"{key}{JOURNAL_SUFFIX}" in self._files:
+            _LOGGER.debug("%s: Cache miss, has a journal", key)
+            return None
+
         # If async_initialize has been called and the key is not in self._files
         # then the file does not exist
         if key not in self._files:
@@ -226,6 +243,317 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+def _apply_journal_change(data: dict[str, Any], change: dict[str, Any]) -> None:
+    """Apply a change of the journal to the data.
+
+    Applying a change again has no effect.
+    """
+    updates: dict[str, Any] = dict(change["values"])
+    for key, records_change in change["records"].items():
+        removed = set(records_change["remove"])
+        records = [
+            record for record in data[key] if record[JOURNAL_RECORD_ID] not in removed
+        ]
+        index = {record[JOURNAL_RECORD_ID]: idx for idx, record in enumerate(records)}
+        for record in records_change["set"]:
+            if (idx := index.get(record[JOURNAL_RECORD_ID])) is None:
+                index[record[JOURNAL_RECORD_ID]] = len(records)
+                records.append(record)
+            else:
+                records[idx] = record
+        updates[key] = records
+    data.update(updates)
+
+
+def _serialized_bytes(value: bytes | dict[str, bytes]) -> bytes:
+    """Return a serialized value or list of records."""
+    if isinstance(value, bytes):
+        return value
+    return b"[" + b",".join(value.values()) + b"]"
+
+
+class _StoreJournal:
+    """Append the changes of a store to a journal next to its file.
+
+    The file written by the store is the snapshot the journal is applied
+    to. Top level values of the data are journaled when they change,
+    lists of records with an id are journaled record by record. The
+    journal is compacted into the snapshot when it grows larger than the
+    snapshot, so a change writes about twice its size on average.
+
+    A change is a line of JSON that is only used when it was written
+    completely. Every snapshot gets a new generation and a change is
+    only applied to the snapshot of its generation, so a journal that
+    is left behind when writing the snapshot is interrupted is ignored.
+    """
+
+    def __init__(self, encoder: type[JSONEncoder] | None) -> None:
+        """Initialize the journal."""
+        self._dump: Callable[[Any], bytes] = json_bytes
+        if encoder and encoder is not json_helper.JSONEncoder:
+            self._dump = lambda obj: json.dumps(obj, cls=encoder).encode()
+        # The version of the data on disk, None if the next write must
+        # compact the journal into the snapshot
+        self._version: tuple[int, int] | None = None
+        # The generation of the snapshot on disk
+        self._generation: str | None = None
+        # The serialized values and lists of records of the data on disk
+        self._data: dict[str, bytes | dict[str, bytes]] = {}
+        # The serialized fragments of the lists of records by their id()
+        self._fragments: dict[str, dict[int, tuple[json_fragment, str, bytes]]] = {}
+        self._snapshot_size = 0
+        self._size = 0
+        # The data of a write that is compacted into the snapshot
+        self._pending: (
+            tuple[tuple[int, int], dict[str, bytes | dict[str, bytes]]] | None
+        ) = None
+
+    @property
+    def size(self) -> int:
+        """Return the size of the journal if it can be compacted."""
+        return 0 if self._version is None else self._size
+
+    def load(self, path: str) -> json_util.JsonValueType:
+        """Load the snapshot and apply the journal.
+
+        This method does blocking I/O and should run in the executor.
+        """
+        self._version = None
+        data = json_util.load_json(path)
+        if not isinstance(data, dict) or not isinstance(
+            content := data.get("data"), dict
+        ):
+            return data
+        version = cast(tuple[int, int], (data["version"], data.get("minor_version", 1)))
+        generation = cast(str | None, data.get(JOURNAL_GENERATION))
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", "rb") as file:
+                journal = file.read()
+        except FileNotFoundError:
+            journal = b""
+        complete = True
+        for line in journal.splitlines(keepends=True):
+            # The write of a change without a line end was interrupted
+            if not line.endswith(b"\n"):
+                _LOGGER.warning("Ignoring incomplete change in journal of %s", path)
+                complete = False
+                break
+            try:
+                change = json_util.json_loads_object(line)
+                if (
+                    change.get("generation") != generation
+                    or (change["version"], change["minor_version"]) != version
+                ):
+                    # Written for a snapshot that was replaced
+                    complete = False
+                    continue
+                _apply_journal_change(content, change)
+            except (ValueError, LookupError, TypeError) as err:
+                _LOGGER.warning("Ignoring the end of the journal of %s: %s", path, err)
+                complete = False
+                break
+        if complete:
+            self._version = version
+            self._generation = generation
+            self._data = self._serialize(content)
+            self._snapshot_size = os.path.getsize(path)
+            self._size = len(journal)
+        return data
+
+    def _serialize(self, data: dict[str, Any]) -> dict[str, bytes | dict[str, bytes]]:
+        """Serialize the values and lists of records of the data."""
+        return {key: self._serialize_value(key, value) for key, value in data.items()}
+
+    def _serialize_value(self, key: str, value: Any) -> bytes | dict[str, bytes]:
+        """Serialize a value or a list of records by id."""
+        if not isinstance(value, list):
+            return self._dump(value)
+        old = self._data.get(key)
+        known: dict[bytes, str] | None = None
+        # Fragments can't change so they are only serialized once
+        cached = self._fragments.get(key, {})
+        fragments: dict[int, tuple[json_fragment, str, bytes]] = {}
+        records: dict[str, bytes] = {}
+        for record in value:
+            if (fragment := cached.get(id(record))) is not None and fragment[
+                0
+            ] is record:
+                record_id, serialized = fragment[1], fragment[2]
+            else:
+                serialized = self._dump(record)
+                # Without cached fragments the ids of the records that
+                # did not change are looked up instead of decoded
+                if known is None:
+                    known = (
+                        {old_record: old_id for old_id, old_record in old.items()}
+                        if not cached and isinstance(old, dict)
+                        else {}
+                    )
+                if (known_id := known.get(serialized)) is not None:
+                    record_id = known_id
+                else:
+                    if not serialized.startswith(b"{"):
+                        return self._dump(value)
+                    parsed_id = json_util.json_loads_object(serialized).get(
+                        JOURNAL_RECORD_ID
+                    )
+                    if not isinstance(parsed_id, str):
+                        return self._dump(value)
+                    record_id = parsed_id
+            if record_id in records:
+                return self._dump(value)
+            records[record_id] = serialized
+            if type(record) is json_fragment:
+                fragments[id(record)] = (record, record_id, serialized)
+        self._fragments[key] = fragments
+        return records
+
+    def append(
+        self, path: str, data: dict[str, Any], private: bool, fsync: bool
+    ) -> bool:
+        """Append the changes of the data to the journal.
+
+        Returns False if the data must be written to the snapshot
+        instead. This method does blocking I/O and should run in the
+        executor.
+        """
+        version = (data["version"], data["minor_version"])
+        # The journal must be compacted if this write fails
+        current_version, self._version = self._version, None
+        if not isinstance(data["data"], dict):
+            return False
+        try:
+            serialized = self._serialize(data["data"])
+        except TypeError:
+            # Let the snapshot report the data that can't be serialized
+            return False
+        line = None
+        if version == current_version:
+            line = self._change(version, serialized)
+        if line is None or self._size + len(line) > self._snapshot_size:
+            self._pending = (version, serialized)
+            return False
+        if line:
+            journal_path = f"{path}{JOURNAL_SUFFIX}"
+            _LOGGER.debug("Appending %s bytes to %s", len(line), journal_path)
+            try:
+                fd = os.open(
+                    journal_path,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o600 if private else 0o644,
+                )
+                try:
+                    written = 0
+                    while written < len(line):
+                        written += os.write(fd, line[written:])
+                    if fsync:
+                        os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as error:
+                _LOGGER.exception("Appending to journal failed: %s", journal_path)
+                raise WriteError(error) from error
+            self._size += len(line)
+        self._version = version
+        self._data = serialized
+        return True
+
+    def _change(
+        self, version: tuple[int, int], data: dict[str, bytes | dict[str, bytes]]
+    ) -> bytes | None:
+        """Return the change of the data or None if it can't be journaled."""
+        if list(self._data) != list(data):
+            return None
+        values: dict[str, json_fragment] = {}
+        records: dict[str, dict[str, list[Any]]] = {}
+        for key, new in data.items():
+            old = self._data[key]
+            if isinstance(new, bytes) or isinstance(old, bytes):
+                if new != old:
+                    values[key] = json_fragment(_serialized_bytes(new))
+                continue
+            # Records that are not removed must keep their position
+            # and new records must be added at the end
+            old_ids = list(old)
+            new_ids = list(new)
+            removed: list[str] = []
+            if new_ids[: len(old_ids)] != old_ids:
+                kept = [record_id for record_id in old_ids if record_id in new]
+                if new_ids[: len(kept)] != kept:
+                    values[key] = json_fragment(_serialized_bytes(new))
+                    continue
+                removed = [record_id for record_id in old_ids if record_id not in new]
+            changed = [
+                json_fragment(record)
+                for record_id, record in new.items()
+                if old.get(record_id) != record
+            ]
+            if changed or removed:
+                records[key] = {"set": changed, "remove": removed}
+        if not values and not records:
+            return b""
+        return (
+            json_bytes(
+                {
+                    "generation": self._generation,
+                    "version": version[0],
+                    "minor_version": version[1],
+                    "values": values,
+                    "records": records,
+                }
+            )
+            + b"\n"
+        )
+
+    def compacted(self, path: str, generation: str) -> None:
+        """Remove the journal after the data was written to the snapshot.
+
+        This method does blocking I/O and should run in the executor.
+        """
+        with suppress(FileNotFoundError):
+            os.unlink(f"{path}{JOURNAL_SUFFIX}")
+        self._snapshot_size = os.path.getsize(path)
+        self._size = 0
+        self._generation = generation
+        if self._pending is not None:
+            (self._version, self._data), self._pending = self._pending, None
+
+    def compact(self, path: str, key: str, private: bool, atomic_writes: bool) -> None:
+        """Compact the journal into the snapshot.
+
+        This method does blocking I/O and should run in the executor.
+        """
+        if self._version is None or not self._size:
+            return
+        _LOGGER.debug("Compacting the journal of %s", path)
+        generation = random_uuid_hex()
+        json_helper.save_json(
+            path,
+            {
+                "version": self._version[0],
+                "minor_version": self._version[1],
+                "key": key,
+                JOURNAL_GENERATION: generation,
+                "data": {
+                    data_key: json_fragment(_serialized_bytes(value))
+                    for data_key, value in self._data.items()
+                },
+            },
+            private,
+            atomic_writes=atomic_writes,
+        )
+        self.compacted(path, generation)
+
+    def remove(self, path: str) -> None:
+        """Remove the journal.
+
+        This method does blocking I/O and should run in the executor.
+        """
+        self._version = None
+        with suppress(FileNotFoundError):
+            os.unlink(f"{path}{JOURNAL_SUFFIX}")
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -239,10 +567,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         *,
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
+        journal: bool = False,
         minor_version: int = 1,
         read_only: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        In journal mode the changes of a write are appended to a journal
+        which is compacted into the file when it grows larger than it.
+        The file is only complete with its journal, so a store must
+        always be created in journal mode once it used it. Readers of
+        the file that do not apply the journal, such as older versions,
+        miss the changes in it, so journal mode is opt-in.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -251,11 +588,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._data: dict[str, Any] | None = None
         self._delay_handle: asyncio.TimerHandle | None = None
         self._unsub_final_write_listener: CALLBACK_TYPE | None = None
+        self._unsub_compact_listener: CALLBACK_TYPE | None = None
         self._write_lock = asyncio.Lock()
         self._load_future: asyncio.Future[_T | None] | None = None
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journal = _StoreJournal(encoder) if journal else None
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
 
@@ -321,15 +660,24 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
-        elif cache := self._manager.async_fetch(self.key):
+        elif cache := self._manager.async_fetch(
+            self.key, journal=self._journal is not None
+        ):
             exists, data = cache
             if not exists:
                 return None
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                if self._journal is None:
+                    data = await self.hass.async_add_executor_job(
+                        json_util.load_json, self.path
+                    )
+                else:
+                    # The journal must not change while it is applied
+                    async with self._write_lock:
+                        data = await self.hass.async_add_executor_job(
+                            self._journal.load, self.path
+                        )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -541,6 +889,41 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal is not None and self._journal.size:
+                if self.hass.state is CoreState.final_write:
+                    await self._async_compact_journal()
+                else:
+                    self._async_ensure_compact_listener()
+
+    @callback
+    def _async_ensure_compact_listener(self) -> None:
+        """Ensure that the journal is compacted into the file when we quit."""
+        if self._unsub_compact_listener is None:
+            self._unsub_compact_listener = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE,
+                self._async_callback_compact,
+            )
+
+    async def _async_callback_compact(self, _event: Event) -> None:
+        """Compact the journal because Home Assistant is in final write state."""
+        self._unsub_compact_listener = None
+        async with self._write_lock:
+            await self._async_compact_journal()
+
+    async def _async_compact_journal(self) -> None:
+        """Compact the journal into the file."""
+        assert self._journal is not None
+        try:
+            await self.hass.async_add_executor_job(
+                self._journal.compact,
+                self.path,
+                self.key,
+                self._private,
+                self._atomic_writes,
+            )
+        except (json_util.SerializationError, WriteError) as err:
+            _LOGGER.error("Error compacting journal for %s: %s", self.key, err)
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -551,6 +934,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        generation: str | None = None
+        if self._journal is not None:
+            if self._journal.append(path, data, self._private, self._atomic_writes):
+                return
+            # The journal left behind if removing it is interrupted
+            # must not be applied to the new snapshot
+            data[JOURNAL_GENERATION] = generation = random_uuid_hex()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -559,6 +950,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self._journal is not None and generation is not None:
+            self._journal.compacted(path, generation)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -572,3 +965,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal is not None:
+            if self._unsub_compact_listener is not None:
+                self._unsub_compact_listener()
+                self._unsub_compact_listener = None
+            await self.hass.async_add_executor_job(self._journal.remove, self.path)
@@ -23,6 +23,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import perf_counter
 from types import CodeType, TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -95,6 +96,9 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .template_bytecode_cache import DATA_TEMPLATE_BYTECODE_CACHE
+from .template_profiler import DATA_TEMPLATE_PROFILER, TemplateProfiler
+from .trace import trace_id_get
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -136,6 +140,8 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "object_id",
     "name",
 }
+# State attributes that do not change when only the attributes change
+_STATE_ONLY_STATE_ATTRIBUTES = {"state", "domain", "object_id"}
 
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
@@ -391,6 +397,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entities_attributes",
         "exception",
         "filter",
         "filter_lifecycle",
@@ -414,6 +421,8 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities of which more than the state was read
+        self.entities_attributes: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -426,6 +435,7 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entities_attributes={self.entities_attributes}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -456,6 +466,20 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def reads_only_state(self, entity_id: str) -> bool:
+        """Return if the template only read the state of the entity.
+
+        Entities matched by a domain or all states may have been read in
+        any way, so this is only known for specifically referenced ones.
+        """
+        return (
+            self.exception is None
+            and not self.all_states
+            and entity_id in self.entities
+            and entity_id not in self.entities_attributes
+            and split_entity_id(entity_id)[0] not in self.domains
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -469,6 +493,7 @@ class RenderInfo:
 
     def _freeze_sets(self) -> None:
         self.entities = frozenset(self.entities)
+        self.entities_attributes = frozenset(self.entities_attributes)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
@@ -638,7 +663,13 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (
+                self.hass is None
+                or (profiler := self.hass.data.get(DATA_TEMPLATE_PROFILER)) is None
+            ):
+                render_result = _render_with_context(self.template, compiled, **kwargs)
+            else:
+                render_result = self._render_profiled(profiler, compiled, kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -654,6 +685,21 @@ class Template:
 
         return self._parse_result(render_result)
 
+    def _render_profiled(
+        self,
+        profiler: TemplateProfiler,
+        compiled: jinja2.Template,
+        variables: dict[str, Any],
+    ) -> str:
+        """Render the template and record the time it took."""
+        start = perf_counter()
+        try:
+            return _render_with_context(self.template, compiled, **variables)
+        finally:
+            profiler.async_record(
+                self.template, _render_owner(variables), perf_counter() - start
+            )
+
     def _parse_result(self, render_result: str) -> Any:
         """Parse the result."""
         try:
@@ -856,9 +902,21 @@ class Template:
         self._log_fn = log_fn
         env = self._env
 
+        # Templates with the same source share the compiled template of
+        # their environment, environments with a custom log function
+        # are not shared.
+        if (
+            log_fn is None
+            and (compiled := env.compiled_cache.get(self.template)) is not None
+        ):
+            self._compiled = compiled
+            return compiled
+
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if log_fn is None:
+            env.compiled_cache[self.template] = self._compiled
 
         return self._compiled
 
@@ -1052,6 +1110,12 @@ class TemplateStateBase(State):
     def _collect_state(self) -> None:
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.entities_attributes.add(self._entity_id)  # type: ignore[attr-defined]
+
+    def _collect_state_only(self) -> None:
+        """Collect a read that does not change when only the attributes change."""
+        if self._collect and (render_info := _render_info.get()):
+            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -1061,6 +1125,8 @@ class TemplateStateBase(State):
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
                 render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if item not in _STATE_ONLY_STATE_ATTRIBUTES:
+                    render_info.entities_attributes.add(self._entity_id)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1079,7 +1145,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_only()
         return self._state.state
 
     @property
@@ -1115,13 +1181,13 @@ class TemplateStateBase(State):
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state_only()
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state_only()
         return self._state.object_id
 
     @property
@@ -1171,6 +1237,8 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        # The representation includes the attributes
+        self._collect_state()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -1203,6 +1271,8 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
         entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        # The caller may read more than the state
+        entity_collect.entities_attributes.add(entity_id)  # type: ignore[attr-defined]
 
 
 def _state_generator(
@@ -2977,6 +3047,18 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _render_owner(variables: dict[str, Any]) -> str | None:
+    """Return the entity or automation a template is rendered for."""
+    this = variables.get("this")
+    if isinstance(this, TemplateStateBase):
+        return this._entity_id  # noqa: SLF001
+    if isinstance(this, State) and this.entity_id:
+        return this.entity_id
+    if (trace_id := trace_id_get()) is not None:
+        return trace_id[0]
+    return None
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -3096,9 +3178,13 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._compile_flags = (bool(limited), bool(strict))
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.compiled_cache: weakref.WeakValueDictionary[str, jinja2.Template] = (
+            weakref.WeakValueDictionary()
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.add_extension("jinja2.ext.do")
 
@@ -3514,7 +3600,18 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is None
+            or not isinstance(source, str)
+            or (bytecode_cache := self.hass.data.get(DATA_TEMPLATE_BYTECODE_CACHE))
+            is None
+        ):
+            compiled = super().compile(source)
+        elif (cached := bytecode_cache.get(source, self._compile_flags)) is not None:
+            compiled = cached
+        else:
+            compiled = super().compile(source)
+            bytecode_cache.set(source, self._compile_flags, compiled)
         self.template_cache[source] = compiled
         return compiled
 
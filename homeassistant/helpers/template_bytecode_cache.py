@@ -0,0 +1,148 @@
+"""Persistent cache of the compiled code of templates.
+
+Compiling a template parses the Jinja source, generates Python source
+and compiles that, which adds up to seconds at startup with thousands
+of templates. The code objects are kept in a file under .storage, keyed
+by a hash of the template source and the environment flags, so the next
+start can load them with marshal instead of compiling the templates.
+
+The generated code depends on the versions of Home Assistant, Jinja and
+Python so the cache is discarded when any of them changes.
+"""
+
+from __future__ import annotations
+
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+import logging
+import marshal
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+import jinja2
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
+    __version__,
+)
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.hass_dict import HassKey
+
+from .storage import STORAGE_DIR
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TEMPLATE_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey(
+    "template.bytecode_cache"
+)
+
+STORAGE_KEY = "core.template_bytecode"
+CACHE_VERSION = 1
+
+
+def _cache_versions() -> tuple[int, str, str, bytes]:
+    """Return the versions the compiled code depends on."""
+    return (CACHE_VERSION, __version__, jinja2.__version__, MAGIC_NUMBER)
+
+
+class TemplateBytecodeCache:
+    """Cache the compiled code of templates across restarts."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache."""
+        self._path = path
+        # The code loaded from disk, or written by the last save
+        self._saved: dict[bytes, CodeType] = {}
+        # The code used since the start, only this is written
+        self._used: dict[bytes, CodeType] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        """Return the number of templates used since the start."""
+        return len(self._used)
+
+    @staticmethod
+    def _key(source: str, flags: tuple[bool, bool]) -> bytes:
+        """Return the key of a template compiled with flags."""
+        return sha256(f"{flags[0]:d}{flags[1]:d}{source}".encode()).digest()
+
+    def get(self, source: str, flags: tuple[bool, bool]) -> CodeType | None:
+        """Return the cached code of a template."""
+        key = self._key(source, flags)
+        if (code := self._used.get(key)) is None and (
+            code := self._saved.get(key)
+        ) is not None:
+            self._used[key] = code
+        return code
+
+    def set(self, source: str, flags: tuple[bool, bool], code: CodeType) -> None:
+        """Cache the code of a template."""
+        self._used[self._key(source, flags)] = code
+        self._dirty = True
+
+    def load(self) -> None:
+        """Load the cache from disk.
+
+        This method does blocking I/O and should run in the executor.
+        """
+        try:
+            data = marshal.loads(self._path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Discarding template bytecode cache: %s", err)
+            return
+        if (
+            not isinstance(data, tuple)
+            or len(data) != 2
+            or data[0] != _cache_versions()
+            or not isinstance(data[1], dict)
+        ):
+            _LOGGER.debug("Discarding template bytecode cache of another version")
+            return
+        self._saved = data[1]
+
+    def save(self, prune: bool) -> None:
+        """Save the cache to disk if it changed.
+
+        When prune is set the templates that were not used since the
+        start are dropped. This method does blocking I/O and should run
+        in the executor.
+        """
+        if not self._dirty and not (prune and len(self._used) < len(self._saved)):
+            return
+        used = self._used.copy()
+        if not prune:
+            used = {**self._saved, **used}
+        self._dirty = False
+        try:
+            self._path.parent.mkdir(exist_ok=True)
+            write_utf8_file(
+                str(self._path),
+                marshal.dumps((_cache_versions(), used)),
+                private=True,
+                mode="wb",
+            )
+        except (OSError, WriteError) as err:
+            _LOGGER.debug("Could not save template bytecode cache: %s", err)
+            return
+        self._saved = used
+
+
+async def async_setup(hass: HomeAssistant) -> None:
+    """Load the template bytecode cache and save it after startup."""
+    cache = TemplateBytecodeCache(Path(hass.config.path(STORAGE_DIR, STORAGE_KEY)))
+    await hass.async_add_executor_job(cache.load)
+    hass.data[DATA_TEMPLATE_BYTECODE_CACHE] = cache
+
+    async def _async_save(event: Event[Any]) -> None:
+        """Save the cache, dropping unused templates on shutdown."""
+        await hass.async_add_executor_job(
+            cache.save, event.event_type == EVENT_HOMEASSISTANT_FINAL_WRITE
+        )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save)
@@ -0,0 +1,97 @@
+"""Profile the time spent rendering templates.
+
+While the profiler is running every render of a template records its
+duration and the entity or automation it was rendered for, so the
+templates that take the most time in the event loop can be found.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from heapq import nlargest
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_TEMPLATE_PROFILER: HassKey[TemplateProfiler] = HassKey("template.profiler")
+
+# The number of durations kept per template to calculate percentiles
+MAX_SAMPLES = 1000
+# The number of owners kept per template
+MAX_OWNERS = 20
+
+DEFAULT_LIMIT = 10
+
+
+class TemplateRenderStats:
+    """Render statistics of a template."""
+
+    __slots__ = ("count", "owners", "samples", "total")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.count = 0
+        self.total = 0.0
+        self.samples: deque[float] = deque(maxlen=MAX_SAMPLES)
+        self.owners: set[str] = set()
+
+    def percentile(self, percent: float) -> float:
+        """Return a percentile of the recent render durations."""
+        if not self.samples:
+            return 0.0
+        samples = sorted(self.samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+
+class TemplateProfiler:
+    """Collect render statistics of templates."""
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self._stats: dict[str, TemplateRenderStats] = {}
+
+    def __len__(self) -> int:
+        """Return the number of profiled templates."""
+        return len(self._stats)
+
+    @callback
+    def async_record(self, template: str, owner: str | None, duration: float) -> None:
+        """Record a render of a template."""
+        if (stats := self._stats.get(template)) is None:
+            stats = self._stats[template] = TemplateRenderStats()
+        stats.count += 1
+        stats.total += duration
+        stats.samples.append(duration)
+        if owner is not None and len(stats.owners) < MAX_OWNERS:
+            stats.owners.add(owner)
+
+    @callback
+    def async_top(self, limit: int = DEFAULT_LIMIT) -> list[dict[str, Any]]:
+        """Return the templates with the most total render time."""
+        top = nlargest(limit, self._stats.items(), key=lambda item: item[1].total)
+        return [
+            {
+                "template": template,
+                "count": stats.count,
+                "total": stats.total,
+                "mean": stats.total / stats.count,
+                "p99": stats.percentile(99),
+                "owners": sorted(stats.owners),
+            }
+            for template, stats in top
+        ]
+
+
+@callback
+def async_start(hass: HomeAssistant) -> TemplateProfiler:
+    """Start profiling template renders."""
+    if (profiler := hass.data.get(DATA_TEMPLATE_PROFILER)) is None:
+        profiler = hass.data[DATA_TEMPLATE_PROFILER] = TemplateProfiler()
+    return profiler
+
+
+@callback
+def async_stop(hass: HomeAssistant) -> TemplateProfiler | None:
+    """Stop profiling template renders and return the profiler."""
+    return hass.data.pop(DATA_TEMPLATE_PROFILER, None)
@@ -7,7 +7,8 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
@@ -16,6 +17,7 @@ import logging
 import os
 import pathlib
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast, final
@@ -42,12 +44,16 @@ from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
 from .helpers.typing import UNDEFINED, UndefinedType
 from .util.async_ import create_eager_task
+from .util.executor import InterruptibleThreadPoolExecutor
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
+from .util.startup_trace import CATEGORY_IMPORT, DATA_STARTUP_TRACER, trace_span
 
 if TYPE_CHECKING:
     # The relative imports below are guarded by TYPE_CHECKING
     # because they would cause a circular import otherwise.
+    from concurrent.futures import Executor
+
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
     from .helpers.typing import ConfigType
@@ -83,6 +89,10 @@ BASE_PRELOAD_PLATFORMS = [
     "trigger",
 ]
 
+# The preload platforms that are kept in lazy platform mode.
+# The config_flow platform is imported by every setup of a config entry.
+ESSENTIAL_PRELOAD_PLATFORMS = ["config_flow"]
+
 
 @dataclass
 class BlockedIntegration:
@@ -135,6 +145,7 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_PARALLEL_IMPORTS: HassKey[bool] = HassKey("parallel_imports")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -152,6 +163,14 @@ IMPORT_EVENT_LOOP_WARNING = (
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+# The number of threads importing integrations in parallel at startup
+IMPORT_SCHEDULER_WORKERS = 4
+
+# Locks of the integration packages imported in executor threads,
+# shared by all instances in the process
+_IMPORT_LOCKS: dict[str, threading.RLock] = {}
+_IMPORT_LOCKS_LOCK = threading.Lock()
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -647,6 +666,39 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+@callback
+def async_enable_parallel_imports(hass: HomeAssistant) -> None:
+    """Import the integrations to set up in parallel at startup.
+
+    The integrations are imported by the import scheduler ahead of their
+    setup, next to the import executor.
+
+    This must be called before the integrations are set up.
+    """
+    hass.data[DATA_PARALLEL_IMPORTS] = True
+
+
+@callback
+def async_enable_lazy_platforms(hass: HomeAssistant) -> None:
+    """Only preload the platforms that loaded integrations process.
+
+    The base preload platforms are preloaded for every integration even
+    when the integration that processes them is never loaded. In lazy
+    mode only the essential platforms are preloaded until an integration
+    registers a platform with async_register_preload_platform. The other
+    platforms are imported when they are first requested.
+
+    This must be called before any integration is loaded.
+    """
+    preload_platforms = hass.data[DATA_PRELOAD_PLATFORMS]
+    preload_platforms[:] = [
+        platform_name
+        for platform_name in preload_platforms
+        if platform_name in ESSENTIAL_PRELOAD_PLATFORMS
+        or platform_name not in BASE_PRELOAD_PLATFORMS
+    ]
+
+
 @final  # Final to allow direct checking of the type instead of using isinstance
 class Integration:
     """An integration in Home Assistant."""
@@ -988,8 +1040,10 @@ class Integration:
             self.pkg_path not in sys.modules
             or (self.config_flow and f"{self.pkg_path}.config_flow" not in sys.modules)
         )
+        tracer = self.hass.data.get(DATA_STARTUP_TRACER)
         if not load_executor:
-            comp = self._get_component()
+            with trace_span(tracer, "import", CATEGORY_IMPORT, domain, executor=False):
+                comp = self._get_component()
             if debug:
                 _LOGGER.debug(
                     "Component %s import took %.3f seconds (loaded_executor=False)",
@@ -1000,20 +1054,21 @@ class Integration:
 
         self._component_future = self.hass.loop.create_future()
         try:
-            try:
-                comp = await self.hass.async_add_import_executor_job(
-                    self._get_component, True
-                )
-            except ModuleNotFoundError:
-                raise
-            except ImportError as ex:
-                load_executor = False
-                _LOGGER.debug(
-                    "Failed to import %s in executor", self.domain, exc_info=ex
-                )
-                # If importing in the executor deadlocks because there is a circular
-                # dependency, we fall back to the event loop.
-                comp = self._get_component()
+            with trace_span(tracer, "import", CATEGORY_IMPORT, domain, executor=True):
+                try:
+                    comp = await self.hass.async_add_import_executor_job(
+                        self._get_component_locked, True
+                    )
+                except ModuleNotFoundError:
+                    raise
+                except ImportError as ex:
+                    load_executor = False
+                    _LOGGER.debug(
+                        "Failed to import %s in executor", self.domain, exc_info=ex
+                    )
+                    # If importing in the executor deadlocks because there is a circular
+                    # dependency, we fall back to the event loop.
+                    comp = self._get_component()
             self._component_future.set_result(comp)
         except BaseException as ex:
             self._component_future.set_exception(ex)
@@ -1036,6 +1091,48 @@ class Integration:
 
         return comp
 
+    async def async_preimport(self, executor: Executor) -> float | None:
+        """Import the component in an executor ahead of its setup.
+
+        A setup that needs the component while it is imported waits for
+        the import lock of the package. If the import fails it is not
+        retried, the setup imports the component the usual way. Returns
+        the seconds the import took or None if the component was already
+        imported or could not be imported.
+        """
+        if self.domain in self._cache or self.pkg_path in sys.modules:
+            return None
+
+        start = time.monotonic()
+        try:
+            with trace_span(
+                self.hass.data.get(DATA_STARTUP_TRACER),
+                "preimport",
+                CATEGORY_IMPORT,
+                self.domain,
+            ):
+                await self.hass.loop.run_in_executor(
+                    executor, self._get_component_locked, True
+                )
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.warning(
+                "Failed to import %s ahead of its setup: %s", self.domain, ex
+            )
+            return None
+
+        return time.monotonic() - start
+
+    def _get_component_locked(
+        self, preload_platforms: bool = False
+    ) -> ComponentProtocol:
+        """Return the component, holding the import lock of the package.
+
+        The lock keeps the import executor and the import scheduler
+        from importing the modules of a package at the same time.
+        """
+        with _import_lock(self.pkg_path):
+            return self._get_component(preload_platforms)
+
     def get_component(self) -> ComponentProtocol:
         """Return the component.
 
@@ -1088,6 +1185,13 @@ class Integration:
             for platform_name in platform_names
         }
 
+    def _load_platforms_locked(
+        self, platform_names: Iterable[str]
+    ) -> dict[str, ModuleType]:
+        """Load platforms for an integration, holding the import lock."""
+        with _import_lock(self.pkg_path):
+            return self._load_platforms(platform_names)
+
     async def async_get_platform(self, platform_name: str) -> ModuleType:
         """Return a platform for an integration."""
         # Fast path for a single platform when it is already cached.
@@ -1137,14 +1241,23 @@ class Integration:
             if debug := _LOGGER.isEnabledFor(logging.DEBUG):
                 start = time.perf_counter()
 
+            tracer = self.hass.data.get(DATA_STARTUP_TRACER)
             try:
                 if load_executor_platforms:
                     try:
-                        platforms.update(
-                            await self.hass.async_add_import_executor_job(
-                                self._load_platforms, platform_names
+                        with trace_span(
+                            tracer,
+                            "import platforms",
+                            CATEGORY_IMPORT,
+                            domain,
+                            platforms=load_executor_platforms,
+                            executor=True,
+                        ):
+                            platforms.update(
+                                await self.hass.async_add_import_executor_job(
+                                    self._load_platforms_locked, platform_names
+                                )
                             )
-                        )
                     except ModuleNotFoundError:
                         raise
                     except ImportError as ex:
@@ -1159,7 +1272,15 @@ class Integration:
                         load_event_loop_platforms.extend(load_executor_platforms)
 
                 if load_event_loop_platforms:
-                    platforms.update(self._load_platforms(platform_names))
+                    with trace_span(
+                        tracer,
+                        "import platforms",
+                        CATEGORY_IMPORT,
+                        domain,
+                        platforms=load_event_loop_platforms,
+                        executor=False,
+                    ):
+                        platforms.update(self._load_platforms(platform_names))
 
                 for platform_name, import_future in import_futures:
                     import_future.set_result(platforms[platform_name])
@@ -1431,6 +1552,91 @@ async def async_get_integrations(
     return results
 
 
+def _import_lock(pkg_path: str) -> threading.RLock:
+    """Return the lock of an integration package imported in an executor.
+
+    The lock covers the component and the platforms of the package.
+    """
+    with _IMPORT_LOCKS_LOCK:
+        if (lock := _IMPORT_LOCKS.get(pkg_path)) is None:
+            lock = _IMPORT_LOCKS[pkg_path] = threading.RLock()
+        return lock
+
+
+async def async_import_integrations(
+    hass: HomeAssistant,
+    integrations: Mapping[str, Integration],
+    dependencies: Mapping[str, Iterable[str]],
+    max_workers: int = IMPORT_SCHEDULER_WORKERS,
+) -> dict[str, float]:
+    """Import the components of integrations in parallel.
+
+    An integration is imported once the integrations it depends on are
+    imported, so workers do not wait on the import locks of modules
+    other workers are importing, while integrations that do not depend
+    on each other are imported concurrently. Integrations that must be
+    imported in the event loop are skipped.
+
+    Returns the seconds it took to import each integration.
+    """
+    waiting = {
+        domain: {dep for dep in dependencies.get(domain, ()) if dep in integrations}
+        - {domain}
+        for domain, integration in integrations.items()
+        if integration.import_executor
+    }
+    dependents: defaultdict[str, list[str]] = defaultdict(list)
+    for domain, deps in waiting.items():
+        for dep in deps:
+            dependents[dep].append(domain)
+
+    import_times: dict[str, float] = {}
+    tasks: dict[asyncio.Task[float | None], str] = {}
+    executor = InterruptibleThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="ImportScheduler"
+    )
+
+    def _schedule(domains: Iterable[str]) -> None:
+        for domain in domains:
+            del waiting[domain]
+            tasks[
+                create_eager_task(
+                    integrations[domain].async_preimport(executor),
+                    name=f"preimport {domain}",
+                    loop=hass.loop,
+                )
+            ] = domain
+
+    try:
+        _schedule([domain for domain, deps in waiting.items() if not deps])
+        while tasks or waiting:
+            if not tasks:
+                # The remaining integrations depend on each other
+                _schedule(list(waiting))
+                continue
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            ready: list[str] = []
+            for task in done:
+                domain = tasks.pop(task)
+                if (import_time := task.result()) is not None:
+                    import_times[domain] = import_time
+                for dependent in dependents.pop(domain, ()):
+                    if dependent in waiting:
+                        deps = waiting[dependent]
+                        deps.discard(domain)
+                        if not deps:
+                            ready.append(dependent)
+            _schedule(ready)
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Joining the workers would block the event loop, idle
+        # workers exit on their own
+        executor.shutdown(join_threads_or_timeout=False)
+
+    return import_times
+
+
 class _ResolveDependenciesCacheProtocol(Protocol):
     def get(self, itg: Integration) -> set[str] | Exception | None: ...
 
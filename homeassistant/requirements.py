@@ -79,6 +79,15 @@ def _async_get_manager(hass: HomeAssistant) -> RequirementsManager:
     return RequirementsManager(hass)
 
 
+@callback
+def async_get_installed_requirements(hass: HomeAssistant) -> set[str]:
+    """Return the requirements known to be installed.
+
+    The set is updated in place when requirements are checked or installed.
+    """
+    return _async_get_manager(hass).is_installed_cache
+
+
 @callback
 def async_clear_install_history(hass: HomeAssistant) -> None:
     """Forget the install history."""
@@ -55,6 +55,16 @@ class RuntimeConfig:
 
     safe_mode: bool = False
 
+    compact_states: bool = False
+
+    lazy_platforms: bool = False
+
+    parallel_imports: bool = False
+
+    timer_wheel: bool = False
+
+    trace_startup: bool = False
+
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
     """Event loop policy for Home Assistant."""
@@ -6,17 +6,55 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import logging
+import os
+import pathlib
+import sys
+import tempfile
 from timeit import default_timer as timer
-
-from homeassistant import core
+import tracemalloc
+import uuid
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from homeassistant import config_entries, core, loader
+from homeassistant.auth.models import RefreshToken, User
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.bulk_insert import StatesBuffer
+from homeassistant.components.recorder.db_schema import (
+    Base,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.table_managers.states import StatesManager
+from homeassistant.components.recorder.tasks import StatisticsTask
+from homeassistant.components.websocket_api.commands import handle_subscribe_entities
+from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import EVENT_STATE_CHANGED
-from homeassistant.helpers.entityfilter import convert_include_exclude_filter
+from homeassistant.helpers import (
+    recorder as recorder_helper,
+    storage,
+    template_bytecode_cache,
+)
+from homeassistant.helpers.entityfilter import (
+    INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
+    convert_include_exclude_filter,
+)
 from homeassistant.helpers.event import (
+    TrackTemplate,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_template_result,
 )
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import JSON_DUMP, json_bytes, json_fragment
+from homeassistant.helpers.template import Template, TemplateEnvironment
+from homeassistant.helpers.template_bytecode_cache import DATA_TEMPLATE_BYTECODE_CACHE
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from homeassistant.util.timer_wheel import get_timer_wheel
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +346,656 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+async def _fire_events_10k_listeners(hass: core.HomeAssistant, indexed: bool) -> float:
+    """Fire 100k state_changed events with 10k listeners for one entity each."""
+    count = 0
+    listeners = 10**4
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listeners):
+        entity_id = f"light.kitchen_{idx}"
+        if indexed:
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED, listener, match_data={"entity_id": entity_id}
+            )
+            continue
+
+        @core.callback
+        def event_filter(event_data, entity_id=entity_id):
+            """Filter event."""
+            return event_data["entity_id"] == entity_id
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter=event_filter)
+
+    state = core.State("light.kitchen_0", "on")
+    events_data = [
+        {"entity_id": f"light.kitchen_{idx % listeners}", "new_state": state}
+        for idx in range(events_to_fire)
+    ]
+
+    start = timer()
+
+    for event_data in events_data:
+        hass.bus.async_fire_internal(EVENT_STATE_CHANGED, event_data)  # type: ignore[misc]
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_10k_filtered_listeners(hass: core.HomeAssistant) -> float:
+    """Fire events with 10k listeners using an event filter."""
+    return await _fire_events_10k_listeners(hass, False)
+
+
+@benchmark
+async def fire_events_10k_match_data_listeners(hass: core.HomeAssistant) -> float:
+    """Fire events with 10k listeners indexed with match_data."""
+    return await _fire_events_10k_listeners(hass, True)
+
+
+async def _state_machine_memory(hass: core.HomeAssistant, compact: bool) -> float:
+    """Measure the memory used by 20k entities after serializing their states."""
+    entities = 20000
+    device_classes = ("power", "energy", "temperature", "humidity")
+    units = ("W", "kWh", "°C", "%")
+    if compact:
+        hass.states.async_enable_compact_mode()
+
+    start = timer()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for update in range(5):
+        for idx in range(entities):
+            kind = idx % len(device_classes)
+            hass.states.async_set(
+                f"sensor.sensor_{idx}",
+                str(update % 3),
+                {
+                    "state_class": "measurement",
+                    "device_class": device_classes[kind],
+                    "unit_of_measurement": units[kind],
+                    "friendly_name": f"Sensor {idx}",
+                },
+            )
+    # Serialize the states the way the websocket and rest api do
+    for state in hass.states.async_all():
+        state.as_compressed_state_json  # noqa: B018
+        state.as_dict_json  # noqa: B018
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    print(f"{used // entities} bytes/entity")
+    if compact:
+        hass.states.async_drop_caches()
+        used = tracemalloc.get_traced_memory()[0] - baseline
+        print(f"{used // entities} bytes/entity after dropping caches")
+    tracemalloc.stop()
+
+    return timer() - start
+
+
+@benchmark
+async def state_machine_memory(hass: core.HomeAssistant) -> float:
+    """Measure the memory used by 20k entities."""
+    return await _state_machine_memory(hass, False)
+
+
+@benchmark
+async def state_machine_memory_compact(hass: core.HomeAssistant) -> float:
+    """Measure the memory used by 20k entities in compact mode."""
+    return await _state_machine_memory(hass, True)
+
+
+def _state_changed_events(
+    entities: int, updates: int
+) -> list[core.Event[core.EventStateChangedData]]:
+    """Build state_changed events for a number of chatty sensors."""
+    events: list[core.Event[core.EventStateChangedData]] = []
+    old_states: dict[str, core.State | None] = {}
+    for update in range(updates):
+        for idx in range(entities):
+            entity_id = f"sensor.power_{idx}"
+            new_state = core.State(entity_id, str(update), {"unit": "W"})
+            events.append(
+                core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_states.get(entity_id),
+                        "new_state": new_state,
+                    },
+                )
+            )
+            old_states[entity_id] = new_state
+    return events
+
+
+def _write_states(bulk_insert: bool, entities: int, updates: int) -> float:
+    """Write states for a commit interval to an in-memory database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    events = _state_changed_events(entities, updates)
+    with Session(engine) as session:
+        state_attributes = StateAttributes(shared_attrs='{"unit":"W"}')
+        states_meta = {
+            f"sensor.power_{idx}": StatesMeta(entity_id=f"sensor.power_{idx}")
+            for idx in range(entities)
+        }
+        session.add(state_attributes)
+        session.add_all(states_meta.values())
+        session.commit()
+        attributes_id = state_attributes.attributes_id
+        metadata_ids = {
+            entity_id: meta.metadata_id for entity_id, meta in states_meta.items()
+        }
+        session.expunge_all()
+
+        start = timer()
+        if bulk_insert:
+            states_buffer = StatesBuffer(StatesManager())
+            pending_index: dict[str, int] = {}
+            for event in events:
+                entity_id = event.data["entity_id"]
+                pending_index[entity_id] = states_buffer.append(
+                    event,
+                    None,
+                    None,
+                    pending_index.get(entity_id),
+                    metadata_ids[entity_id],
+                    None,
+                    attributes_id,
+                    None,
+                )
+            states_buffer.write(session)
+        else:
+            pending: dict[str, States] = {}
+            for event in events:
+                entity_id = event.data["entity_id"]
+                dbstate = States.from_event(event)
+                dbstate.entity_id = None
+                dbstate.metadata_id = metadata_ids[entity_id]
+                dbstate.attributes_id = attributes_id
+                if old_state := pending.get(entity_id):
+                    dbstate.old_state = old_state
+                pending[entity_id] = dbstate
+                session.add(dbstate)
+        session.commit()
+        runtime = timer() - start
+
+    engine.dispose()
+    rows = entities * updates
+    print(f"Wrote {rows} states at {rows / runtime:.0f} rows/s")
+    return runtime
+
+
+@benchmark
+async def recorder_write_states_orm(hass: core.HomeAssistant) -> float:
+    """Write 4000 entities with 5 updates each using the ORM write path."""
+    return await hass.async_add_executor_job(_write_states, False, 4000, 5)
+
+
+@benchmark
+async def recorder_write_states_bulk_insert(hass: core.HomeAssistant) -> float:
+    """Write 4000 entities with 5 updates each using the bulk insert path."""
+    return await hass.async_add_executor_job(_write_states, True, 4000, 5)
+
+
+@benchmark
+async def websocket_subscribe_entities_100_connections(
+    hass: core.HomeAssistant,
+) -> float:
+    """Fire 100k state changes with 100 connections subscribed to 10 entities each."""
+    connections = 100
+    entities = 1000
+    events_to_fire = 10**5
+    count = 0
+
+    def send_message(message):
+        """Count sent messages."""
+        nonlocal count
+        count += 1
+
+    # The owner does not need a permission lookup
+    user = User(
+        name="Benchmark",
+        perm_lookup=None,  # type: ignore[arg-type]
+        is_owner=True,
+        is_active=True,
+        system_generated=False,
+    )
+    refresh_token = RefreshToken(user, None, timedelta(minutes=30))
+    # The registered websocket commands, not needed to subscribe directly
+    hass.data["websocket_api"] = {}
+    for idx in range(connections):
+        connection = ActiveConnection(
+            logging.getLogger(__name__),  # type: ignore[arg-type]
+            hass,
+            send_message,
+            user,
+            refresh_token,
+        )
+        handle_subscribe_entities(
+            hass,
+            connection,
+            {
+                "id": 1,
+                "type": "subscribe_entities",
+                "entity_ids": [
+                    f"sensor.power_{(idx * 10 + offset) % entities}"
+                    for offset in range(10)
+                ],
+                **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA({}),
+            },
+        )
+    # Drop the subscription results and initial states
+    count = 0
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.states.async_set(f"sensor.power_{idx % entities}", str(idx))
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+async def _loop_timers_100k_scheduled(
+    hass: core.HomeAssistant, call_at: Callable[..., asyncio.TimerHandle]
+) -> float:
+    """Run 50k short timers while 100k long timers are scheduled."""
+    loop = hass.loop
+    short_timers = 50000
+    now = loop.time()
+    handles = [call_at(now + 60 + idx % 600, lambda: None) for idx in range(10**5)]
+    future: asyncio.Future[None] = loop.create_future()
+    count = 0
+
+    def short_timer():
+        """Schedule the next short timer on the event loop."""
+        nonlocal count
+        count += 1
+        if count == short_timers:
+            future.set_result(None)
+            return
+        loop.call_at(loop.time(), short_timer)
+
+    start = timer()
+
+    loop.call_at(loop.time(), short_timer)
+    await future
+
+    elapsed = timer() - start
+    for handle in handles:
+        handle.cancel()
+    return elapsed
+
+
+@benchmark
+async def loop_timers_100k_scheduled(hass: core.HomeAssistant) -> float:
+    """Run loop timers while 100k timers are scheduled on the event loop."""
+    return await _loop_timers_100k_scheduled(hass, hass.loop.call_at)
+
+
+@benchmark
+async def loop_timers_100k_scheduled_wheel(hass: core.HomeAssistant) -> float:
+    """Run loop timers while 100k timers are scheduled on the timer wheel."""
+    return await _loop_timers_100k_scheduled(hass, get_timer_wheel(hass.loop).call_at)
+
+
+async def _compile_3k_templates(hass: core.HomeAssistant, bytecode: bool) -> float:
+    """Compile 3k templates as done at startup."""
+    sources = [
+        f"{{{{ states('sensor.power_{idx}') | float(0) * {idx} }}}}"
+        if idx % 2
+        else f"{{% if is_state('light.light_{idx}', 'on') %}}on{{% endif %}}"
+        for idx in range(3000)
+    ]
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        if bytecode:
+            # Fill the cache on disk as a previous start would
+            await template_bytecode_cache.async_setup(hass)
+            env = TemplateEnvironment(hass)
+            for source in sources:
+                env.compile(source)
+            await hass.async_add_executor_job(
+                hass.data[DATA_TEMPLATE_BYTECODE_CACHE].save, False
+            )
+            await template_bytecode_cache.async_setup(hass)
+
+        start = timer()
+
+        for source in sources:
+            Template(source, hass).ensure_valid()
+
+        return timer() - start
+
+
+@benchmark
+async def template_compile_3k(hass: core.HomeAssistant) -> float:
+    """Compile 3k templates."""
+    return await _compile_3k_templates(hass, False)
+
+
+@benchmark
+async def template_compile_3k_bytecode_cache(hass: core.HomeAssistant) -> float:
+    """Compile 3k templates with the bytecode cache of a previous start."""
+    return await _compile_3k_templates(hass, True)
+
+
+@benchmark
+async def template_sensors_1000_attribute_updates(hass: core.HomeAssistant) -> float:
+    """Track 1000 templates while their entities get 100k attribute updates."""
+    entities = 1000
+    updates = 10**5
+    count = 0
+
+    @core.callback
+    def template_changed(event, updates):
+        """Count template results."""
+        nonlocal count
+        count += 1
+
+    for idx in range(entities):
+        hass.states.async_set(f"sensor.power_{idx}", "1", {"voltage": 0})
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    Template(
+                        f"{{{{ states('sensor.power_{idx}') | float(0) * 1000 }}}}",
+                        hass,
+                    ),
+                    None,
+                )
+            ],
+            template_changed,
+        )
+    await hass.async_block_till_done()
+
+    start = timer()
+
+    for idx in range(updates):
+        hass.states.async_set(f"sensor.power_{idx % entities}", "1", {"voltage": idx})
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+async def _compile_statistics_5k_sensors(
+    hass: core.HomeAssistant,
+    vectorized: bool = False,
+    incremental: bool = False,
+) -> float:
+    """Compile 5-minute statistics of 5k measurement sensors."""
+    sensors = 5000
+    # The number of updates of each sensor in each period
+    updates = 10
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": f"sqlite:///{config_dir}/home-assistant_v2.db",
+                    "vectorized_statistics": vectorized,
+                    "incremental_statistics": incremental,
+                }
+            },
+        )
+        assert await async_setup_component(hass, "sensor", {})
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_recorder_ready.wait()
+
+        now = dt_util.utcnow()
+        period_start = now.replace(
+            minute=now.minute - now.minute % 5, second=0, microsecond=0
+        ) - timedelta(minutes=10)
+        # The first period creates the statistics metadata
+        warmup_start = period_start - timedelta(minutes=5)
+        for update in range(updates * 2):
+            timestamp = (warmup_start + timedelta(seconds=update * 30)).timestamp()
+            for idx in range(sensors):
+                hass.states.async_set(
+                    f"sensor.power_{idx}",
+                    str(idx + update),
+                    {"state_class": "measurement", "unit_of_measurement": "W"},
+                    timestamp=timestamp,
+                )
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+        instance.queue_task(StatisticsTask(warmup_start, False))
+        await instance.async_block_till_done()
+
+        start = timer()
+
+        instance.queue_task(StatisticsTask(period_start, False))
+        await instance.async_block_till_done()
+
+        return timer() - start
+
+
+@benchmark
+async def recorder_compile_statistics_5k_sensors(hass: core.HomeAssistant) -> float:
+    """Compile 5-minute statistics of 5k sensors on the recorder thread."""
+    return await _compile_statistics_5k_sensors(hass)
+
+
+@benchmark
+async def recorder_compile_statistics_5k_sensors_vectorized(
+    hass: core.HomeAssistant,
+) -> float:
+    """Compile 5-minute statistics of 5k sensors with vectorized means."""
+    return await _compile_statistics_5k_sensors(hass, vectorized=True)
+
+
+@benchmark
+async def recorder_compile_statistics_5k_sensors_incremental(
+    hass: core.HomeAssistant,
+) -> float:
+    """Compile 5-minute statistics of 5k sensors from the recorded states."""
+    return await _compile_statistics_5k_sensors(hass, incremental=True)
+
+
+def _rss() -> int:
+    """Return the resident set size of the process in bytes."""
+    with open("/proc/self/statm", encoding="utf-8") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _write_integrations(path: pathlib.Path, count: int) -> None:
+    """Write integrations that have the common preload platforms."""
+    platforms = (
+        "config_flow",
+        "diagnostics",
+        "repairs",
+        "system_health",
+        "logbook",
+        "backup",
+        "energy",
+    )
+    source = "".join(
+        f"def function_{idx}(value):\n    return value + {idx}\n\n\n"
+        for idx in range(200)
+    )
+    path.mkdir()
+    (path / "__init__.py").touch()
+    for idx in range(count):
+        integration_path = path / f"integration_{idx}"
+        integration_path.mkdir()
+        (integration_path / "__init__.py").write_text(source)
+        for platform_name in platforms:
+            (integration_path / f"{platform_name}.py").write_text(source)
+
+
+async def _load_120_integrations(hass: core.HomeAssistant, lazy: bool) -> float:
+    """Import 120 integrations the way they are imported at startup.
+
+    No integration processes the platforms, as in a session where
+    the platforms are never used.
+    """
+    count = 120
+    # The package name is unique so every run imports the modules again
+    package = f"benchmark_{uuid.uuid4().hex}"
+    loader.async_setup(hass)
+    if lazy:
+        loader.async_enable_lazy_platforms(hass)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir, package)
+        await hass.async_add_executor_job(_write_integrations, path, count)
+        integrations = [
+            loader.Integration(
+                hass,
+                f"{package}.integration_{idx}",
+                path / f"integration_{idx}",
+                {
+                    "domain": f"integration_{idx}",
+                    "name": f"Integration {idx}",
+                    "config_flow": True,
+                },
+                set(os.listdir(path / f"integration_{idx}")),
+            )
+            for idx in range(count)
+        ]
+        sys.path.insert(0, tmp_dir)
+        try:
+            rss = _rss()
+            modules = len(sys.modules)
+            start = timer()
+            await asyncio.gather(
+                *(integration.async_get_component() for integration in integrations)
+            )
+            runtime = timer() - start
+            print(f"{len(sys.modules) - modules} modules imported")
+            print(f"{(_rss() - rss) / 2**20:.1f} MiB RSS")
+        finally:
+            sys.path.remove(tmp_dir)
+            sys.path_importer_cache.pop(tmp_dir, None)
+
+    return runtime
+
+
+@benchmark
+async def load_120_integrations(hass: core.HomeAssistant) -> float:
+    """Import 120 integrations and their preload platforms."""
+    return await _load_120_integrations(hass, False)
+
+
+@benchmark
+async def load_120_integrations_lazy_platforms(hass: core.HomeAssistant) -> float:
+    """Import 120 integrations in lazy platform mode."""
+    return await _load_120_integrations(hass, True)
+
+
+def _written_bytes() -> int:
+    """Return the number of bytes the process passed to write calls."""
+    with open("/proc/self/io", encoding="utf-8") as io_stats:
+        for line in io_stats:
+            if line.startswith("wchar:"):
+                return int(line.split()[1])
+    raise RuntimeError("wchar not found in /proc/self/io")
+
+
+def _entity_record(idx: int, name: str) -> json_fragment:
+    """Return a stored entity registry entry."""
+    return json_fragment(
+        json_bytes(
+            {
+                "aliases": [],
+                "area_id": None,
+                "categories": {},
+                "capabilities": None,
+                "config_entry_id": uuid.uuid4().hex,
+                "config_subentry_id": None,
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "device_class": None,
+                "device_id": uuid.uuid4().hex,
+                "disabled_by": None,
+                "entity_category": None,
+                "entity_id": f"sensor.{name}_{idx}",
+                "hidden_by": None,
+                "icon": None,
+                "id": f"{idx:032x}",
+                "has_entity_name": True,
+                "labels": [],
+                "modified_at": "2025-01-01T00:00:00+00:00",
+                "name": None,
+                "options": {"sensor": {"suggested_display_precision": 1}},
+                "original_device_class": "temperature",
+                "original_icon": None,
+                "original_name": name,
+                "platform": "benchmark",
+                "suggested_object_id": None,
+                "supported_features": 0,
+                "translation_key": None,
+                "unique_id": f"unique_{idx}",
+                "previous_unique_id": None,
+                "unit_of_measurement": "°C",
+            }
+        )
+    )
+
+
+async def _store_25k_entities(hass: core.HomeAssistant, journal: bool) -> float:
+    """Rename 100 entities of an entity registry with 25k entities.
+
+    Every rename is saved like a registry does once its save delay
+    passed. Prints the bytes written for each rename.
+    """
+    count = 25000
+    renames = 100
+    entities = [_entity_record(idx, "entity") for idx in range(count)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        store: storage.Store[dict[str, list[json_fragment]]] = storage.Store(
+            hass,
+            1,
+            "core.entity_registry",
+            atomic_writes=True,
+            journal=journal,
+        )
+        await store.async_save({"entities": entities, "deleted_entities": []})
+        change_size = 0
+        written = _written_bytes()
+        start = timer()
+        for idx in range(renames):
+            entities[idx * 97] = _entity_record(idx * 97, "renamed")
+            change_size += len(json_bytes(entities[idx * 97]))
+            await store.async_save({"entities": entities, "deleted_entities": []})
+        runtime = timer() - start
+        written = _written_bytes() - written
+
+    print(f"{written / renames / 1024:.1f} KiB written per rename")
+    print(f"{written / change_size:.1f}x write amplification")
+    return runtime
+
+
+@benchmark
+async def store_25k_entities(hass: core.HomeAssistant) -> float:
+    """Save 100 renames of an entity registry with 25k entities."""
+    return await _store_25k_entities(hass, False)
+
+
+@benchmark
+async def store_25k_entities_journal(hass: core.HomeAssistant) -> float:
+    """Save 100 renames of an entity registry with 25k entities to a journal."""
+    return await _store_25k_entities(hass, True)
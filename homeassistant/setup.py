@@ -19,6 +19,7 @@ from .const import (
     BASE_PLATFORMS,  # noqa: F401
     EVENT_COMPONENT_LOADED,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     PLATFORM_FORMAT,
 )
 from .core import (
@@ -34,6 +35,14 @@ from .helpers.issue_registry import IssueSeverity, async_create_issue
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
+from .util.startup_trace import (
+    CATEGORY_SETUP,
+    CATEGORY_WAIT,
+    DATA_STARTUP_TRACER,
+    StartupTracer,
+    async_trace_executor_jobs,
+    trace_span,
+)
 
 current_setup_group: contextvars.ContextVar[tuple[str, str | None] | None] = (
     contextvars.ContextVar("current_setup_group", default=None)
@@ -72,6 +81,10 @@ _DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# _DATA_STARTUP_TIMINGS is a dict, indicating how long the startup steps
+# that are not the setup of a component took.
+_DATA_STARTUP_TIMINGS: HassKey[dict[str, float]] = HassKey("startup_timings")
+
 _DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 _DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -167,7 +180,13 @@ async def async_setup_component(
     setup_futures[domain] = setup_future
 
     try:
-        result = await _async_setup_component(hass, domain, config)
+        with trace_span(
+            hass.data.get(DATA_STARTUP_TRACER),
+            f"setup {domain}",
+            CATEGORY_SETUP,
+            domain,
+        ):
+            result = await _async_setup_component(hass, domain, config)
         setup_future.set_result(result)
         if setup_done_future := setup_done_futures.pop(domain, None):
             setup_done_future.set_result(result)
@@ -244,8 +263,15 @@ async def _async_process_dependencies(
             dependencies_tasks.keys(),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(*dependencies_tasks.values())
+    with trace_span(
+        hass.data.get(DATA_STARTUP_TRACER),
+        "wait dependencies",
+        CATEGORY_WAIT,
+        integration.domain,
+        waits_for=list(dependencies_tasks),
+    ):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(*dependencies_tasks.values())
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -716,7 +742,10 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
 
     started = time.monotonic()
     try:
-        yield
+        with trace_span(
+            hass.data.get(DATA_STARTUP_TRACER), phase, CATEGORY_WAIT, running[0]
+        ):
+            yield
     finally:
         time_taken = time.monotonic() - started
         integration, group = running
@@ -777,7 +806,14 @@ def async_start_setup(
     setup_started[current] = started
 
     try:
-        yield
+        with trace_span(
+            hass.data.get(DATA_STARTUP_TRACER),
+            phase,
+            CATEGORY_SETUP,
+            integration,
+            group=group,
+        ):
+            yield
     finally:
         time_taken = time.monotonic() - started
         del setup_started[current]
@@ -805,7 +841,7 @@ def async_start_setup(
 
 @callback
 def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
-    """Return timing data for each integration."""
+    """Return timing data for each integration and the other startup steps."""
     setup_time = _setup_times(hass)
     domain_timings: dict[str, float] = {}
     top_level_timings: Mapping[SetupPhases, float]
@@ -822,9 +858,47 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
         group_max = max(group_totals.values(), default=0)
         domain_timings[domain] = total_top_level + group_max
 
+    if startup_timings := hass.data.get(_DATA_STARTUP_TIMINGS):
+        domain_timings.update(startup_timings)
     return domain_timings
 
 
+@callback
+def async_set_startup_timing(
+    hass: core.HomeAssistant, name: str, time_taken: float
+) -> None:
+    """Record the time of a startup step that is not a component setup.
+
+    The time is returned by async_get_setup_timings next to the setup
+    times of the components. The name must contain a colon so it can
+    not be mistaken for a domain.
+    """
+    hass.data.setdefault(_DATA_STARTUP_TIMINGS, {})[name] = time_taken
+
+
+@callback
+def async_start_startup_trace(hass: core.HomeAssistant) -> StartupTracer:
+    """Trace the startup until Home Assistant has started."""
+    tracer = hass.data[DATA_STARTUP_TRACER] = StartupTracer()
+    remove_executor_tracing = async_trace_executor_jobs(hass, tracer)
+
+    @callback
+    def _async_stop(_: Event) -> None:
+        tracer.stop()
+        remove_executor_tracing()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_stop)
+    return tracer
+
+
+@callback
+def async_get_startup_trace(hass: core.HomeAssistant) -> dict[str, Any] | None:
+    """Return the startup trace in the Chrome trace event format."""
+    if (tracer := hass.data.get(DATA_STARTUP_TRACER)) is None:
+        return None
+    return tracer.as_chrome_trace()
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
@@ -17,6 +17,8 @@ import logging
 import threading
 from typing import Any
 
+from .timer_wheel import get_timer_wheel_handles
+
 _LOGGER = logging.getLogger(__name__)
 
 _SHUTDOWN_RUN_CALLBACK_THREADSAFE = "_shutdown_run_callback_threadsafe"
@@ -134,6 +136,11 @@ def shutdown_run_callback_threadsafe(loop: AbstractEventLoop) -> None:
 
 
 def get_scheduled_timer_handles(loop: AbstractEventLoop) -> list[TimerHandle]:
-    """Return a list of scheduled TimerHandles."""
+    """Return a list of scheduled TimerHandles.
+
+    Includes the timers scheduled on the timer wheel of the loop.
+    """
     handles: list[TimerHandle] = loop._scheduled  # type: ignore[attr-defined] # noqa: SLF001
+    if wheel_handles := get_timer_wheel_handles(loop):
+        return [*handles, *wheel_handles]
     return handles
@@ -0,0 +1,316 @@
+"""Trace the critical path of the startup.
+
+The tracer records spans for the setup phases, imports, executor jobs
+and waits for dependencies with their start and end times and the span
+they were started in. Spans started in the event loop are linked to
+their parent through a context variable, which asyncio tasks copy when
+they are created. Executor jobs are linked to the span that submitted
+them.
+
+The spans are exported in the Chrome trace event format, which can be
+opened in Perfetto or chrome://tracing.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+from itertools import count
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from .hass_dict import HassKey
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+DATA_STARTUP_TRACER: HassKey[StartupTracer] = HassKey("startup_tracer")
+
+# Recording stops when a startup creates more spans
+MAX_SPANS = 100000
+
+# The methods of the instance which submit executor jobs
+_EXECUTOR_JOB_METHODS = ("async_add_executor_job", "async_add_import_executor_job")
+
+CATEGORY_BOOTSTRAP = "bootstrap"
+CATEGORY_EXECUTOR = "executor"
+CATEGORY_IMPORT = "import"
+CATEGORY_SETUP = "setup"
+CATEGORY_WAIT = "wait"
+
+current_span: ContextVar[TraceSpan | None] = ContextVar("current_span", default=None)
+
+
+class TraceSpan:
+    """A span of the startup trace."""
+
+    __slots__ = (
+        "args",
+        "category",
+        "domain",
+        "end",
+        "id",
+        "name",
+        "parent",
+        "start",
+        "thread",
+    )
+
+    def __init__(
+        self,
+        span_id: int,
+        name: str,
+        category: str,
+        domain: str | None,
+        parent: TraceSpan | None,
+        args: dict[str, Any],
+    ) -> None:
+        """Initialize the span."""
+        self.id = span_id
+        self.name = name
+        self.category = category
+        # The domain is inherited so spans are grouped by integration
+        self.domain: str | None = (
+            domain if domain is not None or parent is None else parent.domain
+        )
+        self.parent = parent
+        self.args = args
+        self.thread = threading.current_thread().name
+        self.start = time.monotonic()
+        self.end: float | None = None
+
+
+class StartupTracer:
+    """Record the spans of the startup."""
+
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        self.started = time.monotonic()
+        self.stopped: float | None = None
+        self.recording = True
+        self._spans: list[TraceSpan] = []
+        self._ids = count(1)
+
+    def __len__(self) -> int:
+        """Return the number of recorded spans."""
+        return len(self._spans)
+
+    def stop(self) -> None:
+        """Stop recording spans."""
+        if self.recording:
+            self.recording = False
+            self.stopped = time.monotonic()
+
+    def start_span(
+        self,
+        name: str,
+        category: str,
+        domain: str | None,
+        parent: TraceSpan | None,
+        args: dict[str, Any],
+    ) -> TraceSpan | None:
+        """Start a span or return None if the tracer is not recording.
+
+        This method is thread-safe.
+        """
+        if not self.recording:
+            return None
+        if len(self._spans) >= MAX_SPANS:
+            self.stop()
+            return None
+        span = TraceSpan(next(self._ids), name, category, domain, parent, args)
+        self._spans.append(span)
+        return span
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, domain: str | None = None, **args: Any
+    ) -> Generator[None]:
+        """Record a span around the block in the current span."""
+        if (
+            span := self.start_span(name, category, domain, current_span.get(), args)
+        ) is None:
+            yield
+            return
+        token = current_span.set(span)
+        try:
+            yield
+        finally:
+            span.end = time.monotonic()
+            current_span.reset(token)
+
+    def wrap_job[**_P, _R](self, target: Callable[_P, _R]) -> Callable[_P, _R]:
+        """Wrap an executor job to record it in the span that submits it."""
+        parent = current_span.get()
+        name = _job_name(target)
+
+        @functools.wraps(target)
+        def _job(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            if (
+                span := self.start_span(
+                    name, CATEGORY_EXECUTOR, None, parent, {"function": name}
+                )
+            ) is None:
+                return target(*args, **kwargs)
+            token = current_span.set(span)
+            try:
+                return target(*args, **kwargs)
+            finally:
+                span.end = time.monotonic()
+                current_span.reset(token)
+
+        return _job
+
+    def critical_path(self) -> list[TraceSpan]:
+        """Return the chain of spans that determined when the startup finished.
+
+        The path starts at the top level span that ended last and follows
+        the child that ended last. A wait for dependencies continues with
+        the setup of the dependency that ended last.
+        """
+        end = self.stopped or time.monotonic()
+        children: defaultdict[int | None, list[TraceSpan]] = defaultdict(list)
+        setups: dict[str, TraceSpan] = {}
+        for span in self._spans:
+            children[None if span.parent is None else span.parent.id].append(span)
+            if (
+                span.domain is not None
+                and span.category == CATEGORY_SETUP
+                and span.name == f"setup {span.domain}"
+            ):
+                setups[span.domain] = span
+
+        def _end(span: TraceSpan) -> float:
+            return end if span.end is None else span.end
+
+        path: list[TraceSpan] = []
+        seen: set[int] = set()
+        candidates = children[None]
+        while candidates:
+            span = max(candidates, key=_end)
+            if span.id in seen:
+                break
+            seen.add(span.id)
+            path.append(span)
+            candidates = children[span.id]
+            if span.category == CATEGORY_WAIT:
+                candidates = [
+                    *candidates,
+                    *(
+                        setup
+                        for domain in span.args.get("waits_for", ())
+                        if (setup := setups.get(domain)) is not None
+                    ),
+                ]
+        return path
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format.
+
+        Spans of an integration share a track, executor jobs are on the
+        track of their thread.
+        """
+        end = self.stopped or time.monotonic()
+        critical = {span.id for span in self.critical_path()}
+        tracks: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for span in self._spans:
+            if span.category == CATEGORY_EXECUTOR:
+                track = span.thread
+            else:
+                track = span.domain or CATEGORY_BOOTSTRAP
+            if (tid := tracks.get(track)) is None:
+                tid = tracks[track] = len(tracks) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": track},
+                    }
+                )
+            span_end = end if span.end is None else span.end
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round((span.start - self.started) * 1000000),
+                    "dur": round((span_end - span.start) * 1000000),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {
+                        **span.args,
+                        "id": span.id,
+                        "parent": None if span.parent is None else span.parent.id,
+                        "domain": span.domain,
+                        "critical_path": span.id in critical,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def async_trace_executor_jobs(
+    hass: HomeAssistant, tracer: StartupTracer
+) -> Callable[[], None]:
+    """Trace the executor jobs submitted through the instance.
+
+    The methods submitting executor jobs are replaced on the instance
+    so the jobs are only wrapped while the startup is traced. Returns
+    a function which restores the methods.
+    """
+    originals = {name: vars(hass).get(name) for name in _EXECUTOR_JOB_METHODS}
+    for name in _EXECUTOR_JOB_METHODS:
+        setattr(hass, name, _traced_add_job(tracer, getattr(hass, name)))
+
+    def _remove() -> None:
+        for name, original in originals.items():
+            if original is None:
+                delattr(hass, name)
+            else:
+                setattr(hass, name, original)
+
+    return _remove
+
+
+def _traced_add_job[_T](
+    tracer: StartupTracer, add_job: Callable[..., _T]
+) -> Callable[..., _T]:
+    """Wrap a method submitting executor jobs to trace the jobs."""
+
+    @functools.wraps(add_job)
+    def _add_job(target: Callable[..., Any], *args: Any) -> _T:
+        if tracer.recording:
+            target = tracer.wrap_job(target)
+        return add_job(target, *args)
+
+    return _add_job
+
+
+def _job_name(target: Callable[..., Any]) -> str:
+    """Return the name of an executor job."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    return getattr(target, "__qualname__", None) or repr(target)
+
+
+@contextmanager
+def trace_span(
+    tracer: StartupTracer | None,
+    name: str,
+    category: str,
+    domain: str | None = None,
+    **args: Any,
+) -> Generator[None]:
+    """Record a span with the tracer if the startup is traced."""
+    if tracer is None or not tracer.recording:
+        yield
+        return
+    with tracer.span(name, category, domain, **args):
+        yield
@@ -0,0 +1,189 @@
+"""Timer wheel to schedule many timers with a single loop timer.
+
+Every loop.call_at adds a TimerHandle to the heap of the event loop, so
+installations with thousands of debouncers and time triggers pay a heap
+push and pop for each of them, and cancelled handles stay in the heap
+until they expire or the heap is rebuilt.
+
+The wheel groups timers in buckets of one second. Scheduling and
+cancelling a timer is a dict operation on its bucket, and only the
+timers of the bucket that is due are kept ordered. A single loop timer
+is armed for the next timer that is due.
+
+The timers are TimerHandle objects so they can be inspected and
+cancelled like the handles of the event loop.
+"""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, TimerHandle
+from collections.abc import Callable
+from heapq import heappop, heappush
+from itertools import count
+from typing import Any
+
+_TIMER_WHEEL = "_hass_timer_wheel"
+
+BUCKET_SECONDS = 1.0
+
+
+class WheelTimerHandle(TimerHandle):
+    """A timer scheduled on a timer wheel."""
+
+    __slots__ = ("_bucket", "_seq", "_wheel")
+
+    _wheel: TimerWheel | None
+    _bucket: int | None
+    _seq: int
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if (wheel := self._wheel) is not None:
+            self._wheel = None
+            wheel._remove(self)  # noqa: SLF001
+        super().cancel()
+
+
+class TimerWheel:
+    """Schedule timers in one second buckets behind a single loop timer."""
+
+    def __init__(self, loop: AbstractEventLoop) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self._buckets: dict[int, dict[int, WheelTimerHandle]] = {}
+        # Heap of the buckets that have timers, buckets are dropped
+        # from the dict when their last timer is cancelled and are
+        # skipped when they reach the top of the heap.
+        self._bucket_heap: list[int] = []
+        # Heap of the timers of the buckets that are due
+        self._due: list[tuple[float, int, WheelTimerHandle]] = []
+        self._due_bucket = -1
+        self._seq = count()
+        self._active = 0
+        self._handle: TimerHandle | None = None
+        self._handle_when = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of scheduled timers."""
+        return self._active
+
+    def timer_handles(self) -> list[WheelTimerHandle]:
+        """Return the scheduled timers."""
+        handles = [
+            handle for bucket in self._buckets.values() for handle in bucket.values()
+        ]
+        handles.extend(
+            handle
+            for _, _, handle in self._due
+            if handle._wheel is not None  # noqa: SLF001
+        )
+        return handles
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> WheelTimerHandle:
+        """Schedule callback to be called at loop time when.
+
+        This method must be run in the event loop.
+        """
+        handle = WheelTimerHandle(when, callback, args, self._loop)
+        handle._wheel = self  # noqa: SLF001
+        handle._seq = seq = next(self._seq)  # noqa: SLF001
+        self._active += 1
+        if (bucket := int(when // BUCKET_SECONDS)) <= self._due_bucket:
+            handle._bucket = None  # noqa: SLF001
+            heappush(self._due, (when, seq, handle))
+            self._arm(when)
+            return handle
+        handle._bucket = bucket  # noqa: SLF001
+        if (timers := self._buckets.get(bucket)) is None:
+            timers = self._buckets[bucket] = {}
+            heappush(self._bucket_heap, bucket)
+        timers[seq] = handle
+        start = bucket * BUCKET_SECONDS
+        if self._handle is None or start < self._handle_when:
+            self._arm(start)
+        return handle
+
+    def _remove(self, handle: WheelTimerHandle) -> None:
+        """Remove a cancelled timer."""
+        self._active -= 1
+        if (bucket := handle._bucket) is not None:  # noqa: SLF001
+            timers = self._buckets[bucket]
+            del timers[handle._seq]  # noqa: SLF001
+            if not timers:
+                del self._buckets[bucket]
+        # Timers in the due heap are skipped when they are popped
+        if not self._active:
+            self._buckets.clear()
+            self._bucket_heap.clear()
+            self._due.clear()
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+
+    def _arm(self, when: float) -> None:
+        """Make sure the loop timer fires at or before when."""
+        if (handle := self._handle) is not None:
+            if when >= self._handle_when:
+                return
+            handle.cancel()
+        self._handle_when = when
+        self._handle = self._loop.call_at(when, self._run)
+
+    def _run(self) -> None:
+        """Run the timers that are due."""
+        self._handle = None
+        # The loop runs timers that are due within the clock resolution
+        now = max(self._loop.time(), self._handle_when)
+        bucket_now = int(now // BUCKET_SECONDS)
+        buckets = self._buckets
+        bucket_heap = self._bucket_heap
+        due = self._due
+        while bucket_heap and bucket_heap[0] <= bucket_now:
+            if timers := buckets.pop(heappop(bucket_heap), None):
+                for seq, handle in timers.items():
+                    handle._bucket = None  # noqa: SLF001
+                    heappush(due, (handle.when(), seq, handle))
+        self._due_bucket = bucket_now
+        # Collect the due timers first so timers scheduled by the
+        # callbacks run on the next iteration of the loop.
+        run: list[WheelTimerHandle] = []
+        while due and due[0][0] <= now:
+            handle = heappop(due)[2]
+            if handle._wheel is not None:  # noqa: SLF001
+                handle._wheel = None  # noqa: SLF001
+                run.append(handle)
+        self._active -= len(run)
+        for handle in run:
+            # A callback may have cancelled one of the later timers
+            if handle.cancelled():
+                continue
+            handle._run()  # noqa: SLF001
+            # Mark the timer as done for anyone inspecting it
+            handle.cancel()
+        while due and due[0][2]._wheel is None:  # noqa: SLF001
+            heappop(due)
+        while bucket_heap and bucket_heap[0] not in buckets:
+            heappop(bucket_heap)
+        if due:
+            self._arm(due[0][0])
+        elif bucket_heap:
+            self._arm(bucket_heap[0] * BUCKET_SECONDS)
+
+
+def get_timer_wheel(loop: AbstractEventLoop) -> TimerWheel:
+    """Return the timer wheel of an event loop."""
+    wheel: TimerWheel | None = getattr(loop, _TIMER_WHEEL, None)
+    if wheel is None:
+        wheel = TimerWheel(loop)
+        setattr(loop, _TIMER_WHEEL, wheel)
+    return wheel
+
+
+def get_timer_wheel_handles(loop: AbstractEventLoop) -> list[WheelTimerHandle]:
+    """Return the timers scheduled on the timer wheel of an event loop."""
+    wheel: TimerWheel | None = getattr(loop, _TIMER_WHEEL, None)
+    if wheel is None:
+        return []
+    return wheel.timer_handles()
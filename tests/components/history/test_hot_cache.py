@@ -0,0 +1,287 @@
+"""The tests for the history hot cache."""
+
+from datetime import timedelta
+from itertools import product
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.history.const import DATA_HOT_CACHE
+from homeassistant.components.history.hot_cache import HistoryHotCache
+from homeassistant.components.recorder import Recorder, history as recorder_history
+from homeassistant.const import ATTR_SUPPORTED_FEATURES, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+from tests.components.recorder.common import async_wait_recording_done
+from tests.typing import WebSocketGenerator
+
+ENTITY_IDS = ["sensor.test", "sensor.untracked", "climate.test", "light.test"]
+HOT_CACHE_CONFIG = {"history": {"hot_cache": {}}}
+
+
+async def _async_set_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Set states at one minute intervals."""
+    for sensor, climate, light in (
+        (("1", {"unit_of_measurement": "W"}), "heat", "on"),
+        (("1", {"unit_of_measurement": "kW"}), "heat", "off"),
+        (("2", {ATTR_SUPPORTED_FEATURES: 1}), "cool", "off"),
+        (("2", {"any": "attr"}), "cool", "on"),
+        (("3", {"any": "attr"}), "off", "on"),
+    ):
+        freezer.tick(timedelta(minutes=1))
+        hass.states.async_set("sensor.test", sensor[0], sensor[1])
+        hass.states.async_set(
+            "climate.test", climate, {"current_temperature": len(climate)}
+        )
+        hass.states.async_set("light.test", light, {"brightness": len(light)})
+
+
+async def test_history_during_period_matches_database(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period returns the same states from the hot cache."""
+    now = dt_util.utcnow()
+    hass.states.async_set("sensor.untracked", "on", {"any": "attr"})
+    await async_wait_recording_done(hass)
+    freezer.tick(timedelta(seconds=1))
+    await async_setup_component(hass, "history", HOT_CACHE_CONFIG)
+    await _async_set_states(hass, freezer)
+    await async_wait_recording_done(hass)
+    client = await hass_ws_client()
+
+    start_times = [now + timedelta(seconds=seconds) for seconds in (90, 150, 180)]
+    end_times = [None, now + timedelta(seconds=210), now + timedelta(seconds=240)]
+    for msg_id, (
+        start_time,
+        end_time,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    ) in enumerate(
+        product(
+            start_times,
+            end_times,
+            (True, False),
+            (True, False),
+            (True, False),
+            (True, False),
+        ),
+        1,
+    ):
+        expected = await recorder_mock.async_add_executor_job(
+            recorder_history.get_significant_states,
+            hass,
+            start_time,
+            end_time,
+            ENTITY_IDS,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+        request = {
+            "id": msg_id,
+            "type": "history/history_during_period",
+            "start_time": start_time.isoformat(),
+            "entity_ids": ENTITY_IDS,
+            "include_start_time_state": include_start_time_state,
+            "significant_changes_only": significant_changes_only,
+            "minimal_response": minimal_response,
+            "no_attributes": no_attributes,
+        }
+        if end_time:
+            request["end_time"] = end_time.isoformat()
+        with patch.object(
+            recorder_history,
+            "get_significant_states",
+            wraps=recorder_history.get_significant_states,
+        ) as get_significant_states:
+            await client.send_json(request)
+            response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == json_loads(json_bytes(expected)), request
+        assert list(response["result"]) == list(expected)
+        # Only the entity that was not seen by the cache is queried
+        if get_significant_states.call_args:
+            assert get_significant_states.call_args[0][3] == ["sensor.untracked"]
+
+
+async def test_history_during_period_served_from_cache(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period does not query the database for cached entities."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", HOT_CACHE_CONFIG)
+    await _async_set_states(hass, freezer)
+    await async_wait_recording_done(hass)
+    client = await hass_ws_client()
+
+    with patch.object(
+        recorder_history, "get_significant_states"
+    ) as get_significant_states:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": (now + timedelta(seconds=90)).isoformat(),
+                "entity_ids": ["light.test"],
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "light.test": [
+            {
+                "s": "on",
+                "a": {"brightness": 2},
+                "lu": (now + timedelta(seconds=90)).timestamp(),
+            },
+            {"s": "off", "lu": (now + timedelta(minutes=2)).timestamp()},
+            {"s": "on", "lu": (now + timedelta(minutes=4)).timestamp()},
+        ]
+    }
+    assert not get_significant_states.called
+
+
+async def test_hot_cache_eviction(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states are evicted by window, entity limit and total limit."""
+    await async_setup_component(hass, "history", {})
+    cache = HistoryHotCache(hass, timedelta(minutes=10), 5, 3)
+    cache.async_setup()
+    start_time = dt_util.utcnow()
+    # Only the committed states are served so pretend all of them are
+    recorder_mock.committed_state_changed_ts = float("inf")
+
+    def _covered(entity_id: str, start_time=start_time) -> bool:
+        return not cache.async_get_significant_states(
+            start_time, None, [entity_id], False, False, False, False
+        )[1]
+
+    for state in ("1", "2", "3", "4"):
+        freezer.tick(timedelta(seconds=1))
+        hass.states.async_set("sensor.one", state)
+    assert cache.size == 3
+    # The oldest states were dropped so the start is no longer covered
+    assert not _covered("sensor.one")
+    assert _covered("sensor.one", start_time + timedelta(seconds=2.5))
+
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.two", "1")
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.two", "2")
+    assert cache.size == 5
+    # The least recently used entity is evicted when the cache is full
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.three", "1")
+    assert cache.size == 3
+    assert not _covered("sensor.one", start_time + timedelta(seconds=2.5))
+    assert _covered("sensor.two", start_time + timedelta(seconds=5.5))
+
+    # States that fell out of the window are dropped except the newest
+    freezer.tick(timedelta(minutes=20))
+    hass.states.async_set("sensor.two", "3")
+    assert cache.size == 3
+    assert _covered("sensor.two", start_time + timedelta(seconds=6.5))
+    assert not _covered("sensor.two", start_time + timedelta(seconds=5.5))
+
+    # Removed entities are dropped
+    hass.states.async_remove("sensor.two")
+    assert cache.size == 1
+    assert not _covered("sensor.two", dt_util.utcnow())
+
+    # Nothing is cached while the recorder is disabled
+    recorder_mock.enabled = False
+    hass.states.async_set("sensor.three", "2")
+    assert cache.size == 0
+    recorder_mock.enabled = True
+    cache.async_shutdown()
+
+
+async def test_hot_cache_only_serves_committed_states(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the states the recorder has not committed are not served."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", HOT_CACHE_CONFIG)
+    await _async_set_states(hass, freezer)
+    await async_wait_recording_done(hass)
+    cache = hass.data[DATA_HOT_CACHE]
+    start_time = now + timedelta(seconds=90)
+
+    def _light_states() -> list[dict[str, Any]] | None:
+        result, not_covered = cache.async_get_significant_states(
+            start_time, None, ["light.test"], False, False, True, False
+        )
+        if not_covered:
+            return None
+        return result.get("light.test", [])
+
+    assert len(_light_states()) == 2
+    # The state at 4 minutes is still pending in the recorder
+    recorder_mock.committed_state_changed_ts = (now + timedelta(minutes=3)).timestamp()
+    assert _light_states() == [
+        {
+            "s": "off",
+            "a": {"brightness": 3},
+            "lu": (now + timedelta(minutes=2)).timestamp(),
+        }
+    ]
+    # Nothing of the entity is committed
+    recorder_mock.committed_state_changed_ts = now.timestamp()
+    assert _light_states() is None
+
+
+async def test_hot_cache_opt_in(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the hot cache is only set up when it is configured."""
+    await async_setup_component(hass, "history", {})
+    assert DATA_HOT_CACHE not in hass.data
+    hass.states.async_set("light.test", "on")
+    await async_wait_recording_done(hass)
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": dt_util.utcnow().isoformat(),
+            "entity_ids": ["light.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert list(response["result"]) == ["light.test"]
+
+
+async def test_hot_cache_shutdown_on_stop(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the hot cache stops populating when Home Assistant stops."""
+    await async_setup_component(hass, "history", HOT_CACHE_CONFIG)
+    cache = hass.data[DATA_HOT_CACHE]
+    hass.states.async_set("light.test", "on")
+    assert cache.size == 1
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert cache.size == 0
+    hass.states.async_set("light.test", "off")
+    assert cache.size == 0
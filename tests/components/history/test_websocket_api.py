@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+import threading
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -12,6 +13,7 @@ from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -2154,3 +2156,132 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_during_period_in_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends chunk events before the result."""
+    now = dt_util.utcnow()
+    for state in ("on", "off", "on", "off"):
+        hass.states.async_set("light.one", state, {"any": "attr"})
+        hass.states.async_set("light.two", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["light.one", "light.two"],
+        "minimal_response": True,
+    }
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected["light.one"]) == 4
+
+    await client.send_json({"id": 2, **request, "chunk_size": 3})
+    streamed: dict[str, list[dict]] = {}
+    chunks = 0
+    while (response := await client.receive_json())["type"] == "event":
+        assert response["id"] == 2
+        chunks += 1
+        for entity_id, entity_states in response["event"]["states"].items():
+            streamed.setdefault(entity_id, []).extend(entity_states)
+    assert response["id"] == 2
+    assert response["success"]
+    assert response["result"] == {}
+    assert chunks == 3
+    assert streamed == expected
+
+
+class _SlowConnection:
+    """Connection that sends the pending messages when they are waited for."""
+
+    def __init__(self, drain: bool = True) -> None:
+        """Initialize the connection."""
+        self.drain = drain
+        self.pending = 0
+        self.sent = 0
+
+    def send_message(self, message: bytes) -> None:
+        """Queue a message."""
+        self.pending += 1
+
+    async def async_wait_for_pending_messages(self, max_pending: int) -> None:
+        """Send the pending messages."""
+        if not self.drain:
+            await asyncio.Event().wait()
+        await asyncio.sleep(0)
+        self.sent += self.pending
+        self.pending = 0
+
+
+def _send_significant_states_in_chunks(
+    hass: HomeAssistant, connection: _SlowConnection
+) -> None:
+    """Send the history of light.one in chunks from the executor."""
+    websocket_api._ws_send_significant_states_in_chunks(
+        hass,
+        connection,
+        1,
+        dt_util.utcnow(),
+        None,
+        ["light.one"],
+        True,
+        True,
+        True,
+        True,
+        1,
+        threading.Event(),
+    )
+
+
+async def test_history_chunks_wait_for_the_client(hass: HomeAssistant) -> None:
+    """Test chunks are only fetched when the previous chunks were sent."""
+    fetched = 0
+    connection = _SlowConnection()
+
+    def _stream_significant_states(*args):
+        nonlocal fetched
+        for idx in range(10):
+            assert (
+                fetched - connection.sent <= history.const.MAX_PENDING_HISTORY_MESSAGES
+            )
+            fetched += 1
+            yield {"light.one": [{"s": str(idx)}]}
+
+    with patch.object(
+        websocket_api.history,
+        "stream_significant_states",
+        _stream_significant_states,
+    ):
+        await hass.async_add_executor_job(
+            _send_significant_states_in_chunks, hass, connection
+        )
+    assert fetched == connection.sent == 10
+
+
+async def test_history_chunks_timeout(hass: HomeAssistant) -> None:
+    """Test sending chunks stops when the client does not receive them."""
+    connection = _SlowConnection(drain=False)
+
+    def _stream_significant_states(*args):
+        yield from ({"light.one": [{"s": str(idx)}]} for idx in range(10))
+
+    with (
+        patch.object(
+            websocket_api.history,
+            "stream_significant_states",
+            _stream_significant_states,
+        ),
+        patch.object(websocket_api, "HISTORY_CHUNK_SEND_TIMEOUT", 0.01),
+        pytest.raises(HomeAssistantError, match="Timed out waiting for the client"),
+    ):
+        await hass.async_add_executor_job(
+            _send_significant_states_in_chunks, hass, connection
+        )
+    assert connection.pending == 1
@@ -1,5 +1,7 @@
 """The tests for the Event automation."""
 
+from typing import Any
+
 import pytest
 
 from homeassistant.components import automation
@@ -430,6 +432,47 @@ async def test_if_not_fires_if_event_data_not_matches(
     assert len(service_calls) == 0
 
 
+@pytest.mark.parametrize(
+    ("event_data", "match_data"),
+    [
+        ({"some_attr": "some_value"}, {"some_attr": "some_value"}),
+        ({"some_attr": "some_value", "other_attr": "*"}, None),
+        ({"some_attr": [1, 2]}, None),
+    ],
+)
+async def test_event_data_matched_by_event_bus(
+    hass: HomeAssistant,
+    service_calls: list[ServiceCall],
+    event_data: dict[str, Any],
+    match_data: dict[str, Any] | None,
+) -> None:
+    """Test simple event data is matched by the event bus."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "test_event",
+                    "event_data": event_data,
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    indexed = hass.bus._indexed_listeners.get("test_event", {})
+    assert set(indexed) == set(match_data or ())
+
+    hass.bus.async_fire("test_event", {"some_attr": "some_other_value"})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 0
+
+    hass.bus.async_fire("test_event", {**event_data, "extra": 1})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 1
+
+
 async def test_if_not_fires_if_event_context_not_matches(
     hass: HomeAssistant, service_calls: list[ServiceCall], context_with_user: Context
 ) -> None:
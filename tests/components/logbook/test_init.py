@@ -2764,6 +2764,86 @@ async def test_get_events_with_device_ids(
     assert isinstance(results[3]["when"], float)
 
 
+@pytest.mark.parametrize("context_index_active", [True, False])
+async def test_logbook_entities_context_origin(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    context_index_active: bool,
+) -> None:
+    """Test the rows that started the contexts are found with and without the context index."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("alarm_control_panel.area_001", STATE_OFF)
+    hass.states.async_set("light.switch", STATE_OFF)
+    await hass.async_block_till_done()
+
+    # A context started by a state change
+    automation_context = ha.Context(user_id="b400facee45711eaa9308bfd3d19e474")
+    hass.states.async_set(
+        "automation.alarm",
+        STATE_ON,
+        {ATTR_FRIENDLY_NAME: "Alarm Automation"},
+        context=automation_context,
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set(
+        "alarm_control_panel.area_001", STATE_ON, context=automation_context
+    )
+    await hass.async_block_till_done()
+
+    # A context started by a service call
+    hass.states.async_set("light.switch", STATE_ON)
+    await hass.async_block_till_done()
+    service_context = ha.Context(user_id="9400facee45711eaa9308bfd3d19e474")
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {
+            ATTR_DOMAIN: "light",
+            ATTR_SERVICE: "turn_off",
+            ATTR_ENTITY_ID: "light.switch",
+        },
+        context=service_context,
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.switch", STATE_OFF, context=service_context)
+    await async_wait_recording_done(hass)
+
+    assert recorder_mock.context_index_manager.active
+    recorder_mock.context_index_manager.active = context_index_active
+
+    client = await hass_client()
+    start = dt_util.utcnow() - timedelta(hours=1)
+    response = await client.get(
+        f"/api/logbook/{start.isoformat()}",
+        params={"entity": "alarm_control_panel.area_001,light.switch"},
+    )
+    assert response.status == HTTPStatus.OK
+    json_dict = await response.json()
+
+    assert len(json_dict) == 3
+    assert json_dict[0]["entity_id"] == "alarm_control_panel.area_001"
+    assert json_dict[0]["context_entity_id"] == "automation.alarm"
+    assert json_dict[0]["context_entity_id_name"] == "Alarm Automation"
+    assert json_dict[0]["context_state"] == STATE_ON
+    assert json_dict[0]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
+
+    assert json_dict[1]["entity_id"] == "light.switch"
+    assert "context_event_type" not in json_dict[1]
+
+    assert json_dict[2]["entity_id"] == "light.switch"
+    assert json_dict[2]["context_event_type"] == "call_service"
+    assert json_dict[2]["context_domain"] == "light"
+    assert json_dict[2]["context_service"] == "turn_off"
+    assert json_dict[2]["context_user_id"] == "9400facee45711eaa9308bfd3d19e474"
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_logbook_select_entities_context_id(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
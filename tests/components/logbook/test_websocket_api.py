@@ -29,6 +29,8 @@ from homeassistant.const import (
     CONF_INCLUDE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_LOGBOOK_ENTRY,
+    EVENT_STATE_CHANGED,
     STATE_OFF,
     STATE_ON,
 )
@@ -2427,8 +2429,19 @@ async def test_stream_consumer_stop_processing(
         hass.states.async_set("binary_sensor.is_light", STATE_OFF)
     await async_wait_recording_done(hass)
 
+    # The state changes of the flapping entity are
+    # merged once the buffer is full
+    assert listeners_without_writes(
+        hass.bus.async_listeners()
+    ) != listeners_without_writes(after_ws_created_listeners)
+    for _ in range(6):
+        logbook.async_log_entry(
+            hass, "Alarm", "is triggered", entity_id="binary_sensor.is_light"
+        )
+    await async_wait_recording_done(hass)
+
     # Check our listener got unsubscribed because
-    # the queue got full and the overload safety tripped
+    # the buffer got full and the overload safety tripped
     assert listeners_without_writes(
         hass.bus.async_listeners()
     ) == listeners_without_writes(after_ws_created_listeners)
@@ -2438,6 +2451,52 @@ async def test_stream_consumer_stop_processing(
     ) == listeners_without_writes(init_listeners)
 
 
+async def test_stream_buffer_merges_state_changes_when_full(
+    hass: HomeAssistant,
+) -> None:
+    """Test the stream buffer merges state changes of an entity once it is full."""
+    buffer = websocket_api.LogbookStreamBuffer(3)
+    events: list[Event] = []
+
+    @callback
+    def _capture(event: Event) -> None:
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _capture)
+    hass.bus.async_listen(EVENT_LOGBOOK_ENTRY, _capture)
+    hass.states.async_set("light.kitchen", STATE_ON)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.hallway", STATE_ON)
+    hass.states.async_set("light.kitchen", STATE_ON)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    logbook.async_log_entry(hass, "Alarm", "is triggered", entity_id="light.kitchen")
+    hass.states.async_set("light.porch", STATE_ON)
+    await hass.async_block_till_done()
+
+    assert [buffer.async_put(event) for event in events] == [
+        True,
+        True,
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
+    assert len(buffer) == 3
+    # The merged state change is delivered in order with the newest state
+    assert [
+        (event.data["entity_id"], event.data["new_state"].state)
+        for event in buffer.async_drain()
+    ] == [
+        ("light.kitchen", STATE_ON),
+        ("light.hallway", STATE_ON),
+        ("light.kitchen", STATE_OFF),
+    ]
+    assert len(buffer) == 0
+    assert buffer.async_put(events[-1])
+    assert buffer.async_drain() == [events[-1]]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_recorder_is_far_behind(
     recorder_mock: Recorder,
@@ -18,6 +18,7 @@ from homeassistant.components.profiler import (
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_STARTUP_TRACE,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
@@ -27,14 +28,20 @@ from homeassistant.components.profiler import (
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_LOG_TEMPLATE_RENDERS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_LOG_TEMPLATE_RENDERS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.template import Template
+from homeassistant.helpers.template_profiler import DATA_TEMPLATE_PROFILER
+from homeassistant.setup import async_start_startup_trace
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import load_json
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 
@@ -164,6 +171,76 @@ async def test_object_growth_logging(
     assert "Growth" not in caplog.text
 
 
+async def test_template_render_logging(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test we can log the templates that take the most time to render."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_START_LOG_TEMPLATE_RENDERS)
+    assert hass.services.has_service(DOMAIN, SERVICE_STOP_LOG_TEMPLATE_RENDERS)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_START_LOG_TEMPLATE_RENDERS,
+        {CONF_SCAN_INTERVAL: 1},
+        blocking=True,
+    )
+    with pytest.raises(
+        HomeAssistantError, match="Template render logging already started"
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_START_LOG_TEMPLATE_RENDERS,
+            {CONF_SCAN_INTERVAL: 1},
+            blocking=True,
+        )
+
+    hass.states.async_set("sensor.slow", "on")
+    tpl = Template("{{ 1 + 1 }}", hass)
+    for _ in range(3):
+        tpl.async_render({"this": hass.states.get("sensor.slow")})
+        tpl.async_render()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert "Template rendered 6 times" in caplog.text
+    assert "for sensor.slow:" in caplog.text
+    caplog.clear()
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_LOG_TEMPLATE_RENDERS, {}, blocking=True
+    )
+    assert "Template rendered 6 times" in caplog.text
+    assert DATA_TEMPLATE_PROFILER not in hass.data
+    caplog.clear()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=21))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert "Template rendered" not in caplog.text
+
+    with pytest.raises(HomeAssistantError, match="Template render logging not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_LOG_TEMPLATE_RENDERS, {}, blocking=True
+        )
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_START_LOG_TEMPLATE_RENDERS,
+        {CONF_SCAN_INTERVAL: 10},
+        blocking=True,
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DATA_TEMPLATE_PROFILER not in hass.data
+
+
 async def test_dump_log_object(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -447,3 +524,43 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_dump_startup_trace(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test dumping the startup trace."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_DUMP_STARTUP_TRACE)
+
+    with pytest.raises(HomeAssistantError, match="The startup was not traced"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    tracer = async_start_startup_trace(hass)
+    with tracer.span("setup august", "setup", "august"):
+        pass
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(tmp_path / filename)
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    trace = load_json(last_filename)
+    assert [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"] == [
+        "setup august"
+    ]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
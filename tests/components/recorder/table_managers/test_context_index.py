@@ -0,0 +1,111 @@
+"""Test the context index table manager."""
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import ContextIndex, Events, States
+from homeassistant.components.recorder.migration import ContextIndexMigration
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.util.ulid import ulid_to_bytes
+
+from ..common import async_wait_recording_done
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"bulk_insert": False}, {"bulk_insert": True}]
+)
+async def test_first_row_of_context_indexed(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the first event or state of each context is indexed."""
+    assert recorder_mock.context_index_manager.active
+
+    event_context = Context()
+    hass.bus.async_fire("test_event", {"some": "data"}, context=event_context)
+    hass.states.async_set("light.kitchen", "on", context=event_context)
+    state_context = Context()
+    hass.states.async_set("light.hallway", "on", context=state_context)
+    await async_wait_recording_done(hass)
+    # A later row of an indexed context is not indexed again
+    hass.states.async_set("light.kitchen", "off", context=event_context)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        index = {row.context_id_bin: row for row in session.query(ContextIndex)}
+        event = (
+            session.query(Events)
+            .filter(Events.context_id_bin == ulid_to_bytes(event_context.id))
+            .one()
+        )
+        state = (
+            session.query(States)
+            .filter(States.context_id_bin == ulid_to_bytes(state_context.id))
+            .one()
+        )
+        event_row = index[ulid_to_bytes(event_context.id)]
+        assert event_row.event_id == event.event_id
+        assert event_row.state_id is None
+        assert event_row.time_fired_ts == event.time_fired_ts
+        state_row = index[ulid_to_bytes(state_context.id)]
+        assert state_row.event_id is None
+        assert state_row.state_id == state.state_id
+        assert state_row.time_fired_ts == state.last_updated_ts
+
+
+async def test_context_index_migration(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the migration indexes the contexts of existing rows."""
+    context = Context()
+    hass.bus.async_fire("test_event", context=context)
+    hass.states.async_set("light.kitchen", "on", context=context)
+    other_context = Context()
+    hass.states.async_set("light.kitchen", "off", context=other_context)
+    await async_wait_recording_done(hass)
+    context_id_bin = ulid_to_bytes(context.id)
+    other_context_id_bin = ulid_to_bytes(other_context.id)
+
+    def _index_rows() -> dict[bytes, tuple[int | None, int | None]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return {
+                row.context_id_bin: (row.event_id, row.state_id)
+                for row in session.query(ContextIndex)
+            }
+
+    def _rewind_index() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(ContextIndex).filter(
+                ContextIndex.context_id_bin == other_context_id_bin
+            ).delete()
+            # The recorder indexed a later row of the context
+            # before the migration reached the first one
+            state = (
+                session.query(States)
+                .filter(States.context_id_bin == context_id_bin)
+                .one()
+            )
+            session.query(ContextIndex).filter(
+                ContextIndex.context_id_bin == context_id_bin
+            ).update(
+                {
+                    ContextIndex.event_id: None,
+                    ContextIndex.state_id: state.state_id,
+                    ContextIndex.time_fired_ts: state.last_updated_ts,
+                }
+            )
+
+    expected = await recorder_mock.async_add_executor_job(_index_rows)
+    await recorder_mock.async_add_executor_job(_rewind_index)
+    assert await recorder_mock.async_add_executor_job(_index_rows) != expected
+
+    recorder_mock.context_index_manager.active = False
+    migrator = ContextIndexMigration(
+        initial_schema_version=50, start_schema_version=50, migration_changes={}
+    )
+    while not await recorder_mock.async_add_executor_job(
+        migrator.migrate_data, recorder_mock
+    ):
+        pass
+    assert recorder_mock.context_index_manager.active
+    assert await recorder_mock.async_add_executor_job(_index_rows) == expected
@@ -5,7 +5,9 @@ from __future__ import annotations
 from collections.abc import Generator
 from copy import copy
 from datetime import datetime, timedelta
+from itertools import product
 import json
+from typing import Any
 from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
@@ -751,6 +753,60 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.usefixtures("multiple_start_time_chunk_sizes")
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+async def test_stream_significant_states(hass: HomeAssistant, chunk_size: int) -> None:
+    """Test streamed significant states match get_significant_states."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = list(states)
+
+    for (
+        start_time,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    ) in product(
+        (zero - timedelta(days=2), zero, zero + timedelta(seconds=2.5)),
+        (True, False),
+        (True, False),
+        (True, False),
+        (True, False),
+    ):
+        expected = history.get_significant_states(
+            hass,
+            start_time,
+            four,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+        streamed: dict[str, list[dict[str, Any]]] = {}
+        for chunk in history.stream_significant_states(
+            hass,
+            start_time,
+            four,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+        ):
+            assert sum(len(entity_states) for entity_states in chunk.values()) > 0
+            assert sum(len(entity_states) for entity_states in chunk.values()) <= (
+                chunk_size
+            )
+            for entity_id, entity_states in chunk.items():
+                streamed.setdefault(entity_id, []).extend(entity_states)
+        assert streamed == expected
+
+
 def record_states(
     hass: HomeAssistant,
 ) -> tuple[datetime, datetime, dict[str, list[State]]]:
@@ -138,6 +138,10 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        bulk_insert=False,
+        db_read_pool_size=0,
+        vectorized_statistics=False,
+        incremental_statistics=False,
     )
 
 
@@ -260,6 +264,9 @@ async def test_state_gets_saved_when_set_before_start_event(
         assert db_states[0].event_id is None
 
 
+@pytest.mark.parametrize(
+    "recorder_config", [{"bulk_insert": False}, {"bulk_insert": True}]
+)
 async def test_saving_state(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving and restoring a state."""
     entity_id = "test.recorder"
@@ -362,6 +369,39 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_states_with_shared_attributes(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test attributes shared between states are only serialized once."""
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as shared_attrs_bytes_from_event:
+        for state in ("on", "off", "on"):
+            hass.states.async_set("test.one", state, dict(attributes))
+            hass.states.async_set("test.two", state, dict(attributes))
+        # Attributes are serialized again when the unrecorded attributes change
+        hass.states.async_set(
+            "test.two",
+            "off",
+            dict(attributes),
+            state_info={"unrecorded_attributes": frozenset({"test_attr"})},
+        )
+        await async_wait_recording_done(hass)
+
+    assert shared_attrs_bytes_from_event.call_count == 2
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 7
+        assert {
+            db_state_attributes.shared_attrs
+            for db_state_attributes in session.query(StateAttributes)
+        } == {'{"test_attr":5,"test_attr_10":"nice"}', '{"test_attr_10":"nice"}'}
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, setup_recorder: None
 ) -> None:
@@ -1447,6 +1487,9 @@ async def test_compile_missing_statistics(
         await hass.async_stop()
 
 
+@pytest.mark.parametrize(
+    "recorder_config", [{"bulk_insert": False}, {"bulk_insert": True}]
+)
 async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving sets old state."""
     hass.states.async_set("test.one", "s1", {})
@@ -1475,6 +1518,113 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+async def test_bulk_insert_sets_old_state_across_commits(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test bulk insert links old states inside and across commits."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_insert": True})
+    assert instance._states_buffer is not None
+
+    hass.states.async_set("test.one", "s1", {})
+    hass.states.async_set("test.one", "s2", {})
+    hass.states.async_set("test.one", "s3", {})
+    hass.states.async_set("test.two", "s4", {})
+    hass.bus.async_fire("bulk_event", {"some": "data"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s5", {}, force_update=True)
+    hass.states.async_set("test.one", "s5", {})
+    hass.states.async_remove("test.two")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.last_reported_ts,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        )
+        assert [state.state for state in states] == ["s1", "s2", "s3", "s4", "s5", None]
+        s1, s2, s3, s4, s5, removed = states
+        assert s1.entity_id == s2.entity_id == s3.entity_id == s5.entity_id
+        assert s4.entity_id == removed.entity_id == "test.two"
+        assert s1.old_state_id is None
+        assert s2.old_state_id == s1.state_id
+        assert s3.old_state_id == s2.state_id
+        assert s4.old_state_id is None
+        assert s5.old_state_id == s3.state_id
+        assert removed.old_state_id == s4.state_id
+        assert (
+            s5.last_reported_ts == hass.states.get("test.one").last_reported_timestamp
+        )
+
+        events = list(
+            session.query(Events).filter(
+                Events.event_type_id.in_(select_event_type_ids(("bulk_event",)))
+            )
+        )
+        assert len(events) == 1
+        assert events[0].data_id is not None
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.parametrize("recorder_config", [{"db_read_pool_size": 2}])
+async def test_read_pool(
+    hass: HomeAssistant, setup_recorder: None, recorder_db_url: str
+) -> None:
+    """Test read-only queries use the read pool when enabled."""
+    if not recorder_db_url.startswith("sqlite://"):
+        pytest.skip("The read pool is only used with SQLite")
+    instance = get_instance(hass)
+    hass.states.async_set("test.one", "s1", {})
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> tuple[str, list[str | None]]:
+        session = instance.get_read_only_session()
+        with session_scope(session=session, read_only=True):
+            assert session.get_bind() is instance._read_engine
+            return (
+                threading.current_thread().name,
+                [row.state for row in session.query(States.state)],
+            )
+
+    thread_name, states = await instance.async_add_read_executor_job(_read_states)
+    assert thread_name.startswith(recorder.const.DB_READ_WORKER_PREFIX)
+    assert states == ["s1"]
+
+    def _write_state() -> None:
+        with session_scope(session=instance.get_read_only_session()) as session:
+            session.add(States(state="s2"))
+
+    with pytest.raises(OperationalError, match="readonly"):
+        await instance.async_add_read_executor_job(_write_state)
+
+
+async def test_read_pool_disabled_for_in_memory_database(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the read pool is not used with an in-memory database."""
+    instance = await async_setup_recorder_instance(hass, {"db_read_pool_size": 2})
+    assert instance._db_read_executor is None
+    assert instance._read_engine is None
+
+    def _get_bind() -> Any:
+        session = instance.get_read_only_session()
+        with session_scope(session=session, read_only=True):
+            return session.get_bind()
+
+    assert await instance.async_add_read_executor_job(_get_bind) is instance.engine
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"bulk_insert": False}, {"bulk_insert": True}]
+)
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -2133,6 +2283,9 @@ async def test_database_connection_keep_alive_disabled_on_sqlite(
     assert "Sending keepalive" not in caplog.text
 
 
+@pytest.mark.parametrize(
+    "recorder_config", [{"bulk_insert": False}, {"bulk_insert": True}]
+)
 async def test_deduplication_event_data_inside_commit_interval(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -2156,6 +2309,9 @@ async def test_deduplication_event_data_inside_commit_interval(
         assert all(event.data_id == first_data_id for event in events)
 
 
+@pytest.mark.parametrize(
+    "recorder_config", [{"bulk_insert": False}, {"bulk_insert": True}]
+)
 async def test_deduplication_state_attributes_inside_commit_interval(
     small_cache_size: None,
     hass: HomeAssistant,
@@ -15,6 +15,7 @@ from voluptuous.error import MultipleInvalid
 from homeassistant.components.recorder import DOMAIN, Recorder
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
+    ContextIndex,
     Events,
     EventTypes,
     RecorderRuns,
@@ -359,6 +360,36 @@ async def test_purge_old_events(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert events.count() == 2
 
 
+async def test_purge_old_context_index(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test deleting the context index rows of old events and states."""
+    await _add_test_events(hass)
+    await _add_test_states(hass)
+
+    with session_scope(hass=hass) as session:
+        index_count = session.query(ContextIndex).count()
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    while not purge_old_data(
+        recorder_mock,
+        purge_before,
+        repack=False,
+        events_batch_size=1,
+        states_batch_size=1,
+    ):
+        pass
+
+    with session_scope(hass=hass) as session:
+        rows = session.query(ContextIndex).all()
+        # 4 events and 4 states were purged
+        assert len(rows) == index_count - 8
+        event_ids = {event_id for (event_id,) in session.query(Events.event_id)}
+        state_ids = {state_id for (state_id,) in session.query(States.state_id)}
+        for row in rows:
+            assert row.event_id in event_ids or row.state_id in state_ids
+
+
 async def test_purge_old_recorder_runs(
     hass: HomeAssistant, recorder_mock: Recorder
 ) -> None:
@@ -7,7 +7,7 @@ from typing import Any
 from unittest.mock import ANY, Mock, patch
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, text
 import voluptuous as vol
 
 from homeassistant import exceptions
@@ -436,10 +436,18 @@ def mock_from_stats():
             return None
         return real_from_stats(metadata_id, stats, now_timestamp)
 
-    with patch(
-        "homeassistant.components.recorder.statistics.StatisticsShortTerm.from_stats",
-        side_effect=from_stats,
-        autospec=True,
+    # Rows are only created with from_stats when the
+    # database does not support bulk inserts
+    with (
+        patch(
+            "homeassistant.components.recorder.statistics.StatisticsShortTerm.from_stats",
+            side_effect=from_stats,
+            autospec=True,
+        ),
+        patch(
+            "homeassistant.components.recorder.statistics.supports_bulk_insert",
+            return_value=False,
+        ),
     ):
         yield
 
@@ -486,6 +494,33 @@ async def test_compile_periodic_statistics_exception(
     }
 
 
+async def test_compile_periodic_statistics_bulk_insert_exception(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    mock_sensor_statistics,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the rows are inserted one at a time when the bulk insert fails."""
+    await async_setup_component(hass, "sensor", {})
+
+    now = get_start_time(dt_util.utcnow())
+    with patch(
+        "homeassistant.components.recorder.statistics._INSERT_SHORT_TERM_STATISTICS_RETURNING",
+        text("INSERT INTO missing_table VALUES (:metadata_id)"),
+    ):
+        do_adhoc_statistics(hass, start=now)
+        await async_wait_recording_done(hass)
+    assert "Unexpected exception when inserting 3 statistics in bulk" in caplog.text
+
+    stats = statistics_during_period(hass, now, period="5minute")
+    assert list(stats) == ["sensor.test1", "sensor.test2", "sensor.test3"]
+    assert get_short_term_statistics_run_cache(hass).get_latest_ids({1, 2, 3}) == {
+        1: 1,
+        2: 2,
+        3: 3,
+    }
+
+
 async def test_rename_entity(
     hass: HomeAssistant, entity_registry: er.EntityRegistry, setup_recorder: None
 ) -> None:
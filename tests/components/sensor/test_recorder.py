@@ -4,6 +4,7 @@ from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
 import logging
 import math
+import random
 from statistics import mean
 from typing import Any, Literal
 from unittest.mock import ANY, patch
@@ -44,6 +45,7 @@ from homeassistant.components.sensor import (
     DOMAIN,
     SensorDeviceClass,
     SensorStateClass,
+    recorder as sensor_recorder,
 )
 from homeassistant.components.sensor.recorder import (
     MEAN_TYPE_CHANGED_ISSUE,
@@ -328,6 +330,10 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"vectorized_statistics": False}, {"vectorized_statistics": True}],
+)
 async def test_compile_hourly_statistics_angle(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -386,6 +392,253 @@ async def test_compile_hourly_statistics_angle(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_vectorized_statistics_equivalence(hass: HomeAssistant) -> None:
+    """Test vectorized statistics match the per entity calculations."""
+    rng = random.Random(1234)
+    start = get_start_time(dt_util.utcnow())
+    end = start + timedelta(minutes=5)
+    wanted_statistics = {}
+    to_process = []
+    for idx in range(200):
+        entity_id = f"sensor.test{idx}"
+        state_class = rng.choice(list(sensor_recorder.DEFAULT_STATISTICS))
+        wanted_statistics[entity_id] = sensor_recorder.DEFAULT_STATISTICS[state_class]
+        # The first state may be from before the period
+        offsets = sorted(rng.uniform(-60, 300) for _ in range(rng.randint(1, 20)))
+        if rng.random() < 0.2:
+            # States with the same last_updated
+            offsets.append(offsets[-1])
+        fstates = []
+        for offset in offsets:
+            fstate = rng.uniform(0, 360)
+            fstates.append(
+                (
+                    fstate,
+                    State(
+                        entity_id,
+                        str(fstate),
+                        last_updated=max(start, start + timedelta(seconds=offset)),
+                    ),
+                )
+            )
+        to_process.append((entity_id, None, state_class, fstates))
+
+    vectorized = sensor_recorder._vectorized_statistics(
+        hass, wanted_statistics, to_process, start, end
+    )
+
+    expected = {}
+    for entity_id, _, _, fstates in to_process:
+        wanted = wanted_statistics[entity_id]
+        stat = {}
+        if "max" in wanted.types:
+            stat["max"] = max(fstate for fstate, _ in fstates)
+        if "min" in wanted.types:
+            stat["min"] = min(fstate for fstate, _ in fstates)
+        if wanted.mean_type is StatisticMeanType.ARITHMETIC:
+            stat["mean"] = pytest.approx(
+                sensor_recorder._time_weighted_arithmetic_mean(fstates, start, end)
+            )
+        elif wanted.mean_type is StatisticMeanType.CIRCULAR:
+            mean, weight = sensor_recorder._time_weighted_circular_mean(
+                fstates, start, end
+            )
+            stat["mean"] = pytest.approx(mean)
+            stat["mean_weight"] = pytest.approx(weight)
+        if stat:
+            expected[entity_id] = stat
+    assert vectorized == expected
+
+
+async def test_vectorized_statistics_without_numpy(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test statistics are calculated per entity without numpy."""
+    start = get_start_time(dt_util.utcnow())
+    to_process = [
+        (
+            "sensor.test1",
+            None,
+            SensorStateClass.MEASUREMENT,
+            [(1.0, State("sensor.test1", "1", last_updated=start))],
+        )
+    ]
+    wanted_statistics = {
+        "sensor.test1": sensor_recorder.DEFAULT_STATISTICS[SensorStateClass.MEASUREMENT]
+    }
+    with patch.dict("sys.modules", {"numpy": None}):
+        for _ in range(2):
+            assert (
+                sensor_recorder._vectorized_statistics(
+                    hass,
+                    wanted_statistics,
+                    to_process,
+                    start,
+                    start + timedelta(minutes=5),
+                )
+                == {}
+            )
+    assert caplog.text.count("Vectorized statistics need numpy") == 1
+
+
+def _compile_sensor_statistics(
+    hass: HomeAssistant, start: datetime
+) -> dict[str, dict[str, Any]]:
+    """Compile the statistics of the sensors without storing them."""
+    with session_scope(hass=hass, read_only=True) as session:
+        compiled = sensor_recorder.compile_statistics(
+            hass, session, start, start + timedelta(minutes=5)
+        )
+    return {
+        item["meta"]["statistic_id"]: {"meta": item["meta"], **item["stat"]}
+        for item in compiled.platform_stats
+    }
+
+
+@pytest.mark.parametrize(
+    ("recorder_config", "state_changed_platforms"),
+    [({}, set()), ({"incremental_statistics": True}, {"sensor"})],
+)
+async def test_record_state_changed_registered(
+    recorder_mock: Recorder, hass: HomeAssistant, state_changed_platforms: set[str]
+) -> None:
+    """Test state changes are only accumulated with incremental statistics."""
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    assert set(recorder_mock.state_changed_platforms) == state_changed_platforms
+
+    hass.states.async_set("sensor.test1", "10", TEMPERATURE_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+    assert (sensor_recorder.DATA_STATISTICS_ACCUMULATOR in hass.data) == bool(
+        state_changed_platforms
+    )
+
+
+@pytest.mark.parametrize("recorder_config", [{"incremental_statistics": True}])
+async def test_compile_statistics_incremental(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test statistics accumulated from the recorded states match the database."""
+    zero = get_start_time(dt_util.utcnow())
+    period = zero + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    temperature = TEMPERATURE_SENSOR_ATTRIBUTES
+    wind = WIND_DIRECTION_ATTRIBUTES
+    energy = {**ENERGY_SENSOR_ATTRIBUTES, "state_class": "total_increasing"}
+    power = {**POWER_SENSOR_ATTRIBUTES, "unit_of_measurement": "W"}
+    changes: list[tuple[datetime, str, str, dict[str, Any]]] = [
+        (zero, "sensor.temperature", "10", temperature),
+        (zero, "sensor.static", "3", temperature),
+        (zero, "sensor.flapping", "5", temperature),
+        (zero, "sensor.offline", "4", temperature),
+        (zero, "sensor.wind", "350", wind),
+        (zero, "sensor.energy", "100", energy),
+        (zero, "sensor.power", "500", power),
+        (zero + timedelta(minutes=1), "sensor.offline", "unavailable", temperature),
+        (period + timedelta(seconds=30), "sensor.temperature", "20", temperature),
+        (period + timedelta(seconds=30), "sensor.flapping", "unavailable", temperature),
+        (period + timedelta(seconds=30), "sensor.wind", "10", wind),
+        (period + timedelta(seconds=30), "sensor.energy", "110", energy),
+        (period + timedelta(seconds=30), "sensor.power", "2", POWER_SENSOR_ATTRIBUTES),
+        (period + timedelta(minutes=1), "sensor.flapping", "7", temperature),
+        (period + timedelta(minutes=1), "sensor.energy", "5", energy),
+        (period + timedelta(minutes=2), "sensor.wind", "20", wind),
+        # Attribute changes
+        (
+            period + timedelta(minutes=2),
+            "sensor.temperature",
+            "20",
+            {**temperature, "friendly_name": "Temperature"},
+        ),
+        (period + timedelta(minutes=2), "sensor.energy", "5", {**energy, "a": 1}),
+        (period + timedelta(minutes=3), "sensor.temperature", "30", temperature),
+        (period + timedelta(minutes=4), "sensor.energy", "8", energy),
+        # A later period
+        (period + timedelta(minutes=6), "sensor.temperature", "40", temperature),
+    ]
+    with freeze_time(zero) as freezer:
+        for time, entity_id, state, attributes in changes:
+            freezer.move_to(time)
+            hass.states.async_set(entity_id, state, attributes)
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.sensor.recorder._entities_with_float_states",
+        wraps=sensor_recorder._entities_with_float_states,
+    ) as read_states:
+        incremental = await recorder_mock.async_add_executor_job(
+            _compile_sensor_statistics, hass, period
+        )
+    # Only the sensor which changed unit is read from the database
+    assert [state.entity_id for state in read_states.call_args.args[2]] == [
+        "sensor.power"
+    ]
+    # The statistics of a period are only accumulated once
+    with patch(
+        "homeassistant.components.sensor.recorder._entities_with_float_states",
+        wraps=sensor_recorder._entities_with_float_states,
+    ) as read_states:
+        from_db = await recorder_mock.async_add_executor_job(
+            _compile_sensor_statistics, hass, period
+        )
+    assert len(read_states.call_args.args[2]) == 7
+
+    assert (
+        incremental.keys()
+        == from_db.keys()
+        == {
+            "sensor.energy",
+            "sensor.flapping",
+            "sensor.power",
+            "sensor.static",
+            "sensor.temperature",
+            "sensor.wind",
+        }
+    )
+    assert incremental == {
+        entity_id: {
+            key: pytest.approx(value) if isinstance(value, float) else value
+            for key, value in stat.items()
+        }
+        for entity_id, stat in from_db.items()
+    }
+    assert incremental["sensor.temperature"]["mean"] == pytest.approx(
+        (10 * 30 + 20 * 150 + 30 * 120) / 300
+    )
+    assert incremental["sensor.energy"]["sum"] == pytest.approx(18)
+
+
+@pytest.mark.parametrize("recorder_config", [{"incremental_statistics": True}])
+async def test_compile_statistics_incremental_event_session_reset(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test statistics are read from the database after lost events."""
+    zero = get_start_time(dt_util.utcnow())
+    period = zero + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero) as freezer:
+        hass.states.async_set("sensor.test1", "10", TEMPERATURE_SENSOR_ATTRIBUTES)
+        freezer.move_to(period + timedelta(minutes=1))
+        hass.states.async_set("sensor.test1", "20", TEMPERATURE_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+    recorder_mock.event_session_resets += 1
+
+    with patch(
+        "homeassistant.components.sensor.recorder._entities_with_float_states",
+        wraps=sensor_recorder._entities_with_float_states,
+    ) as read_states:
+        stats = await recorder_mock.async_add_executor_job(
+            _compile_sensor_statistics, hass, period
+        )
+    assert read_states.call_count == 1
+    assert stats["sensor.test1"]["mean"] == pytest.approx(18)
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
@@ -402,6 +655,10 @@ async def test_compile_hourly_statistics_angle(
         ("temperature", "°F", "°F", "°F", "temperature", 27.796610169491526, -10, 60),
     ],
 )
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"vectorized_statistics": False}, {"vectorized_statistics": True}],
+)
 async def test_compile_hourly_statistics_with_some_same_last_updated(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -501,6 +758,10 @@ async def test_compile_hourly_statistics_with_some_same_last_updated(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"vectorized_statistics": False}, {"vectorized_statistics": True}],
+)
 async def test_compile_hourly_statistics_with_some_same_last_updated_angle(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -28,11 +28,16 @@ from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, template_profiler
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.template import Template
 from homeassistant.loader import Integration, async_get_integration
-from homeassistant.setup import async_set_domains_to_be_loaded, async_setup_component
+from homeassistant.setup import (
+    async_set_domains_to_be_loaded,
+    async_setup_component,
+    async_start_startup_trace,
+)
 from homeassistant.util.json import json_loads
 from homeassistant.util.yaml.loader import parse_yaml
 
@@ -1432,6 +1437,85 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_coalesced(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities batches changes over the coalesce window."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.gone", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"domains": {"light": True}}})
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "coalesce_ms": 10}
+    )
+
+    msg = await websocket_client.receive_json()
+    subscription = msg["id"]
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == subscription
+    assert set(msg["event"]["a"]) == {"light.permitted", "light.gone"}
+
+    hass.states.async_set("sensor.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    hass.states.async_set("light.permitted", "on", {"effect": "help"})
+    hass.states.async_set("light.new", "on")
+    hass.states.async_set("light.new", "off", {"color": "green"})
+    hass.states.async_remove("light.gone")
+    hass.states.async_set("light.temporary", "on")
+    hass.states.async_remove("light.temporary")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == subscription
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.new": {
+                "a": {"color": "green"},
+                "c": ANY,
+                "lc": ANY,
+                "s": "off",
+            }
+        },
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"effect": "help"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "s": "on",
+                },
+                "-": {"a": ["color"]},
+            }
+        },
+        "r": ["light.gone"],
+    }
+
+    hass.states.async_set("light.permitted", "off", {"effect": "help"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+    hass.states.async_set("light.permitted", "on", {"effect": "help"})
+    await websocket_client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscription}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    # The pending change is dropped with the subscription
+    await asyncio.sleep(0.02)
+    await websocket_client.send_json_auto_id({"type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -1480,6 +1564,60 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_template_render_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the render statistics of templates are returned."""
+    await websocket_client.send_json_auto_id({"type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"running": False, "templates": []}
+
+    template_profiler.async_start(hass)
+    hass.states.async_set("sensor.test", "on")
+    this = hass.states.get("sensor.test")
+    for _ in range(3):
+        Template("{{ 1 + 1 }}", hass).async_render({"this": this})
+    Template("{{ 2 + 2 }}", hass).async_render()
+
+    await websocket_client.send_json_auto_id(
+        {"type": "template/render_stats", "limit": 1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["running"] is True
+    assert len(msg["result"]["templates"]) == 1
+    assert msg["result"]["templates"][0] == {
+        "template": ANY,
+        "count": ANY,
+        "total": ANY,
+        "mean": ANY,
+        "p99": ANY,
+        "owners": ANY,
+    }
+
+    await websocket_client.send_json_auto_id({"type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    stats = {stat["template"]: stat for stat in msg["result"]["templates"]}
+    assert stats["{{ 1 + 1 }}"]["count"] == 3
+    assert stats["{{ 1 + 1 }}"]["owners"] == ["sensor.test"]
+    assert stats["{{ 2 + 2 }}"]["count"] == 1
+    assert stats["{{ 2 + 2 }}"]["owners"] == []
+
+
+async def test_template_render_stats_requires_admin(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the render statistics of templates require an admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json_auto_id({"type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2690,6 +2828,29 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_startup_trace(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test getting the startup trace."""
+    await websocket_client.send_json_auto_id({"type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    tracer = async_start_startup_trace(hass)
+    with tracer.span("setup august", "setup", "august"):
+        pass
+    await websocket_client.send_json_auto_id({"type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["displayTimeUnit"] == "ms"
+    assert [
+        event["name"] for event in msg["result"]["traceEvents"] if event["ph"] == "X"
+    ] == ["setup august"]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
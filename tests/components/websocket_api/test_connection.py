@@ -2,7 +2,7 @@
 
 import logging
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from aiohttp.test_utils import make_mocked_request
 import pytest
@@ -132,3 +132,24 @@ async def test_binary_handler_registration() -> None:
     # Verify we reuse an unsubscribed prefix
     prefix, unsub = connection.async_register_binary_handler(None)
     assert prefix == 15
+
+
+async def test_wait_for_pending_messages() -> None:
+    """Test waiting for the pending messages to be sent."""
+    connection = websocket_api.ActiveConnection(
+        None, Mock(data={websocket_api.DOMAIN: None}), None, None, Mock()
+    )
+    # Returns right away when the pending messages are not tracked
+    await connection.async_wait_for_pending_messages(2)
+
+    wait_for_pending_messages = AsyncMock()
+    connection = websocket_api.ActiveConnection(
+        None,
+        Mock(data={websocket_api.DOMAIN: None}),
+        None,
+        None,
+        Mock(),
+        wait_for_pending_messages=wait_for_pending_messages,
+    )
+    await connection.async_wait_for_pending_messages(2)
+    wait_for_pending_messages.assert_awaited_once_with(2)
@@ -346,6 +346,42 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_wait_for_pending_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test waiting until the pending messages were sent to the client."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    for idx in range(3):
+        instance._send_message({"id": idx})
+    assert len(instance._message_queue) == 3
+
+    await instance._async_wait_for_pending_messages(0)
+    assert len(instance._message_queue) == 0
+    assert not instance._drain_waiters
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+
+    # The wait ends when the writer is done
+    instance._message_queue.append(b"{}")
+    instance._writer_task.cancel()
+    await instance._async_wait_for_pending_messages(0)
+    assert len(instance._message_queue) == 1
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -0,0 +1,89 @@
+"""Test the websocket state_changed subscription hub."""
+
+from homeassistant.components.websocket_api.subscriptions import (
+    async_get_state_changed_hub,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, callback
+
+from tests.common import MockUser
+
+
+async def test_state_changed_hub(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test the hub forwards changes to the interested subscriptions."""
+    hub = async_get_state_changed_hub(hass)
+    assert async_get_state_changed_hub(hass) is hub
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    received: dict[str, list[str]] = {"all": [], "specific": [], "filtered": []}
+
+    def _forward(name: str):
+        @callback
+        def _async_forward(event) -> None:
+            received[name].append(event.data["entity_id"])
+
+        return _async_forward
+
+    unsub_all = hub.async_subscribe(_forward("all"), hass_admin_user)
+    unsub_specific = hub.async_subscribe(
+        _forward("specific"), hass_admin_user, {"light.kitchen", "light.hallway"}
+    )
+    unsub_filtered = hub.async_subscribe(
+        _forward("filtered"),
+        hass_admin_user,
+        entity_filter=lambda entity_id: entity_id.startswith("switch."),
+    )
+    # A single listener serves all subscriptions
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.fan", "on")
+    hass.states.async_set("light.bedroom", "on")
+    assert received == {
+        "all": ["light.kitchen", "switch.fan", "light.bedroom"],
+        "specific": ["light.kitchen"],
+        "filtered": ["switch.fan"],
+    }
+
+    # Permission changes are picked up for existing subscriptions
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.hallway": True}}})
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hallway", "on")
+    assert received["all"][3:] == ["light.hallway"]
+    assert received["specific"][1:] == ["light.hallway"]
+
+    unsub_specific()
+    unsub_filtered()
+    hass.states.async_set("light.hallway", "off")
+    assert received["specific"] == ["light.kitchen", "light.hallway"]
+    assert received["all"][4:] == ["light.hallway"]
+
+    unsub_all()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_state_changed_hub_unsubscribe_while_dispatching(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test a subscription can be removed while an event is dispatched."""
+    hub = async_get_state_changed_hub(hass)
+    received: list[str] = []
+
+    @callback
+    def _async_forward_once(event) -> None:
+        received.append("once")
+        unsub_once()
+
+    @callback
+    def _async_forward(event) -> None:
+        received.append("always")
+
+    unsub_once = hub.async_subscribe(_async_forward_once, hass_admin_user)
+    unsub = hub.async_subscribe(_async_forward, hass_admin_user)
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    assert received == ["once", "always", "always"]
+    unsub()
@@ -0,0 +1,216 @@
+"""Test the boot snapshot."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant import loader, requirements
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import boot_snapshot
+from homeassistant.helpers.boot_snapshot import (
+    DATA_BOOT_SNAPSHOT,
+    STORAGE_KEY,
+    BootSnapshot,
+)
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
+
+DOMAINS = ["history", "logbook", "sensor"]
+
+
+async def _async_cold_start(hass: HomeAssistant) -> dict[str, set[str]]:
+    """Resolve the integrations without the snapshot and save it."""
+    await boot_snapshot.async_setup(hass)
+    snapshot = hass.data[DATA_BOOT_SNAPSHOT]
+    integrations = await loader.async_get_integrations(hass, DOMAINS)
+    processed = {
+        domain: itg
+        for domain, itg in integrations.items()
+        if isinstance(itg, loader.Integration)
+    }
+    assert processed.keys() == set(DOMAINS)
+    await loader.resolve_integrations_dependencies(hass, processed.values())
+    assert snapshot.async_get_after_dependencies("preload", processed) is None
+    after_dependencies = await loader.resolve_integrations_after_dependencies(
+        hass, processed.values(), ignore_exceptions=True
+    )
+    snapshot.async_set_after_dependencies("preload", processed, after_dependencies)
+    requirements.async_get_installed_requirements(hass).add("fake-package==1.0")
+    assert snapshot.async_set_resolve_time(1.5) is None
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    return after_dependencies
+
+
+def _restart(hass: HomeAssistant) -> None:
+    """Drop the integrations and requirements resolved at the last start."""
+    loader.async_setup(hass)
+    hass.data.pop(requirements.DATA_REQUIREMENTS_MANAGER)
+    hass.data.pop(DATA_BOOT_SNAPSHOT)
+
+
+async def test_warm_start_uses_snapshot(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test a warm start does not read manifests or resolve dependencies."""
+    after_dependencies = await _async_cold_start(hass)
+    assert STORAGE_KEY in hass_storage
+    _restart(hass)
+
+    with patch.object(
+        loader.Integration, "resolve_from_root", side_effect=AssertionError
+    ):
+        await boot_snapshot.async_setup(hass)
+        snapshot = hass.data[DATA_BOOT_SNAPSHOT]
+        integrations = await loader.async_get_integrations(hass, DOMAINS)
+        processed = {
+            domain: itg
+            for domain, itg in integrations.items()
+            if isinstance(itg, loader.Integration)
+        }
+        assert all(itg.all_dependencies_resolved for itg in processed.values())
+        dependencies = await loader.resolve_integrations_dependencies(
+            hass, processed.values()
+        )
+        assert (
+            snapshot.async_get_after_dependencies("preload", processed)
+            == after_dependencies
+        )
+        # The time it took without the snapshot is reported
+        assert snapshot.async_set_resolve_time(0.1) == 1.5
+        # Every dependency is available without reading its manifest
+        for domain in set().union(*after_dependencies.values()):
+            loader.async_get_loaded_integration(hass, domain)
+
+    assert dependencies["history"] >= {"http", "recorder"}
+    assert snapshot.async_get_after_dependencies("preload", ["sensor"]) is None
+    recorder = loader.async_get_loaded_integration(hass, "recorder")
+    assert recorder.manifest == {
+        **json_loads((recorder.file_path / "manifest.json").read_text()),
+        "is_built_in": True,
+        "overwrites_built_in": False,
+    }
+    assert recorder.platforms_exists(["backup", "not_a_platform"]) == ["backup"]
+    assert "fake-package==1.0" in requirements.async_get_installed_requirements(hass)
+
+    # Nothing changed so the snapshot is not written again
+    with patch.object(Store, "async_save") as save_mock:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+    assert not save_mock.called
+
+
+async def test_changed_integration_resolved_again(hass: HomeAssistant) -> None:
+    """Test an integration that changed is read and its dependents resolved."""
+    after_dependencies = await _async_cold_start(hass)
+    _restart(hass)
+
+    file_key = boot_snapshot._file_key
+
+    def _changed_recorder(file_path: Path) -> tuple[int, int] | None:
+        if file_path.name == "recorder":
+            return (0, 0)
+        return file_key(file_path)
+
+    with (
+        patch.object(boot_snapshot, "_file_key", _changed_recorder),
+        patch.object(
+            loader.Integration,
+            "resolve_from_root",
+            wraps=loader.Integration.resolve_from_root,
+        ) as resolve_mock,
+    ):
+        await boot_snapshot.async_setup(hass)
+        snapshot = hass.data[DATA_BOOT_SNAPSHOT]
+        assert snapshot.async_get_after_dependencies("preload", DOMAINS) is None
+        integrations = await loader.async_get_integrations(hass, DOMAINS)
+        assert not integrations["history"].all_dependencies_resolved
+        assert integrations["sensor"].all_dependencies_resolved
+        assert (
+            await loader.resolve_integrations_after_dependencies(
+                hass, integrations.values(), ignore_exceptions=True
+            )
+            == after_dependencies
+        )
+
+    assert [call.args[2] for call in resolve_mock.mock_calls] == ["recorder"]
+
+
+async def test_mocked_manifest_not_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test resolutions of manifests that differ from the files are dropped."""
+    await boot_snapshot.async_setup(hass)
+    snapshot = hass.data[DATA_BOOT_SNAPSHOT]
+    history = await loader.async_get_integration(hass, "history")
+    await loader.resolve_integrations_dependencies(hass, [history])
+    history.manifest["dependencies"] = []
+    snapshot.async_set_after_dependencies("setup", ["history"], {"history": set()})
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    data = hass_storage[STORAGE_KEY]["data"]
+    assert "history" in data["integrations"]
+    assert "recorder" in data["dependencies"]
+    assert "history" not in data["dependencies"]
+    assert data["after_dependencies"] == {}
+
+
+async def test_snapshot_round_trip(hass: HomeAssistant) -> None:
+    """Test the snapshot is the same after it was stored as JSON."""
+    data = {
+        "integrations": {
+            "history": (
+                "/history",
+                (1, 2),
+                {"domain": "history", "dependencies": ["http"]},
+                {"__init__.py", "manifest.json"},
+            ),
+            "group": ("/group", (3, 4), {"domain": "group"}, None),
+        },
+        "dependencies": {"history": {"http", "recorder"}},
+        "after_dependencies": {"setup": ({"history"}, {"history": {"http"}})},
+        "requirements": ((("/site", 5),), {"fake-package==1.0"}),
+        "resolve_time": 0.5,
+    }
+    stored = json_loads(json_bytes(boot_snapshot._to_json(data)))
+    assert boot_snapshot._from_json(stored) == data
+
+
+@pytest.mark.parametrize(
+    "stored",
+    [
+        None,
+        {"key": {"ha_version": "0.0.0"}},
+        {},
+        [],
+        "not a snapshot",
+    ],
+)
+async def test_invalid_snapshot_discarded(hass: HomeAssistant, stored: Any) -> None:
+    """Test a missing snapshot or one of another version is discarded."""
+    snapshot = BootSnapshot(hass)
+    assert await hass.async_add_executor_job(snapshot.load, {}, stored) == {}
+    assert snapshot.resolve_time is None
+
+
+async def test_corrupt_snapshot_discarded(hass: HomeAssistant) -> None:
+    """Test a snapshot that can not be loaded is discarded."""
+    snapshot = BootSnapshot(hass)
+    with patch.object(Store, "async_load", side_effect=HomeAssistantError):
+        assert await snapshot.async_load({}) == {}
+    assert snapshot.resolve_time is None
+
+
+async def test_snapshot_with_invalid_data_discarded(hass: HomeAssistant) -> None:
+    """Test a snapshot of this version with invalid data is discarded."""
+    snapshot = BootSnapshot(hass)
+    await hass.async_add_executor_job(snapshot.load, {}, None)
+    stored = {"key": snapshot._key, "integrations": {}}
+    assert await hass.async_add_executor_job(snapshot.load, {}, stored) == {}
+    assert snapshot.resolve_time is None
@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_enable_timer_wheel,
     async_has_entity_registry_updated_listeners,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
@@ -54,6 +55,7 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.template import Template, result_as_boolean
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import get_scheduled_timer_handles
 
 from tests.common import async_fire_time_changed, async_fire_time_changed_exact
 
@@ -1960,6 +1962,188 @@ async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     assert "cover.office_skylight=open" in specific_runs[0]
 
 
+async def test_track_template_result_attribute_changes(hass: HomeAssistant) -> None:
+    """Test attribute changes only re-render templates that read attributes."""
+    specific_runs = []
+    template_complex = Template(
+        "{{ states('sensor.state') }} {{ state_attr('sensor.attr', 'unit') }}"
+        " {{ states.sensor.name.name }}",
+        hass,
+    )
+
+    @callback
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append(updates.pop().result)
+
+    hass.states.async_set("sensor.state", "1")
+    hass.states.async_set("sensor.attr", "1", {"unit": "W"})
+    hass.states.async_set("sensor.name", "1", {"friendly_name": "One"})
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_complex, None)], specific_run_callback
+    )
+    await hass.async_block_till_done()
+    assert info.listeners["entities"] == {"sensor.state", "sensor.attr", "sensor.name"}
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        wraps=Template.async_render_to_info,
+        autospec=True,
+    ) as render_mock:
+        hass.states.async_set("sensor.state", "1", {"any": "attr"})
+        await hass.async_block_till_done()
+        assert render_mock.call_count == 0
+
+        hass.states.async_set("sensor.attr", "1", {"unit": "kW"})
+        await hass.async_block_till_done()
+        hass.states.async_set("sensor.name", "1", {"friendly_name": "Two"})
+        await hass.async_block_till_done()
+        assert render_mock.call_count == 2
+
+        hass.states.async_set("sensor.state", "2", {"any": "attr"})
+        await hass.async_block_till_done()
+        assert render_mock.call_count == 3
+
+    assert specific_runs == ["1 kW One", "1 kW Two", "2 kW Two"]
+    info.async_remove()
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ expand('sensor.one') }}",
+        "{{ states.sensor.one.state }} {{ expand('sensor.one') }}",
+        "{{ states.sensor.one.state }} {{ states.sensor.one }}",
+    ],
+)
+async def test_track_template_result_attribute_changes_state_object(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test attribute changes re-render templates that output state objects."""
+    specific_runs = []
+
+    @callback
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append(updates.pop().result)
+
+    hass.states.async_set("sensor.one", "1", {"unit": "W"})
+    info = async_track_template_result(
+        hass, [TrackTemplate(Template(template_str, hass), None)], specific_run_callback
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 1
+    assert "kW" in specific_runs[0]
+    info.async_remove()
+
+
+@pytest.mark.parametrize(
+    ("refresh_window", "renders", "entity_id"),
+    [
+        # Every state change renders the templates it triggers
+        (None, 30, "sensor.one"),
+        # Each template is rendered once for the last state change
+        (0, 2, "sensor.two"),
+    ],
+)
+async def test_track_template_result_burst(
+    hass: HomeAssistant,
+    refresh_window: float | None,
+    renders: int,
+    entity_id: str,
+) -> None:
+    """Test a burst of state changes only renders once with a refresh window."""
+    specific_runs = []
+    template_sum = Template(
+        "{{ states('sensor.one') | int(0) + states('sensor.two') | int(0) }}", hass
+    )
+    template_one = Template("{{ states('sensor.one') }}", hass)
+
+    @callback
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append(
+            (event.data["entity_id"], [update.result for update in updates])
+        )
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_sum, None), TrackTemplate(template_one, None)],
+        specific_run_callback,
+        refresh_window=refresh_window,
+    )
+    await hass.async_block_till_done()
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        wraps=Template.async_render_to_info,
+        autospec=True,
+    ) as render_mock:
+        for value in range(1, 11):
+            hass.states.async_set("sensor.one", str(value))
+            hass.states.async_set("sensor.two", str(value))
+        await hass.async_block_till_done()
+        assert render_mock.call_count == renders
+
+    assert specific_runs == [(entity_id, [20, 10])]
+    info.async_remove()
+
+
+async def test_track_template_result_refresh_window(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test templates are rendered once when the refresh window ends."""
+    specific_runs = []
+    template_one = Template("{{ states('sensor.one') }}", hass)
+
+    @callback
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append([update.result for update in updates])
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_one, None)],
+        specific_run_callback,
+        refresh_window=1,
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.one", "2")
+    await hass.async_block_till_done()
+    assert specific_runs == []
+
+    freezer.tick(1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert specific_runs == [[2]]
+
+    # A refresh that is pending when the tracker is removed is cancelled
+    hass.states.async_set("sensor.one", "3")
+    await hass.async_block_till_done()
+    info.async_remove()
+    freezer.tick(1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert specific_runs == [[2]]
+
+
 async def test_track_template_result_with_group(hass: HomeAssistant) -> None:
     """Test tracking template with a group."""
     hass.states.async_set("sensor.power_1", 0)
@@ -3613,6 +3797,39 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
 
+async def test_timer_wheel(hass: HomeAssistant) -> None:
+    """Test the timers are only scheduled on the timer wheel once enabled."""
+    calls = []
+
+    @callback
+    def _action(now: datetime) -> None:
+        calls.append(now)
+
+    scheduled = len(hass.loop._scheduled)
+    unsub = async_call_later(hass, 5, _action)
+    assert len(hass.loop._scheduled) == scheduled + 1
+    unsub()
+
+    async_enable_timer_wheel(hass)
+    unsubs = [
+        async_call_later(hass, 5, _action),
+        async_track_time_interval(hass, _action, timedelta(seconds=10)),
+        async_track_point_in_utc_time(
+            hass, _action, dt_util.utcnow() + timedelta(seconds=20)
+        ),
+    ]
+    # The cancelled timer stays in the heap of the loop, and the wheel
+    # schedules a single loop timer for all of its timers
+    assert len(hass.loop._scheduled) <= scheduled + 2
+    assert len(get_scheduled_timer_handles(hass.loop)) >= scheduled + 3
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=21))
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    for unsub in unsubs:
+        unsub()
+
+
 async def test_track_sunrise(hass: HomeAssistant) -> None:
     """Test track the sunrise."""
     latitude = 32.87336
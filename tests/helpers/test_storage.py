@@ -4,8 +4,9 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import py
@@ -20,7 +21,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1046,6 +1047,35 @@ async def test_store_manager_caching(
         await hass.async_stop(force=True)
 
 
+async def test_store_manager_caching_journal(tmpdir: py.path.local) -> None:
+    """Test store manager only uses the cache of journaled stores without a journal."""
+    loop = asyncio.get_running_loop()
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        for key in ("integration1", "integration2"):
+            tmp_storage.join(key).write_binary(
+                json_bytes({"data": {key: key}, "version": 1})
+            )
+        tmp_storage.join(f"integration2{storage.JOURNAL_SUFFIX}").write_binary(b"")
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        await store_manager.async_preload(["integration1", "integration2"])
+        assert store_manager.async_fetch("integration2", journal=True) is None
+        assert store_manager.async_fetch("integration2") is not None
+        assert store_manager.async_fetch("integration1", journal=True) == (
+            True,
+            {"data": {"integration1": "integration1"}, "version": 1},
+        )
+        await hass.async_stop(force=True)
+
+
 async def test_store_manager_sub_dirs(tmpdir: py.path.local) -> None:
     """Test store manager ignores subdirs."""
     loop = asyncio.get_running_loop()
@@ -1180,3 +1210,318 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+def _journal_data(count: int, name: str = "light") -> dict[str, Any]:
+    """Return data with records that are journaled one by one."""
+    return {
+        "entities": [
+            {"id": f"id_{idx}", "entity_id": f"{name}.entity_{idx}"}
+            for idx in range(count)
+        ],
+        "deleted_entities": [],
+        "name": name,
+    }
+
+
+async def test_journal_appends_changes(tmp_path: Path) -> None:
+    """Test journal mode appends the changes and loads them back."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = _journal_data(100)
+        await store.async_save(data)
+        snapshot = await hass.async_add_executor_job(Path(store.path).read_bytes)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        assert not journal_path.exists()
+
+        changed = _journal_data(100)
+        removed = changed["entities"].pop(10)
+        changed["entities"][20]["entity_id"] = "light.renamed"
+        changed["entities"].append({"id": "id_new", "entity_id": "light.new"})
+        changed["deleted_entities"].append(removed)
+        changed["name"] = "changed"
+        await store.async_save(changed)
+        # Saving the same data again does not append a change
+        await store.async_save(changed)
+
+        assert (
+            await hass.async_add_executor_job(Path(store.path).read_bytes) == snapshot
+        )
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        assert journal.count(b"\n") == 1
+        assert len(journal) < len(snapshot) / 10
+        assert json.loads(journal) == {
+            "generation": json.loads(snapshot)[storage.JOURNAL_GENERATION],
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "values": {"name": "changed"},
+            "records": {
+                "entities": {
+                    "set": [
+                        {"id": "id_21", "entity_id": "light.renamed"},
+                        {"id": "id_new", "entity_id": "light.new"},
+                    ],
+                    "remove": ["id_10"],
+                },
+                "deleted_entities": {"set": [removed], "remove": []},
+            },
+        }
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == changed
+
+        # Records that are moved are journaled as a whole value
+        changed["entities"].reverse()
+        await store.async_save(changed)
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        change = json.loads(journal.splitlines()[-1])
+        assert change["values"] == {"entities": changed["entities"]}
+        assert change["records"] == {}
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == changed
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmp_path: Path) -> None:
+    """Test the journal is compacted when it grows larger than the snapshot."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = _journal_data(10)
+        await store.async_save(data)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+
+        for idx in range(100):
+            data["entities"][idx % 10]["entity_id"] = f"light.changed_{idx}"
+            await store.async_save(data)
+            snapshot_size = os.path.getsize(store.path)
+            if not journal_path.exists():
+                break
+            assert journal_path.stat().st_size <= snapshot_size
+        else:
+            pytest.fail("The journal was not compacted")
+
+        assert idx > 1
+        assert json.loads(Path(store.path).read_bytes())["data"] == data
+
+        # A new version is always written to the snapshot
+        store = storage.Store(hass, MOCK_VERSION_2, MOCK_KEY, journal=True)
+        await store.async_save(data)
+        data["name"] = "changed"
+        await store.async_save(data)
+        assert journal_path.exists()
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save(data)
+        assert not journal_path.exists()
+
+        await hass.async_stop(force=True)
+
+
+@pytest.mark.parametrize(
+    "tail",
+    [
+        b'{"version": 1, "minor_version": 1, "values": {"name": "lost"}',
+        b'{"version": 1, "minor_version": 1, "values": {"name": "lost"}, '
+        b'"records": {}}',
+        b"\0\0\0\0\n",
+        b'{"version": 1, "minor_version": 1, "values": {}, '
+        b'"records": {"name": {"set": [], "remove": []}}}\n',
+    ],
+)
+async def test_journal_incomplete_change_ignored(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, tail: bytes
+) -> None:
+    """Test a change that was not written completely is ignored."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = _journal_data(10)
+        await store.async_save(data)
+        data["name"] = "changed"
+        await store.async_save(data)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+
+        def _crash_while_appending() -> None:
+            with journal_path.open("ab") as journal:
+                journal.write(tail)
+
+        await hass.async_add_executor_job(_crash_while_appending)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == data
+        assert "journal" in caplog.text
+
+        # The next write compacts the journal so no change is
+        # appended after the incomplete one
+        data["name"] = "after crash"
+        await store.async_save(data)
+        assert not journal_path.exists()
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_ignored_after_interrupted_compaction(tmp_path: Path) -> None:
+    """Test a journal left behind by a compaction is not applied again."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = _journal_data(20)
+        await store.async_save(data)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        entities = data["entities"]
+        data["deleted_entities"].append(entities.pop(5))
+        await store.async_save(data)
+        entities.append(data["deleted_entities"].pop())
+        entities[0]["entity_id"] = "light.renamed"
+        await store.async_save(data)
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        assert journal.count(b"\n") == 2
+
+        # The snapshot was replaced but the journal was not removed
+        with patch.object(storage.os, "unlink"):
+            await hass.async_add_executor_job(
+                store._journal.compact, store.path, MOCK_KEY, False, False
+            )
+        assert await hass.async_add_executor_job(journal_path.read_bytes) == journal
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == data
+
+        # The next write compacts the journal that was left behind
+        data["name"] = "after crash"
+        await store.async_save(data)
+        assert not journal_path.exists()
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == data
+
+        # The journal of the old version is ignored
+        store = storage.Store(hass, MOCK_VERSION_2, MOCK_KEY, journal=True)
+        await store.async_save(data)
+        await hass.async_add_executor_job(journal_path.write_bytes, journal)
+        store = storage.Store(hass, MOCK_VERSION_2, MOCK_KEY, journal=True)
+        assert await store.async_load() == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_ignored_after_interrupted_write(tmp_path: Path) -> None:
+    """Test a journal left behind by writing the snapshot does not revert it."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = _journal_data(2)
+        await store.async_save(data)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        entities = data["entities"]
+        entities[0]["entity_id"] = "light.renamed"
+        entities.append({"id": "id_added", "entity_id": "light.added"})
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(journal_path.exists)
+
+        # The change is larger than the snapshot so the data is written
+        # to the snapshot, but the journal was not removed
+        entities[0]["entity_id"] = "light.renamed_again"
+        entities.pop()
+        entities.extend(_journal_data(20, "switch")["entities"][2:])
+        with patch.object(storage.os, "unlink"):
+            await store.async_save(data)
+        assert await hass.async_add_executor_job(journal_path.exists)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_failed_append(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the journal is compacted after an append failed."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = _journal_data(10)
+        await store.async_save(data)
+        data["name"] = "changed"
+        with patch.object(storage.os, "write", side_effect=OSError("disk full")):
+            await store.async_save(data)
+        assert "Error writing config for storage-test" in caplog.text
+
+        await store.async_save(data)
+        assert not Path(f"{store.path}{storage.JOURNAL_SUFFIX}").exists()
+        assert json.loads(Path(store.path).read_bytes())["data"] == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmp_path: Path) -> None:
+    """Test the journal is compacted into the snapshot when we quit."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = _journal_data(10)
+        await store.async_save(data)
+        data["name"] = "changed"
+        await store.async_save(data)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        assert journal_path.exists()
+
+        data["name"] = "pending"
+        store.async_delay_save(lambda: data, 10)
+        await hass.async_stop()
+
+        assert not journal_path.exists()
+        assert json.loads(Path(store.path).read_bytes()) == {
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "key": MOCK_KEY,
+            storage.JOURNAL_GENERATION: ANY,
+            "data": data,
+        }
+
+
+async def test_journal_remove(tmp_path: Path) -> None:
+    """Test removing a store removes its journal."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = _journal_data(10)
+        await store.async_save(data)
+        data["name"] = "changed"
+        await store.async_save(data)
+
+        await store.async_remove()
+        assert not Path(store.path).exists()
+        assert not Path(f"{store.path}{storage.JOURNAL_SUFFIX}").exists()
+        assert await store.async_load() is None
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_fragments(tmp_path: Path) -> None:
+    """Test records stored as fragments are journaled like registries save them."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        records = [
+            json_fragment(json_bytes({"id": f"id_{idx}", "name": f"entity {idx}"}))
+            for idx in range(10)
+        ]
+        await store.async_save({"entities": records, "tags": ["a", "b"]})
+        records[3] = json_fragment(json_bytes({"id": "id_3", "name": "renamed"}))
+        await store.async_save({"entities": records, "tags": ["a", "b", "c"]})
+
+        journal = await hass.async_add_executor_job(
+            Path(f"{store.path}{storage.JOURNAL_SUFFIX}").read_bytes
+        )
+        assert json.loads(journal) == {
+            "generation": ANY,
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "values": {"tags": ["a", "b", "c"]},
+            "records": {
+                "entities": {"set": [{"id": "id_3", "name": "renamed"}], "remove": []}
+            },
+        }
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = await store.async_load()
+        assert data["entities"][3] == {"id": "id_3", "name": "renamed"}
+        assert data["tags"] == ["a", "b", "c"]
+
+        await hass.async_stop(force=True)
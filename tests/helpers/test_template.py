@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime, timedelta
+import gc
 import json
 import logging
 import math
@@ -5347,6 +5348,29 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_shared(hass: HomeAssistant) -> None:
+    """Test templates with the same source share their compiled template."""
+    template_string = "{{ value | float(0) * 1000 }}"
+    variables = {"value": "1.5"}
+    tpl = template.Template(template_string, hass)
+    tpl2 = template.Template(template_string, hass)
+    assert tpl.async_render(variables) == tpl2.async_render(variables) == 1500
+    assert tpl._compiled is tpl2._compiled
+
+    limited = template.Template(template_string, hass)
+    assert limited.async_render(variables, limited=True) == 1500
+    assert limited._compiled is not tpl._compiled
+
+    custom_log = template.Template(template_string, hass)
+    assert custom_log.async_render(variables, log_fn=lambda level, msg: None) == 1500
+    assert custom_log._compiled is not tpl._compiled
+
+    env = tpl._env
+    del tpl, tpl2
+    gc.collect()
+    assert template_string not in env.compiled_cache
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
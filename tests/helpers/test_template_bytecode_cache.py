@@ -0,0 +1,115 @@
+"""Test the template bytecode cache."""
+
+import marshal
+from pathlib import Path
+from unittest.mock import patch
+
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+import pytest
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import template, template_bytecode_cache
+from homeassistant.helpers.template_bytecode_cache import (
+    DATA_TEMPLATE_BYTECODE_CACHE,
+    STORAGE_KEY,
+    TemplateBytecodeCache,
+)
+
+
+@pytest.fixture
+def cache_path(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Store the cache in a temporary config directory."""
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path / ".storage" / STORAGE_KEY
+
+
+def _reset_environments(hass: HomeAssistant) -> None:
+    """Drop the template environments and their in-memory compile cache."""
+    for key in (
+        template._ENVIRONMENT,
+        template._ENVIRONMENT_LIMITED,
+        template._ENVIRONMENT_STRICT,
+    ):
+        hass.data.pop(key, None)
+
+
+async def test_compiled_code_persisted(hass: HomeAssistant, cache_path: Path) -> None:
+    """Test compiled templates are loaded from disk after a restart."""
+    await template_bytecode_cache.async_setup(hass)
+    cache = hass.data[DATA_TEMPLATE_BYTECODE_CACHE]
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == 2
+    limited = template.Template("{{ 2 + 2 }}", hass)
+    assert limited.async_render(limited=True) == 4
+    assert len(cache) == 2
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert cache_path.exists()
+
+    _reset_environments(hass)
+    await template_bytecode_cache.async_setup(hass)
+    with patch.object(
+        ImmutableSandboxedEnvironment,
+        "compile",
+        wraps=ImmutableSandboxedEnvironment.compile,
+        autospec=True,
+    ) as compile_mock:
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+        assert template.Template("{{ 2 + 2 }}", hass).async_render(limited=True) == 4
+        assert not compile_mock.called
+        assert template.Template("{{ 3 + 3 }}", hass).async_render() == 6
+        assert compile_mock.call_count == 1
+
+
+async def test_unused_templates_pruned(hass: HomeAssistant, cache_path: Path) -> None:
+    """Test templates that were not used are dropped on shutdown."""
+    await template_bytecode_cache.async_setup(hass)
+    template.Template("{{ 1 + 1 }}", hass).ensure_valid()
+    template.Template("{{ 2 + 2 }}", hass).ensure_valid()
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    _reset_environments(hass)
+    await template_bytecode_cache.async_setup(hass)
+    template.Template("{{ 1 + 1 }}", hass).ensure_valid()
+    mtime = cache_path.stat().st_mtime_ns
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    # Nothing new was compiled
+    assert cache_path.stat().st_mtime_ns == mtime
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert len(marshal.loads(cache_path.read_bytes())[1]) == 1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"corrupt",
+        marshal.dumps(((0, "0.0.0", "0.0.0", b""), {})),
+        marshal.dumps({}),
+    ],
+)
+async def test_invalid_cache_discarded(tmp_path: Path, data: bytes) -> None:
+    """Test a corrupt cache or one of another version is discarded."""
+    path = tmp_path / STORAGE_KEY
+    cache = TemplateBytecodeCache(path)
+    code = compile("1", "<template>", "eval")
+    cache.set("{{ 1 }}", (False, False), code)
+    cache.save(False)
+    cache = TemplateBytecodeCache(path)
+    cache.load()
+    assert cache.get("{{ 1 }}", (False, False)) == code
+    # The environment flags are part of the key
+    assert cache.get("{{ 1 }}", (True, False)) is None
+
+    path.write_bytes(data)
+    cache = TemplateBytecodeCache(path)
+    cache.load()
+    assert cache.get("{{ 1 }}", (False, False)) is None
@@ -0,0 +1,65 @@
+"""Test the template render profiler."""
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import template_profiler
+from homeassistant.helpers.template import Template
+from homeassistant.helpers.template_profiler import (
+    DATA_TEMPLATE_PROFILER,
+    TemplateProfiler,
+)
+from homeassistant.helpers.trace import trace_id_set
+
+
+async def test_profile_renders(hass: HomeAssistant) -> None:
+    """Test renders are recorded with their owner while profiling."""
+    tpl = Template("{{ 1 + 1 }}", hass)
+    tpl.async_render()
+    assert DATA_TEMPLATE_PROFILER not in hass.data
+
+    profiler = template_profiler.async_start(hass)
+    assert template_profiler.async_start(hass) is profiler
+
+    hass.states.async_set("sensor.test", "on")
+    tpl.async_render({"this": hass.states.get("sensor.test")})
+    tpl.async_render_to_info()
+    trace_id_set(("automation.kitchen", "1"))
+    tpl.async_render()
+    trace_id_set(("script.kitchen", "2"))
+    with pytest.raises(TemplateError):
+        Template("{{ 1 / 0 }}", hass).async_render()
+
+    stats = {stat["template"]: stat for stat in profiler.async_top()}
+    assert stats.keys() == {"{{ 1 + 1 }}", "{{ 1 / 0 }}"}
+    assert stats["{{ 1 + 1 }}"]["count"] == 3
+    assert stats["{{ 1 + 1 }}"]["owners"] == ["automation.kitchen", "sensor.test"]
+    assert stats["{{ 1 + 1 }}"]["mean"] == stats["{{ 1 + 1 }}"]["total"] / 3
+    # Failed renders are recorded too
+    assert stats["{{ 1 / 0 }}"]["count"] == 1
+    assert stats["{{ 1 / 0 }}"]["owners"] == ["script.kitchen"]
+    assert len(profiler.async_top(1)) == 1
+
+    assert template_profiler.async_stop(hass) is profiler
+    assert template_profiler.async_stop(hass) is None
+    tpl.async_render()
+    assert {stat["template"]: stat["count"] for stat in profiler.async_top()} == {
+        "{{ 1 + 1 }}": 3,
+        "{{ 1 / 0 }}": 1,
+    }
+
+
+async def test_percentile() -> None:
+    """Test the p99 is calculated from the recent render durations."""
+    profiler = TemplateProfiler()
+    for duration in range(1, 101):
+        profiler.async_record("tpl", None, duration / 1000)
+    for _ in range(2000):
+        profiler.async_record("fast", None, 0.0001)
+    (tpl, fast) = profiler.async_top()
+    assert tpl["p99"] == 0.1
+    assert tpl["total"] == pytest.approx(sum(range(1, 101)) / 1000)
+    assert fast["p99"] == 0.0001
+    assert fast["count"] == 2000
+    assert len(profiler) == 2
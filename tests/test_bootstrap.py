@@ -10,26 +10,39 @@ import sys
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
-from homeassistant import bootstrap, config as config_util, core, loader, runner
+from homeassistant import (
+    bootstrap,
+    config as config_util,
+    core,
+    loader,
+    requirements,
+    runner,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     BASE_PLATFORMS,
     CONF_DEBUG,
+    EVENT_HOMEASSISTANT_STARTED,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import CoreState, HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import boot_snapshot
+from homeassistant.helpers.boot_snapshot import DATA_BOOT_SNAPSHOT
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+from homeassistant.setup import async_get_domain_setup_times, async_get_setup_timings
 
 from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_config_flow,
     mock_integration,
@@ -833,6 +846,42 @@ async def test_setup_hass_recovery_mode(
     assert len(browser_setup.mock_calls) == 0
 
 
+async def test_drop_state_caches_on_low_memory(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the state caches are dropped after startup and on low memory."""
+    hass.set_state(CoreState.not_running)
+    with (
+        patch.object(core.StateMachine, "async_drop_caches") as mock_drop_caches,
+        patch("homeassistant.bootstrap.ha_psutil.PsutilWrapper") as mock_psutil,
+    ):
+        virtual_memory = mock_psutil.return_value.psutil.virtual_memory
+        virtual_memory.return_value.available = (
+            bootstrap.COMPACT_STATES_MIN_AVAILABLE_MEMORY
+        )
+        bootstrap.async_drop_state_caches_on_low_memory(hass)
+        await hass.async_block_till_done()
+        assert mock_drop_caches.call_count == 0
+
+        hass.set_state(CoreState.running)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        assert mock_drop_caches.call_count == 1
+
+        freezer.tick(bootstrap.COMPACT_STATES_MEMORY_CHECK_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert virtual_memory.call_count == 1
+        assert mock_drop_caches.call_count == 1
+
+        virtual_memory.return_value.available -= 1
+        freezer.tick(bootstrap.COMPACT_STATES_MEMORY_CHECK_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert mock_drop_caches.call_count == 2
+        assert mock_psutil.call_count == 1
+
+
 @pytest.mark.usefixtures("mock_hass_config")
 async def test_setup_hass_safe_mode(
     mock_enable_logging: AsyncMock,
@@ -1040,6 +1089,83 @@ async def test_empty_integrations_list_is_only_sent_at_the_end_of_bootstrap(
     assert order == ["an_after_dep", "normal_integration"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+@patch("homeassistant.bootstrap.DEFAULT_INTEGRATIONS", set())
+async def test_resolve_integrations_with_boot_snapshot(hass: HomeAssistant) -> None:
+    """Test resolving the integrations is timed and kept in the boot snapshot."""
+    # setup times only tracked when not running
+    hass.set_state(CoreState.not_running)
+    await boot_snapshot.async_setup(hass)
+    snapshot = hass.data[DATA_BOOT_SNAPSHOT]
+    mock_integration(
+        hass,
+        MockModule(
+            domain="normal_integration",
+            partial_manifest={"after_dependencies": ["an_after_dep"]},
+        ),
+    )
+    mock_integration(hass, MockModule(domain="an_after_dep"))
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"normal_integration": {}, "an_after_dep": {}}
+    )
+    await hass.async_block_till_done()
+
+    assert "normal_integration" in hass.config.components
+    assert (
+        snapshot.async_get_after_dependencies(
+            "setup", ["normal_integration", "an_after_dep"]
+        )
+        is None
+    )
+    assert snapshot.resolve_time is not None
+    setup_timings = async_get_setup_timings(hass)
+    resolve_time = setup_timings[bootstrap.TIMING_RESOLVE_INTEGRATIONS]
+    assert 0 < resolve_time <= snapshot.resolve_time
+    # The snapshot was not used
+    assert bootstrap.TIMING_RESOLVE_INTEGRATIONS_WITHOUT_SNAPSHOT not in setup_timings
+    # The resolve time is not the setup time of an integration
+    assert async_get_domain_setup_times(hass, core.DOMAIN) == {}
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_preimport_integrations(hass: HomeAssistant) -> None:
+    """Test integrations are only preimported when their requirements are met."""
+    # setup times only tracked when not running
+    hass.set_state(CoreState.not_running)
+    hass.config.skip_pip = False
+    mock_integration(
+        hass, MockModule(domain="normal_integration", requirements=["package==1"])
+    )
+    mock_integration(hass, MockModule(domain="cloud"))
+    integrations = {
+        domain: loader.async_get_loaded_integration(hass, domain)
+        for domain in ("normal_integration", "cloud")
+    }
+
+    with (
+        patch("homeassistant.requirements.async_load_installed_versions"),
+        patch(
+            "homeassistant.loader.async_import_integrations",
+            return_value={"normal_integration": 0.5},
+        ) as import_mock,
+    ):
+        await bootstrap._async_preimport_integrations(hass, integrations, {})
+        assert not import_mock.called
+
+        requirements.async_get_installed_requirements(hass).add("package==1")
+        await bootstrap._async_preimport_integrations(hass, integrations, {})
+
+    assert import_mock.call_args[0][1] == {
+        "normal_integration": integrations["normal_integration"]
+    }
+    # The imports overlap the setups, so they are reported apart
+    assert async_get_domain_setup_times(hass, "normal_integration") == {}
+    setup_timings = async_get_setup_timings(hass)
+    assert setup_timings["import:normal_integration"] == 0.5
+    assert "normal_integration" not in setup_timings
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_warning_logged_on_wrap_up_timeout(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
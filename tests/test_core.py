@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import array
 import asyncio
+from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta
 import functools
 import gc
@@ -1181,6 +1182,103 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_match_data_listener(hass: HomeAssistant) -> None:
+    """Test listeners indexed on their event data."""
+    calls: dict[str, list[dict[str, Any]]] = {
+        "equal": [],
+        "present": [],
+        "both": [],
+        "filtered": [],
+        "match_all": [],
+    }
+
+    def _listener(name: str) -> Callable[[ha.Event], None]:
+        @ha.callback
+        def listener(event: ha.Event) -> None:
+            """Mock listener."""
+            calls[name].append(dict(event.data))
+
+        return listener
+
+    @ha.callback
+    def mock_filter(event_data: Mapping[str, Any]) -> bool:
+        """Mock filter."""
+        return not event_data.get("filtered")
+
+    listeners = hass.bus.async_listeners().get("test", 0)
+    unsubs = [
+        hass.bus.async_listen(
+            "test", _listener("equal"), match_data={"entity_id": "light.one"}
+        ),
+        hass.bus.async_listen(
+            "test", _listener("present"), match_data={"brightness": MATCH_ALL}
+        ),
+        hass.bus.async_listen(
+            "test",
+            _listener("both"),
+            match_data={"brightness": MATCH_ALL, "entity_id": "light.two"},
+        ),
+        hass.bus.async_listen(
+            "test",
+            _listener("filtered"),
+            event_filter=mock_filter,
+            match_data={"entity_id": "light.one"},
+        ),
+        hass.bus.async_listen(
+            MATCH_ALL, _listener("match_all"), match_data={"entity_id": "light.two"}
+        ),
+    ]
+    assert hass.bus.async_listeners()["test"] == listeners + 4
+
+    for event_data in (
+        {"entity_id": "light.one"},
+        {"entity_id": "light.one", "filtered": True},
+        {"entity_id": "light.two"},
+        {"entity_id": "light.two", "brightness": 1},
+        {"entity_id": ["light.one", "light.two"], "brightness": None},
+        {},
+    ):
+        hass.bus.async_fire("test", event_data)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert calls == {
+        "equal": [
+            {"entity_id": "light.one"},
+            {"entity_id": "light.one", "filtered": True},
+        ],
+        "present": [
+            {"entity_id": "light.two", "brightness": 1},
+            {"entity_id": ["light.one", "light.two"], "brightness": None},
+        ],
+        "both": [{"entity_id": "light.two", "brightness": 1}],
+        "filtered": [{"entity_id": "light.one"}],
+        "match_all": [
+            {"entity_id": "light.two"},
+            {"entity_id": "light.two", "brightness": 1},
+        ],
+    }
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get("test", 0) == listeners
+    hass.bus.async_fire("test", {"entity_id": "light.one", "brightness": 1})
+    await hass.async_block_till_done()
+    assert len(calls["equal"]) == 2
+    assert len(calls["present"]) == 2
+
+
+async def test_eventbus_match_data_not_hashable(hass: HomeAssistant) -> None:
+    """Test match_data values must be hashable."""
+    with pytest.raises(
+        HomeAssistantError, match="Value \\['light.one'\\] of key entity_id"
+    ):
+        hass.bus.async_listen(
+            "test", lambda event: None, match_data={"entity_id": ["light.one"]}
+        )
+    assert "test" not in hass.bus.async_listeners()
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1605,6 +1703,89 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_interns_attributes(hass: HomeAssistant) -> None:
+    """Test equal attributes are shared between states."""
+    attrs = {"unit_of_measurement": "W", "options": ("a", "b")}
+
+    hass.states.async_set("sensor.one", "1", attrs)
+    hass.states.async_set("sensor.two", "1", dict(attrs))
+    hass.states.async_set("sensor.three", "1", {**attrs, "options": ("a", "c")})
+    state_one = hass.states.get("sensor.one")
+    state_two = hass.states.get("sensor.two")
+    state_three = hass.states.get("sensor.three")
+    assert state_one.attributes is state_two.attributes
+    assert state_one.attributes is not state_three.attributes
+    assert state_three.attributes == {**attrs, "options": ("a", "c")}
+    assert isinstance(state_one.attributes, ReadOnlyDict)
+
+    # Returning to previous attributes reuses the shared object
+    hass.states.async_set("sensor.four", "1", {"unit_of_measurement": "W"})
+    state_four = hass.states.get("sensor.four")
+    hass.states.async_set("sensor.four", "2", {"unit_of_measurement": "kW"})
+    hass.states.async_set("sensor.four", "3", {"unit_of_measurement": "W"})
+    assert hass.states.get("sensor.four").attributes is state_four.attributes
+
+    # Equal values of different types are not shared
+    for idx, value in enumerate((1, True, 1.0, (1,), (True,), 0.0, -0.0)):
+        hass.states.async_set(f"sensor.typed_{idx}", "1", {"value": value})
+        attributes = hass.states.get(f"sensor.typed_{idx}").attributes
+        assert type(attributes["value"]) is type(value)
+        assert attributes["value"] == value
+    assert str(hass.states.get("sensor.typed_6").attributes["value"]) == "-0.0"
+    assert hass.states.get("sensor.typed_4").attributes["value"][0] is True
+
+    # Attributes with mutable values or other types are not shared
+    for value in ({1}, [1], {"nested": 1}, ("a", ["b"])):
+        hass.states.async_set("sensor.mutable_1", "1", {"value": value})
+        hass.states.async_set("sensor.mutable_2", "1", {"value": value})
+        assert (
+            hass.states.get("sensor.mutable_1").attributes
+            is not hass.states.get("sensor.mutable_2").attributes
+        )
+
+
+async def test_statemachine_compact_mode(hass: HomeAssistant) -> None:
+    """Test compact mode interns states and drops caches of old states."""
+    hass.states.async_enable_compact_mode()
+    attrs = {"unit_of_measurement": "W"}
+
+    # Build equal strings that are not the same object
+    hass.states.async_set("sensor.one", "".join(str(n) for n in (1, 2)), attrs)
+    hass.states.async_set("sensor.two", "".join(str(n) for n in (1, 2)), attrs)
+    state_one = hass.states.get("sensor.one")
+    state_two = hass.states.get("sensor.two")
+    assert state_one.state is state_two.state
+
+    assert state_one.as_compressed_state_json
+    assert state_one.as_dict_json
+    last_changed_timestamp = state_one.last_changed_timestamp
+    hass.states.async_set("sensor.one", "2", {"unit_of_measurement": "W"})
+    assert "as_compressed_state_json" not in state_one._cache
+    assert "as_dict_json" not in state_one._cache
+    assert state_one._cache["last_changed_timestamp"] == last_changed_timestamp
+    assert state_one.as_dict()["state"] == "12"
+
+    assert state_two.as_compressed_state_json
+    hass.states.async_drop_caches()
+    assert "as_compressed_state_json" not in state_two._cache
+
+
+async def test_statemachine_interned_attributes_released(
+    hass: HomeAssistant,
+) -> None:
+    """Test interning does not keep attributes alive."""
+    hass.states.async_set("sensor.one", "1", {"value": 1})
+    interned_attributes = hass.states._interned_attributes
+    assert len(interned_attributes) == 1
+
+    hass.states.async_set("sensor.one", "1", {"value": 2})
+    gc.collect()
+    assert len(interned_attributes) == 1
+    hass.states.async_remove("sensor.one")
+    gc.collect()
+    assert len(interned_attributes) == 0
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
@@ -1346,6 +1346,33 @@ async def test_async_get_component_preloads_config_and_config_flow(
     }
 
 
+async def test_async_get_component_lazy_platforms(hass: HomeAssistant) -> None:
+    """Verify lazy platform mode only preloads essential and registered platforms."""
+    loader.async_enable_lazy_platforms(hass)
+    loader.async_register_preload_platform(hass, "diagnostics")
+    loader.async_register_preload_platform(hass, "not_a_base_platform")
+    executor_import_integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+
+    with (
+        patch("homeassistant.loader.importlib.import_module") as mock_import,
+        patch.object(
+            executor_import_integration,
+            "platforms_exists",
+            side_effect=lambda platforms: platforms,
+        ),
+    ):
+        await executor_import_integration.async_get_component()
+
+    assert [call[0][0] for call in mock_import.call_args_list] == [
+        "homeassistant.components.executor_import",
+        "homeassistant.components.executor_import.config_flow",
+        "homeassistant.components.executor_import.diagnostics",
+        "homeassistant.components.executor_import.not_a_base_platform",
+    ]
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
@@ -1506,6 +1533,134 @@ async def test_async_get_component_deadlock_fallback(
     assert module is module_mock
 
 
+def _get_test_integration_with_dependencies(
+    hass: HomeAssistant, name: str, dependencies: list[str], import_executor: bool
+) -> loader.Integration:
+    """Return a generated test integration with dependencies."""
+    return loader.Integration(
+        hass,
+        f"homeassistant.components.{name}",
+        None,
+        {
+            "name": name,
+            "domain": name,
+            "dependencies": dependencies,
+            "requirements": [],
+            "import_executor": import_executor,
+        },
+    )
+
+
+async def test_async_import_integrations(hass: HomeAssistant) -> None:
+    """Test independent integrations are imported in parallel after their deps."""
+    integrations = {
+        "first": _get_test_integration_with_dependencies(hass, "first", [], True),
+        "second": _get_test_integration_with_dependencies(
+            hass, "second", ["first"], True
+        ),
+        "other": _get_test_integration_with_dependencies(hass, "other", [], True),
+        "event_loop": _get_test_integration_with_dependencies(
+            hass, "event_loop", [], False
+        ),
+    }
+    dependencies = {"second": {"first"}}
+    # first and other are only imported if they are imported at the same time
+    barrier = threading.Barrier(2, timeout=10)
+    imported: list[str] = []
+    threads: set[str] = set()
+
+    def mock_import(module: str, *args: Any, **kwargs: Any) -> Any:
+        domain = module.rpartition(".")[2]
+        if domain in ("first", "other"):
+            barrier.wait()
+        imported.append(domain)
+        threads.add(threading.current_thread().name)
+        return MagicMock(__file__="__init__.py")
+
+    with patch("homeassistant.loader.importlib.import_module", mock_import):
+        import_times = await loader.async_import_integrations(
+            hass, integrations, dependencies
+        )
+
+    assert sorted(imported[:2]) == ["first", "other"]
+    assert imported[2:] == ["second"]
+    assert len(threads) == 2
+    assert all(thread.startswith("ImportScheduler") for thread in threads)
+    assert import_times.keys() == {"first", "second", "other"}
+    assert "event_loop" not in hass.data[loader.DATA_COMPONENTS]
+
+    # Already imported integrations are not imported again
+    with patch("homeassistant.loader.importlib.import_module") as import_mock:
+        assert await loader.async_import_integrations(hass, integrations, {}) == {}
+    assert not import_mock.called
+
+
+async def test_async_import_integrations_failure_not_retried(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failed import of the scheduler is left to the setup."""
+    integrations = {
+        "executor_import": _get_test_integration_with_dependencies(
+            hass, "executor_import", ["cycle"], True
+        ),
+        "cycle": _get_test_integration_with_dependencies(
+            hass, "cycle", ["executor_import"], True
+        ),
+    }
+    module_mock = MagicMock(__file__="__init__.py")
+    import_attempts = 0
+
+    def mock_import(module: str, *args: Any, **kwargs: Any) -> Any:
+        nonlocal import_attempts
+        if module == "homeassistant.components.executor_import":
+            import_attempts += 1
+            if import_attempts == 1:
+                # _DeadlockError inherits from RuntimeError
+                raise RuntimeError(
+                    "Detected deadlock trying to import"
+                    " homeassistant.components.executor_import"
+                )
+        return module_mock
+
+    with patch("homeassistant.loader.importlib.import_module", mock_import):
+        import_times = await loader.async_import_integrations(
+            hass,
+            integrations,
+            {"executor_import": {"cycle"}, "cycle": {"executor_import"}},
+        )
+        assert "Failed to import executor_import ahead of its setup" in caplog.text
+        assert import_attempts == 1
+        assert import_times.keys() == {"cycle"}
+        assert "executor_import" not in hass.data[loader.DATA_COMPONENTS]
+
+        # The setup imports the component the usual way
+        assert (
+            await integrations["executor_import"].async_get_component() is module_mock
+        )
+    assert import_attempts == 2
+
+
+async def test_executor_imports_hold_package_lock(hass: HomeAssistant) -> None:
+    """Test executor imports of a package wait for its import lock."""
+    integration = _get_test_integration_with_dependencies(hass, "locked", [], True)
+    lock = loader._import_lock(integration.pkg_path)
+
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        return_value=MagicMock(__file__="__init__.py"),
+    ):
+        for import_job in (
+            integration.async_get_component(),
+            integration.async_get_platforms(["light"]),
+        ):
+            lock.acquire()
+            task = hass.async_create_task(import_job)
+            await asyncio.sleep(0.05)
+            assert not task.done()
+            lock.release()
+            await task
+
+
 async def test_async_get_component_deadlock_fallback_module_not_found(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -10,7 +10,11 @@ import voluptuous as vol
 
 from homeassistant import config_entries, loader, setup
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
+from homeassistant.const import (
+    EVENT_COMPONENT_LOADED,
+    EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
+)
 from homeassistant.core import (
     DOMAIN as HOMEASSISTANT_DOMAIN,
     CoreState,
@@ -1302,6 +1306,17 @@ async def test_async_get_setup_timings(hass: HomeAssistant) -> None:
         "sensor": 1,
         "filter": 2,
     }
+    # Startup steps that are not the setup of an integration are reported
+    # next to the integrations
+    setup.async_set_startup_timing(hass, "bootstrap:resolve_integrations", 0.5)
+    assert setup.async_get_setup_timings(hass) == {
+        "august": 6,
+        "notify": 2,
+        "legacy_notify_integration": 3,
+        "sensor": 1,
+        "filter": 2,
+        "bootstrap:resolve_integrations": 0.5,
+    }
     assert setup.async_get_domain_setup_times(hass, "filter") == {
         "123456": {
             setup.SetupPhases.PLATFORM_SETUP: 2,
@@ -1309,6 +1324,38 @@ async def test_async_get_setup_timings(hass: HomeAssistant) -> None:
     }
 
 
+async def test_async_start_startup_trace(hass: HomeAssistant) -> None:
+    """Test the startup trace records the setups and the waits for dependencies."""
+    assert setup.async_get_startup_trace(hass) is None
+    hass.set_state(CoreState.not_running)
+    tracer = setup.async_start_startup_trace(hass)
+    mock_integration(hass, MockModule("dep"))
+    mock_integration(hass, MockModule("comp", dependencies=["dep"]))
+
+    assert await setup.async_setup_component(hass, "comp", {})
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert not tracer.recording
+    assert "async_add_import_executor_job" not in vars(hass)
+
+    events = [
+        event
+        for event in setup.async_get_startup_trace(hass)["traceEvents"]
+        if event["ph"] == "X"
+    ]
+    names = {(event["name"], event["args"]["domain"]) for event in events}
+    assert {
+        ("setup comp", "comp"),
+        ("setup dep", "dep"),
+        (setup.SetupPhases.SETUP, "comp"),
+        (setup.SetupPhases.SETUP, "dep"),
+        ("wait dependencies", "comp"),
+    } <= names
+    wait = next(event for event in events if event["name"] == "wait dependencies")
+    assert wait["cat"] == "wait"
+    assert wait["args"]["waits_for"] == ["dep"]
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -0,0 +1,136 @@
+"""Test the startup tracer."""
+
+import asyncio
+from functools import partial
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import startup_trace
+from homeassistant.util.startup_trace import (
+    CATEGORY_BOOTSTRAP,
+    CATEGORY_EXECUTOR,
+    CATEGORY_SETUP,
+    CATEGORY_WAIT,
+    DATA_STARTUP_TRACER,
+    StartupTracer,
+    async_trace_executor_jobs,
+    trace_span,
+)
+
+
+def _events(tracer: StartupTracer) -> dict[str, dict]:
+    """Return the complete events of the trace by name."""
+    return {
+        event["name"]: event
+        for event in tracer.as_chrome_trace()["traceEvents"]
+        if event["ph"] == "X"
+    }
+
+
+async def test_spans_linked_to_parent(hass: HomeAssistant) -> None:
+    """Test spans are linked to the span of the task and the job submitting them."""
+    tracer = hass.data[DATA_STARTUP_TRACER] = StartupTracer()
+    remove_executor_tracing = async_trace_executor_jobs(hass, tracer)
+
+    def _read_file() -> None:
+        """Read a file."""
+
+    async def _setup() -> None:
+        with tracer.span("setup", CATEGORY_SETUP, "light", group="entry"):
+            await hass.async_add_executor_job(partial(_read_file))
+
+    with tracer.span("stage 1", CATEGORY_BOOTSTRAP):
+        await hass.async_create_task(_setup())
+    assert startup_trace.current_span.get() is None
+    tracer.stop()
+    remove_executor_tracing()
+    with trace_span(tracer, "after stop", CATEGORY_SETUP):
+        pass
+    assert len(tracer) == 3
+
+    trace = tracer.as_chrome_trace()
+    assert trace["displayTimeUnit"] == "ms"
+    tracks = {
+        event["tid"]: event["args"]["name"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    events = _events(tracer)
+    stage = events["stage 1"]
+    setup = events["setup"]
+    job = events[_read_file.__qualname__]
+    assert stage["args"]["parent"] is None
+    assert tracks[stage["tid"]] == CATEGORY_BOOTSTRAP
+    assert setup["args"] == {
+        "group": "entry",
+        "id": setup["args"]["id"],
+        "parent": stage["args"]["id"],
+        "domain": "light",
+        "critical_path": True,
+    }
+    assert tracks[setup["tid"]] == "light"
+    assert job["cat"] == CATEGORY_EXECUTOR
+    assert job["args"]["parent"] == setup["args"]["id"]
+    assert job["args"]["domain"] == "light"
+    assert tracks[job["tid"]] != "light"
+    assert stage["ts"] <= setup["ts"] <= job["ts"]
+    assert job["ts"] + job["dur"] <= stage["ts"] + stage["dur"]
+
+
+async def test_critical_path_follows_waits(hass: HomeAssistant) -> None:
+    """Test the critical path continues with the dependency that was waited for."""
+    tracer = StartupTracer()
+    http_setup_done = asyncio.Event()
+
+    async def _setup(domain: str, delay: float, *deps: str) -> None:
+        with tracer.span(f"setup {domain}", CATEGORY_SETUP, domain):
+            if deps:
+                with tracer.span("wait dependencies", CATEGORY_WAIT, waits_for=deps):
+                    await http_setup_done.wait()
+            await asyncio.sleep(delay)
+        if domain == "http":
+            http_setup_done.set()
+
+    with tracer.span("stage 2", CATEGORY_BOOTSTRAP):
+        await asyncio.gather(
+            hass.async_create_task(_setup("api", 0.01, "http")),
+            hass.async_create_task(_setup("http", 0.02)),
+            hass.async_create_task(_setup("light", 0.02)),
+        )
+
+    assert [(span.name, span.domain) for span in tracer.critical_path()] == [
+        ("stage 2", None),
+        ("setup api", "api"),
+        ("wait dependencies", "api"),
+        ("setup http", "http"),
+    ]
+    assert not _events(tracer)["setup light"]["args"]["critical_path"]
+
+
+async def test_recording_stops_at_max_spans(hass: HomeAssistant) -> None:
+    """Test recording stops when the trace has too many spans."""
+    tracer = StartupTracer()
+    with patch.object(startup_trace, "MAX_SPANS", 2):
+        for idx in range(3):
+            with tracer.span(f"span {idx}", CATEGORY_SETUP):
+                pass
+    assert not tracer.recording
+    assert len(tracer) == 2
+
+
+async def test_trace_executor_jobs_removed(hass: HomeAssistant) -> None:
+    """Test the executor jobs are no longer wrapped once the tracing is removed."""
+    add_executor_job = hass.async_add_executor_job
+    add_import_executor_job = hass.async_add_import_executor_job
+    tracer = StartupTracer()
+    remove_executor_tracing = async_trace_executor_jobs(hass, tracer)
+    assert hass.async_add_executor_job != add_executor_job
+    assert hass.async_add_import_executor_job != add_import_executor_job
+
+    remove_executor_tracing()
+    await hass.async_add_executor_job(len, "job")
+    await hass.async_add_import_executor_job(len, "job")
+    assert hass.async_add_executor_job == add_executor_job
+    assert hass.async_add_import_executor_job == add_import_executor_job
+    assert "async_add_import_executor_job" not in vars(hass)
+    assert len(tracer) == 0
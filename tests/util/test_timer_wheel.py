@@ -0,0 +1,97 @@
+"""Test the timer wheel."""
+
+import asyncio
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.async_ import get_scheduled_timer_handles
+from homeassistant.util.timer_wheel import TimerWheel, get_timer_wheel
+
+
+async def test_timers_run_in_order(hass: HomeAssistant) -> None:
+    """Test timers run in order of their time, then of scheduling."""
+    loop = hass.loop
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+    now = loop.time()
+    wheel.call_at(now + 0.03, calls.append, "c")
+    wheel.call_at(now + 0.01, calls.append, "a")
+    wheel.call_at(now + 0.02, calls.append, "b1")
+    wheel.call_at(now + 0.02, calls.append, "b2")
+    assert len(wheel) == 4
+
+    await asyncio.sleep(0.05)
+    assert calls == ["a", "b1", "b2", "c"]
+    assert len(wheel) == 0
+
+
+async def test_timer_not_run_early(hass: HomeAssistant) -> None:
+    """Test a timer does not run before its time."""
+    loop = hass.loop
+    wheel = TimerWheel(loop)
+    future: asyncio.Future[float] = loop.create_future()
+    when = loop.time() + 0.05
+    handle = wheel.call_at(when, lambda: future.set_result(loop.time()))
+    assert handle.when() == when
+
+    assert await future >= when - loop._clock_resolution
+    # Finished timers are marked cancelled
+    assert handle.cancelled()
+
+
+async def test_cancel_timer(hass: HomeAssistant) -> None:
+    """Test cancelled timers do not run and release the loop timer."""
+    loop = hass.loop
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+    now = loop.time()
+    handle = wheel.call_at(now + 0.01, calls.append, "cancelled")
+    handle2 = wheel.call_at(now + 10, calls.append, "later")
+    assert wheel._handle is not None
+
+    handle.cancel()
+    handle.cancel()
+    assert handle.cancelled()
+    assert len(wheel) == 1
+    await asyncio.sleep(0.02)
+    assert calls == []
+
+    handle2.cancel()
+    assert len(wheel) == 0
+    assert wheel._handle is None
+
+
+async def test_callbacks_schedule_and_cancel_timers(hass: HomeAssistant) -> None:
+    """Test callbacks can schedule and cancel timers while the wheel runs."""
+    loop = hass.loop
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+    now = loop.time()
+
+    def _first() -> None:
+        calls.append("first")
+        second.cancel()
+        wheel.call_at(loop.time(), calls.append, "scheduled")
+
+    wheel.call_at(now + 0.01, _first)
+    second = wheel.call_at(now + 0.01, calls.append, "second")
+    wheel.call_at(now + 0.01, calls.append, "third")
+
+    await asyncio.sleep(0.03)
+    assert calls == ["first", "third", "scheduled"]
+    assert len(wheel) == 0
+
+
+async def test_timers_listed_as_scheduled(hass: HomeAssistant) -> None:
+    """Test timers on the loop timer wheel are returned as scheduled handles."""
+    loop = hass.loop
+    wheel = get_timer_wheel(loop)
+    assert get_timer_wheel(loop) is wheel
+    handle = wheel.call_at(loop.time() + 5, lambda: None)
+    handle2 = wheel.call_at(loop.time() + 500, lambda: None)
+
+    handles = get_scheduled_timer_handles(loop)
+    assert handle in handles
+    assert handle2 in handles
+    handle.cancel()
+    handle2.cancel()
+    assert handle not in get_scheduled_timer_handles(loop)